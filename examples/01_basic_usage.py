@@ -5,72 +5,89 @@ This example demonstrates:
 - Creating a provider instance
 - Validating connection
 - Listing available models
-- Making a simple chat request
+- Making a simple chat request (streamed for OpenAI)
 - Tracking tokens and cost
 """
 
 import asyncio
-import os
-from ai_content_generator import OpenAIProvider, AnthropicProvider
+import time
+from ai_content_generator.providers import close_shared_providers, get_shared_provider
 
+from _harness import emit, require_key, run
 
-async def openai_example():
+
+_SEP = "=" * 60
+
+
+async def openai_example(out: list[str]) -> None:
     """Example using OpenAI provider."""
-    print("=" * 60)
-    print("OpenAI Provider Example")
-    print("=" * 60)
+    out.append(_SEP)
+    out.append("OpenAI Provider Example")
+    out.append(_SEP)
 
-    # Get API key from environment
-    api_key = os.getenv("OPENAI_API_KEY")
+    api_key = require_key("OPENAI_API_KEY", out, "Skipping OpenAI example.")
     if not api_key:
-        print("⚠️  OPENAI_API_KEY not set. Skipping OpenAI example.")
         return
 
-    # Create provider instance
-    provider = OpenAIProvider(api_key=api_key)
+    # Reuse the process-wide provider and its connection pool; main()
+    # closes it once every example has finished
+    provider = get_shared_provider("openai", api_key=api_key)
+    # Pay the TLS handshakes now rather than on the first request
+    await provider.prewarm()
 
-    # Validate connection
-    print("\n1. Validating connection...")
-    is_valid = await provider.validate_connection()
-    print(f"   Connection valid: {is_valid}")
+    out.append("\n1. Validating connection...")
+    is_valid = provider.is_connected or await provider.validate_connection()
+    out.append(f"   Connection valid: {is_valid}")
 
     if not is_valid:
-        print("   Failed to connect to OpenAI")
+        out.append("   Failed to connect to OpenAI")
         return
 
     # List available models
-    print("\n2. Available models:")
+    out.append("\n2. Available models:")
     models = await provider.list_models()
     for model in models[:3]:  # Show first 3 models
-        print(f"   - {model['name']}: ${model['input_price_per_1m']}/1M input tokens")
+        out.append(f"   - {model['name']}: ${model['input_price_per_1m']}/1M input tokens")
 
     # Get specific model info
-    print("\n3. Model details (gpt-4o-mini):")
+    out.append("\n3. Model details (gpt-4o-mini):")
     model_info = await provider.get_model_info("gpt-4o-mini")
-    print(f"   Context window: {model_info['context_window']:,} tokens")
-    print(f"   Input price: ${model_info['input_price_per_1m']}/1M tokens")
-    print(f"   Output price: ${model_info['output_price_per_1m']}/1M tokens")
+    out.append(f"   Context window: {model_info['context_window']:,} tokens")
+    out.append(f"   Input price: ${model_info['input_price_per_1m']}/1M tokens")
+    out.append(f"   Output price: ${model_info['output_price_per_1m']}/1M tokens")
 
     # Estimate cost
     prompt = "Write a short haiku about Python programming."
-    print(f"\n4. Cost estimation for prompt: '{prompt}'")
+    out.append(f"\n4. Cost estimation for prompt: '{prompt}'")
     estimate = await provider.estimate_cost(prompt, model="gpt-4o-mini", max_tokens=100)
-    print(f"   Input tokens: {estimate['input_tokens']}")
-    print(f"   Estimated cost: ${estimate['total_cost']:.6f}")
+    out.append(f"   Input tokens: {estimate['input_tokens']}")
+    out.append(f"   Estimated cost: ${estimate['total_cost']:.6f}")
 
-    # Make a chat request
-    print("\n5. Making chat request...")
+    # Stream a chat request
+    out.append("\n5. Streaming chat request...")
     messages = [
         {"role": "system", "content": "You are a helpful assistant."},
         {"role": "user", "content": prompt}
     ]
 
-    response = await provider.chat(messages, model="gpt-4o-mini", max_tokens=100)
-
-    print(f"\n   Response: {response['content']}")
-    print(f"\n   Tokens used:")
-    print(f"   - Input: {response['input_tokens']}")
-    print(f"   - Output: {response['output_tokens']}")
+    parts: list[str] = []
+    response = {"input_tokens": 0, "output_tokens": 0}
+    first_token_s = None
+    start = time.perf_counter()
+    async for chunk in provider.chat_stream(messages, model="gpt-4o-mini", max_tokens=100):
+        if chunk["content"]:
+            if first_token_s is None:
+                first_token_s = time.perf_counter() - start
+            parts.append(chunk["content"])
+        if "input_tokens" in chunk:
+            response = chunk
+
+    out.append(f"\n   Response: {''.join(parts)}")
+    if first_token_s is not None:
+        out.append(f"   Time to first token: {first_token_s:.2f}s")
+    out.append(f"\n   Tokens used:")
+    out.append(f"   - Input: {response['input_tokens']}")
+    out.append(f"   - Output: {response['output_tokens']}")
 
     # Calculate actual cost
     cost = provider.calculate_cost(
@@ -78,61 +95,59 @@ async def openai_example():
         response['output_tokens'],
         model="gpt-4o-mini"
     )
-    print(f"\n   Actual cost: ${cost:.6f}")
+    out.append(f"\n   Actual cost: ${cost:.6f}")
 
-    # Close the client
-    await provider.__aexit__(None, None, None)
-    print("\n✅ OpenAI example completed!")
+    out.append("\n✅ OpenAI example completed!")
 
 
-async def anthropic_example():
+async def anthropic_example(out: list[str]) -> None:
     """Example using Anthropic provider."""
-    print("\n" + "=" * 60)
-    print("Anthropic Provider Example")
-    print("=" * 60)
+    out.append("\n" + _SEP)
+    out.append("Anthropic Provider Example")
+    out.append(_SEP)
 
-    # Get API key from environment
-    api_key = os.getenv("ANTHROPIC_API_KEY")
+    api_key = require_key("ANTHROPIC_API_KEY", out, "Skipping Anthropic example.")
     if not api_key:
-        print("⚠️  ANTHROPIC_API_KEY not set. Skipping Anthropic example.")
         return
 
-    # Create provider instance
-    provider = AnthropicProvider(api_key=api_key)
+    # Reuse the process-wide provider and its connection pool; main()
+    # closes it once every example has finished
+    provider = get_shared_provider("anthropic", api_key=api_key)
+    # Pay the TLS handshakes now rather than on the first request
+    await provider.prewarm()
 
-    # Validate connection
-    print("\n1. Validating connection...")
-    is_valid = await provider.validate_connection()
-    print(f"   Connection valid: {is_valid}")
+    out.append("\n1. Validating connection...")
+    is_valid = provider.is_connected or await provider.validate_connection()
+    out.append(f"   Connection valid: {is_valid}")
 
     if not is_valid:
-        print("   Failed to connect to Anthropic")
+        out.append("   Failed to connect to Anthropic")
         return
 
     # List available models
-    print("\n2. Available models:")
+    out.append("\n2. Available models:")
     models = await provider.list_models()
     for model in models[:3]:  # Show first 3 models
-        print(f"   - {model['name']}: ${model['input_price_per_1m']}/1M input tokens")
+        out.append(f"   - {model['name']}: ${model['input_price_per_1m']}/1M input tokens")
 
     # Get specific model info
-    print("\n3. Model details (claude-3-haiku-20240307):")
+    out.append("\n3. Model details (claude-3-haiku-20240307):")
     model_info = await provider.get_model_info("claude-3-haiku-20240307")
-    print(f"   Context window: {model_info['context_window']:,} tokens")
-    print(f"   Input price: ${model_info['input_price_per_1m']}/1M tokens")
-    print(f"   Output price: ${model_info['output_price_per_1m']}/1M tokens")
+    out.append(f"   Context window: {model_info['context_window']:,} tokens")
+    out.append(f"   Input price: ${model_info['input_price_per_1m']}/1M tokens")
+    out.append(f"   Output price: ${model_info['output_price_per_1m']}/1M tokens")
 
     # Estimate cost
     prompt = "Write a short haiku about Python programming."
-    print(f"\n4. Cost estimation for prompt: '{prompt}'")
+    out.append(f"\n4. Cost estimation for prompt: '{prompt}'")
     estimate = await provider.estimate_cost(
         prompt, model="claude-3-haiku-20240307", max_tokens=100
     )
-    print(f"   Input tokens: {estimate['input_tokens']}")
-    print(f"   Estimated cost: ${estimate['total_cost']:.6f}")
+    out.append(f"   Input tokens: {estimate['input_tokens']}")
+    out.append(f"   Estimated cost: ${estimate['total_cost']:.6f}")
 
     # Make a chat request
-    print("\n5. Making chat request...")
+    out.append("\n5. Making chat request...")
     messages = [
         {"role": "user", "content": prompt}
     ]
@@ -141,10 +156,10 @@ async def anthropic_example():
         messages, model="claude-3-haiku-20240307", max_tokens=100
     )
 
-    print(f"\n   Response: {response['content']}")
-    print(f"\n   Tokens used:")
-    print(f"   - Input: {response['input_tokens']}")
-    print(f"   - Output: {response['output_tokens']}")
+    out.append(f"\n   Response: {response['content']}")
+    out.append(f"\n   Tokens used:")
+    out.append(f"   - Input: {response['input_tokens']}")
+    out.append(f"   - Output: {response['output_tokens']}")
 
     # Calculate actual cost
     cost = provider.calculate_cost(
@@ -152,28 +167,38 @@ async def anthropic_example():
         response['output_tokens'],
         model="claude-3-haiku-20240307"
     )
-    print(f"\n   Actual cost: ${cost:.6f}")
+    out.append(f"\n   Actual cost: ${cost:.6f}")
 
-    # Close the client
-    await provider.__aexit__(None, None, None)
-    print("\n✅ Anthropic example completed!")
+    out.append("\n✅ Anthropic example completed!")
 
 
 async def main():
     """Run all examples."""
     print("\n🚀 AI Content Generator - Basic Usage Examples\n")
 
-    # Run OpenAI example
-    await openai_example()
-
-    # Run Anthropic example
-    await anthropic_example()
-
-    print("\n" + "=" * 60)
+    # The two demos share no state, so run them concurrently. Each one
+    # buffers its output and the buffers are flushed in order afterwards,
+    # keeping the transcripts from interleaving.
+    outputs: list[list[str]] = [[], []]
+    try:
+        results = await asyncio.gather(
+            openai_example(outputs[0]),
+            anthropic_example(outputs[1]),
+            return_exceptions=True,
+        )
+    finally:
+        await close_shared_providers()
+
+    for lines, result in zip(outputs, results, strict=True):
+        emit(lines)
+        if isinstance(result, BaseException):
+            print(f"\n❌ Example failed: {result!r}")
+
+    print("\n" + _SEP)
     print("All examples completed!")
-    print("=" * 60)
+    print(_SEP)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 
@@ -9,20 +9,28 @@ This example demonstrates:
 """
 
 import asyncio
-import os
-from ai_content_generator import Config, SessionFactory
+import json
+from typing import Optional
 
+from ai_content_generator import BudgetExceededError, Config, SessionFactory
 
-async def session_example():
+from _harness import emit, require_key, run
+
+
+# Topics per single JSON-mode request before falling back to one request each
+BATCH_PROMPT_LIMIT = 20
+
+_SEP = "=" * 60
+
+
+async def session_example(out: list[str]) -> None:
     """Example using LLMSession with budget tracking."""
-    print("=" * 60)
-    print("Session with Budget Tracking Example")
-    print("=" * 60)
+    out.append(_SEP)
+    out.append("Session with Budget Tracking Example")
+    out.append(_SEP)
 
-    # Check for API keys
-    openai_key = os.getenv("OPENAI_API_KEY")
+    openai_key = require_key("OPENAI_API_KEY", out, "Please set it to run this example.")
     if not openai_key:
-        print("⚠️  OPENAI_API_KEY not set. Please set it to run this example.")
         return
 
     # Create configuration
@@ -41,76 +49,90 @@ async def session_example():
             "default_budget_usd": 0.10,  # $0.10 budget
             "dry_run": False,
             "alerts": [0.5, 0.8, 0.9]  # Alert at 50%, 80%, 90%
+        },
+        # Re-running the example answers repeated prompts from disk
+        "cache": {
+            "enabled": True,
+            "max_size": 100,
+            "ttl": 86400,
+            "path": ".llm_cache/session_example.json"
         }
     })
 
-    # Create session factory
-    factory = SessionFactory(config)
-
-    print("\n1. Available providers:")
-    providers = factory.list_available_providers()
-    print(f"   {', '.join(providers)}")
-
-    # Create session with budget
-    print("\n2. Creating session with $0.10 budget...")
-    async with factory.create_session(
-        provider="openai",
-        model="gpt-4o-mini",
-        budget_usd=0.10,
-        metadata={"purpose": "example", "user": "demo"}
-    ) as session:
-
-        print(f"   Session created: {session.session_id}")
-        print(f"   Budget: ${session.budget_usd:.2f}")
-        print(f"   Model: {session.model}")
-
-        # Make first request
-        print("\n3. Making first request...")
-        response1 = await session.chat(
-            "Write a one-sentence description of Python.",
-            max_tokens=50
-        )
-        print(f"   Response: {response1['content']}")
-        print(f"   Cost: ${session.cost_usd:.6f}")
-        print(f"   Budget remaining: ${session.budget_remaining:.6f}")
-
-        # Make second request
-        print("\n4. Making second request...")
-        response2 = await session.chat(
-            "What is async programming in one sentence?",
-            max_tokens=50
-        )
-        print(f"   Response: {response2['content']}")
-        print(f"   Cost: ${session.cost_usd:.6f}")
-        print(f"   Budget remaining: ${session.budget_remaining:.6f}")
-
-        # Show session statistics
-        print("\n5. Session statistics:")
-        print(f"   Total requests: {session.request_count}")
-        print(f"   Total tokens: {session.tokens_used}")
-        print(f"   Total cost: ${session.cost_usd:.6f}")
-        print(f"   Budget used: {(session.cost_usd / session.budget_usd * 100):.1f}%")
-
-        # Export session data
-        print("\n6. Exporting session data...")
-        session_data = session.export_to_dict()
-        print(f"   Session ID: {session_data['session_id']}")
-        print(f"   Duration: {session_data['duration_seconds']:.2f}s")
-        print(f"   Requests: {len(session_data['requests'])}")
-
-    print("\n✅ Session example completed!")
-
-
-async def batch_example():
+    # The factory caches one provider per configuration, so every session it
+    # creates shares the same pooled client; leaving the block closes it
+    async with SessionFactory(config) as factory:
+        out.append("\n1. Available providers:")
+        providers = factory.list_available_providers()
+        out.append(f"   {', '.join(providers)}")
+
+        # Open pooled connections before the first chat request
+        await factory.get_provider("openai").prewarm()
+
+        # Create session with budget
+        out.append("\n2. Creating session with $0.10 budget...")
+        async with factory.create_session(
+            provider="openai",
+            model="gpt-4o-mini",
+            budget_usd=0.10,
+            metadata={"purpose": "example", "user": "demo"}
+        ) as session:
+
+            out.append(f"   Session created: {session.session_id}")
+            out.append(f"   Budget: ${session.cost_tracker.budget_usd:.2f}")
+            out.append(f"   Model: {session.model}")
+
+            # Make first request
+            out.append("\n3. Making first request...")
+            response1 = await session.chat(
+                "Write a one-sentence description of Python.",
+                max_tokens=50,
+                temperature=0  # Deterministic requests are answered from the cache
+            )
+            out.append(f"   Response: {response1['content']}")
+            out.append(f"   Cached tokens: {response1.get('cached_input_tokens', 0)}")
+            out.append(f"   Effective cost: ${response1['cost_usd']:.6f}")
+            out.append(f"   Cost: ${session.cost_usd:.6f}")
+            out.append(f"   Budget remaining: ${session.budget_remaining:.6f}")
+
+            # Make second request
+            out.append("\n4. Making second request...")
+            response2 = await session.chat(
+                "What is async programming in one sentence?",
+                max_tokens=50,
+                temperature=0  # Deterministic requests are answered from the cache
+            )
+            out.append(f"   Response: {response2['content']}")
+            out.append(f"   Cached tokens: {response2.get('cached_input_tokens', 0)}")
+            out.append(f"   Effective cost: ${response2['cost_usd']:.6f}")
+            out.append(f"   Cost: ${session.cost_usd:.6f}")
+            out.append(f"   Budget remaining: ${session.budget_remaining:.6f}")
+
+            # Show session statistics
+            out.append("\n5. Session statistics:")
+            out.append(f"   Total requests: {session.request_count}")
+            out.append(f"   Total tokens: {session.tokens_used}")
+            out.append(f"   Total cost: ${session.cost_usd:.6f}")
+            out.append(f"   Budget used: {(session.cost_usd / session.cost_tracker.budget_usd * 100):.1f}%")
+
+            # Export session data
+            out.append("\n6. Exporting session data...")
+            session_data = session.export_to_dict()
+            out.append(f"   Session ID: {session_data['session_id']}")
+            out.append(f"   Duration: {session_data['duration_seconds']:.2f}s")
+            out.append(f"   Requests: {session_data['request_count']}")
+
+    out.append("\n✅ Session example completed!")
+
+
+async def batch_example(out: list[str]) -> None:
     """Example using batch generation."""
-    print("\n" + "=" * 60)
-    print("Batch Generation Example")
-    print("=" * 60)
+    out.append("\n" + _SEP)
+    out.append("Batch Generation Example")
+    out.append(_SEP)
 
-    # Check for API keys
-    openai_key = os.getenv("OPENAI_API_KEY")
+    openai_key = require_key("OPENAI_API_KEY", out, "Skipping batch example.")
     if not openai_key:
-        print("⚠️  OPENAI_API_KEY not set. Skipping batch example.")
         return
 
     # Create simple config
@@ -124,74 +146,137 @@ async def batch_example():
         "session": {
             "default_provider": "openai",
             "default_budget_usd": 0.50
+        },
+        "cache": {
+            "enabled": True,
+            "ttl": 86400,
+            "path": ".llm_cache/batch_example.json"
         }
     })
 
-    factory = SessionFactory(config)
-
-    # Create session
-    async with factory.create_session(budget_usd=0.50) as session:
-
-        # Define batch items
-        topics = [
-            "Python",
-            "JavaScript",
-            "Rust"
-        ]
-
-        print(f"\n1. Generating descriptions for {len(topics)} topics...")
-        print(f"   Budget: ${session.budget_usd:.2f}")
-
-        # Generate descriptions in batch
-        async def generate_description(topic: str) -> dict:
-            """Generate description for a topic."""
-            response = await session.chat(
-                f"Write a one-sentence description of {topic} programming language.",
-                max_tokens=50
-            )
-            return {
-                "topic": topic,
-                "description": response["content"]
-            }
-
-        # Use batch_generate
-        results = await session.batch_generate(
-            items=topics,
-            process_func=generate_description,
-            check_budget_per_item=True
-        )
-
-        # Display results
-        print("\n2. Results:")
-        for result in results:
-            print(f"\n   {result['topic']}:")
-            print(f"   {result['description']}")
-
-        # Show final statistics
-        print("\n3. Batch statistics:")
-        print(f"   Items processed: {len(results)}")
-        print(f"   Total cost: ${session.cost_usd:.6f}")
-        print(f"   Average cost per item: ${session.cost_usd / len(results):.6f}")
-        print(f"   Budget remaining: ${session.budget_remaining:.6f}")
-
-    print("\n✅ Batch example completed!")
+    async with SessionFactory(config) as factory:
+        await factory.get_provider("openai").prewarm()
+        async with factory.create_session(budget_usd=0.50) as session:
+
+            # Define batch items
+            topics = [
+                "Python",
+                "JavaScript",
+                "Rust"
+            ]
+
+            out.append(f"\n1. Generating descriptions for {len(topics)} topics...")
+            out.append(f"   Budget: ${session.cost_tracker.budget_usd:.2f}")
+
+            # Generate descriptions in batch
+            async def generate_description(topic: str) -> dict:
+                """Generate description for a topic."""
+                response = await session.chat(
+                    f"Write a one-sentence description of {topic} programming language.",
+                    max_tokens=50,
+                    temperature=0  # Deterministic requests are answered from the cache
+                )
+                return {
+                    "topic": topic,
+                    "description": response["content"]
+                }
+
+            async def generate_batch(batch: list[str]) -> list[dict]:
+                """Describe every topic with a single JSON-mode request."""
+                response = await session.chat(
+                    json.dumps(batch),
+                    system_message=(
+                        "For each programming language in the JSON array, write a "
+                        "one-sentence description. Respond with a JSON object of the "
+                        'form {"items": [{"topic": ..., "description": ...}]}, '
+                        "one item per input, in the same order."
+                    ),
+                    max_tokens=60 * len(batch),
+                    temperature=0,
+                    response_format={"type": "json_object"},
+                )
+                return json.loads(response["content"])["items"]
+
+            async def fan_out(batch: list[str]) -> list[dict]:
+                """Describe each topic with its own request, bounded by a semaphore."""
+                # Fan the topics out under a semaphore so at most `max_concurrency`
+                # requests are in flight. Once one request hits the budget limit the
+                # event is set and every topic still waiting for a slot is skipped.
+                max_concurrency = 5
+                semaphore = asyncio.Semaphore(max_concurrency)
+                budget_exhausted = asyncio.Event()
+
+                def has_budget() -> bool:
+                    remaining = session.budget_remaining
+                    return not budget_exhausted.is_set() and (remaining is None or remaining > 0)
+
+                async def run(topic: str) -> Optional[dict]:
+                    if not has_budget():
+                        return None
+                    async with semaphore:
+                        if not has_budget():
+                            return None
+                        try:
+                            return await generate_description(topic)
+                        except BudgetExceededError:
+                            budget_exhausted.set()
+                            return None
+
+                outcomes = await asyncio.gather(*(run(topic) for topic in batch))
+                return [result for result in outcomes if result is not None]
+
+            # Small batches fit in one request: one system prompt, one round trip
+            # and one unit of RPM quota instead of one per topic. Larger batches,
+            # or a reply that is not the JSON we asked for, fall back to fan-out.
+            results = None
+            if len(topics) <= BATCH_PROMPT_LIMIT:
+                try:
+                    results = await generate_batch(topics)
+                except (ValueError, KeyError, TypeError):
+                    results = None
+            if results is None:
+                results = await fan_out(topics)
+
+            # Display results
+            out.append("\n2. Results:")
+            for result in results:
+                out.append(f"\n   {result['topic']}:")
+                out.append(f"   {result['description']}")
+
+            # Show final statistics
+            out.append("\n3. Batch statistics:")
+            out.append(f"   Items processed: {len(results)}")
+            out.append(f"   Total cost: ${session.cost_usd:.6f}")
+            if results:
+                out.append(f"   Average cost per item: ${session.cost_usd / len(results):.6f}")
+            out.append(f"   Budget remaining: ${session.budget_remaining:.6f}")
+
+        out.append("\n✅ Batch example completed!")
 
 
 async def main():
     """Run all examples."""
     print("\n🚀 AI Content Generator - Session Usage Examples\n")
 
-    # Run session example
-    await session_example()
-
-    # Run batch example
-    await batch_example()
-
-    print("\n" + "=" * 60)
+    # Both examples use their own factory and budget, so run them
+    # concurrently and flush each buffered transcript in order afterwards
+    outputs: list[list[str]] = [[], []]
+    results = await asyncio.gather(
+        session_example(outputs[0]),
+        batch_example(outputs[1]),
+        return_exceptions=True,
+    )
+
+    for lines, result in zip(outputs, results, strict=True):
+        emit(lines)
+        if isinstance(result, BaseException):
+            print(f"\n❌ Example failed: {result!r}")
+
+    print("\n" + _SEP)
     print("All examples completed!")
-    print("=" * 60)
+    print(_SEP)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 
@@ -8,7 +8,6 @@ This example demonstrates:
 - Combining multiple addons
 """
 
-import asyncio
 import os
 from ai_content_generator.providers import OpenAIProvider
 from ai_content_generator.addons import (
@@ -20,12 +19,17 @@ from ai_content_generator.addons import (
 )
 from ai_content_generator.utils import generate_request_id
 
+from _harness import run
+
+
+_SEP = "=" * 60
+
 
 async def cache_example():
     """Example using cache addon."""
-    print("=" * 60)
+    print(_SEP)
     print("Cache Addon Example")
-    print("=" * 60)
+    print(_SEP)
     
     # Create cache addon
     cache = CacheAddon(max_size=10, ttl_seconds=3600)
@@ -37,7 +41,7 @@ async def cache_example():
     # Simulate requests
     prompt = "What is Python?"
     context = AddonContext(
-        request_id=generate_request_id(),
+        request_id=generate_request_id(fast=True),
         prompt=prompt,
         model="gpt-5-nano",
         provider="openai"
@@ -56,7 +60,7 @@ async def cache_example():
     # Second request - cache hit
     print("\n2. Second request (cache hit):")
     context2 = AddonContext(
-        request_id=generate_request_id(),
+        request_id=generate_request_id(fast=True),
         prompt=prompt,
         model="gpt-5-nano",
         provider="openai"
@@ -78,9 +82,9 @@ async def cache_example():
 
 async def retry_example():
     """Example using retry addon."""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Retry Addon Example")
-    print("=" * 60)
+    print(_SEP)
     
     # Create retry addon
     retry = RetryAddon(
@@ -97,7 +101,7 @@ async def retry_example():
     from ai_content_generator.core.exceptions import RateLimitError
     
     context = AddonContext(
-        request_id=generate_request_id(),
+        request_id=generate_request_id(fast=True),
         prompt="Test prompt",
         model="gpt-5-nano",
         provider="openai"
@@ -131,9 +135,9 @@ async def retry_example():
 
 async def dry_run_example():
     """Example using dry run addon."""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Dry Run Addon Example")
-    print("=" * 60)
+    print(_SEP)
     
     # Create dry run addon
     dry_run = DryRunAddon(
@@ -149,7 +153,7 @@ async def dry_run_example():
     # Simulate request
     prompt = "Write a blog post about AI."
     context = AddonContext(
-        request_id=generate_request_id(),
+        request_id=generate_request_id(fast=True),
         prompt=prompt,
         model="gpt-5-nano",
         provider="openai"
@@ -181,9 +185,9 @@ async def dry_run_example():
 
 async def combined_example():
     """Example combining multiple addons."""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Combined Addons Example")
-    print("=" * 60)
+    print(_SEP)
     
     # Create addons
     cache = CacheAddon(max_size=10, ttl_seconds=3600)
@@ -201,7 +205,7 @@ async def combined_example():
     # Simulate workflow
     prompt = "Explain machine learning."
     context = AddonContext(
-        request_id=generate_request_id(),
+        request_id=generate_request_id(fast=True),
         prompt=prompt,
         model="gpt-5-nano",
         provider="openai"
@@ -233,11 +237,11 @@ async def main():
     await dry_run_example()
     await combined_example()
     
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("All addon examples completed!")
-    print("=" * 60)
+    print(_SEP)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 
@@ -9,6 +9,11 @@ This example demonstrates:
 """
 
 import asyncio
+from collections.abc import Mapping
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Final
+
 from ai_content_generator.providers import (
     OpenAIProvider,
     AnthropicProvider,
@@ -18,11 +23,38 @@ from ai_content_generator.providers import (
 )
 
 
+_SEP = "=" * 60
+
+# Static recommendation table, built once at import
+_RECOMMENDATIONS: Final[Mapping[str, Mapping[str, str]]] = MappingProxyType({
+    "Budget-conscious": {
+        "model": "gpt-5-nano",
+        "reason": "Lowest cost per token, great for high-volume tasks"
+    },
+    "Balanced": {
+        "model": "gpt-5-mini",
+        "reason": "Good balance of cost and performance"
+    },
+    "High-quality": {
+        "model": "gpt-5",
+        "reason": "Best quality for complex tasks"
+    },
+    "Maximum capability": {
+        "model": "gpt-5-pro",
+        "reason": "Most powerful model for critical tasks"
+    },
+    "Long context": {
+        "model": "gpt-4.1",
+        "reason": "1M+ token context window"
+    },
+})
+
+
 def discover_models():
     """Discover available models across all providers."""
-    print("=" * 60)
+    print(_SEP)
     print("Model Discovery")
-    print("=" * 60)
+    print(_SEP)
     
     # List available providers
     print("\n1. Available providers:")
@@ -57,118 +89,85 @@ def discover_models():
                 print(f"       Output: ${model['output_price_per_1m']}/1M tokens")
 
 
-def compare_pricing():
+def compare_pricing(openai_models: list[dict]):
     """Compare pricing across models."""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Model Pricing Comparison")
-    print("=" * 60)
-    
-    # Get OpenAI models
-    openai_models = OpenAIProvider.get_available_models()
-    
-    # Filter models with pricing
-    priced_models = [
-        m for m in openai_models 
-        if 'input_price_per_1m' in m and 'output_price_per_1m' in m
-    ]
-    
-    # Sort by input price
-    priced_models.sort(key=lambda x: x['input_price_per_1m'])
+    print(_SEP)
+    
+    # Build the pricing table once as (name, input, output) rows sorted by
+    # input price; every section below reads from these plain tuples
+    pricing_table = sorted(
+        (
+            (m['name'], m['input_price_per_1m'], m['output_price_per_1m'])
+            for m in openai_models
+            if 'input_price_per_1m' in m and 'output_price_per_1m' in m
+        ),
+        key=itemgetter(1),
+    )
     
     print("\n1. OpenAI models sorted by input price (cheapest first):")
     print(f"\n   {'Model':<30} {'Input $/1M':<15} {'Output $/1M':<15}")
     print("   " + "-" * 60)
     
-    for model in priced_models[:10]:  # Show top 10
-        name = model['name']
-        input_price = model['input_price_per_1m']
-        output_price = model['output_price_per_1m']
+    for name, input_price, output_price in pricing_table[:10]:  # Show top 10
         print(f"   {name:<30} ${input_price:<14.2f} ${output_price:<14.2f}")
     
     # Find cheapest and most expensive
-    cheapest = priced_models[0]
-    most_expensive = priced_models[-1]
+    cheapest = pricing_table[0]
+    most_expensive = pricing_table[-1]
     
     print(f"\n2. Price range:")
-    print(f"   Cheapest: {cheapest['name']} (${cheapest['input_price_per_1m']}/1M input)")
-    print(f"   Most expensive: {most_expensive['name']} (${most_expensive['input_price_per_1m']}/1M input)")
+    print(f"   Cheapest: {cheapest[0]} (${cheapest[1]}/1M input)")
+    print(f"   Most expensive: {most_expensive[0]} (${most_expensive[1]}/1M input)")
     
     # Calculate cost for sample workload
     print(f"\n3. Cost for 1M input + 100K output tokens:")
-    for model in [cheapest, most_expensive]:
-        input_cost = model['input_price_per_1m'] * 1.0  # 1M tokens
-        output_cost = model['output_price_per_1m'] * 0.1  # 100K tokens
-        total = input_cost + output_cost
-        print(f"   {model['name']}: ${total:.4f}")
+    for name, input_price, output_price in (cheapest, most_expensive):
+        total = input_price * 1.0 + output_price * 0.1  # 1M input, 100K output tokens
+        print(f"   {name}: ${total:.4f}")
 
 
-def find_models_by_criteria():
+def find_models_by_criteria(openai_models: list[dict]):
     """Find models matching specific criteria."""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Finding Models by Criteria")
-    print("=" * 60)
-    
-    openai_models = OpenAIProvider.get_available_models()
+    print(_SEP)
+    
+    # Sort every model into its buckets in a single pass over the catalog
+    budget_models = []  # under $1/1M input tokens
+    large_context = []  # more than 200K tokens of context
+    gpt5_models = []  # GPT-5 family
+    for m in openai_models:
+        input_price = m.get('input_price_per_1m')
+        if input_price is not None and input_price < 1.0:
+            budget_models.append(m)
+        if m.get('context_window', 0) > 200000:
+            large_context.append(m)
+        if 'gpt-5' in m['name']:
+            gpt5_models.append(m)
     
-    # Find models under $1/1M input tokens
     print("\n1. Budget-friendly models (< $1.00/1M input):")
-    budget_models = [
-        m for m in openai_models
-        if 'input_price_per_1m' in m and m['input_price_per_1m'] < 1.0
-    ]
     for model in budget_models[:5]:
         print(f"   - {model['name']}: ${model['input_price_per_1m']}/1M")
     
-    # Find models with large context windows
     print("\n2. Large context models (> 200K tokens):")
-    large_context = [
-        m for m in openai_models
-        if 'context_window' in m and m['context_window'] > 200000
-    ]
     for model in large_context:
         print(f"   - {model['name']}: {model['context_window']:,} tokens")
     
-    # Find GPT-5 family models
     print("\n3. GPT-5 family models:")
-    gpt5_models = [
-        m for m in openai_models
-        if 'gpt-5' in m['name']
-    ]
     for model in gpt5_models:
         print(f"   - {model['name']}: {model['description']}")
 
 
 def model_recommendations():
     """Provide model recommendations for different use cases."""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("Model Recommendations")
-    print("=" * 60)
-    
-    recommendations = {
-        "Budget-conscious": {
-            "model": "gpt-5-nano",
-            "reason": "Lowest cost per token, great for high-volume tasks"
-        },
-        "Balanced": {
-            "model": "gpt-5-mini",
-            "reason": "Good balance of cost and performance"
-        },
-        "High-quality": {
-            "model": "gpt-5",
-            "reason": "Best quality for complex tasks"
-        },
-        "Maximum capability": {
-            "model": "gpt-5-pro",
-            "reason": "Most powerful model for critical tasks"
-        },
-        "Long context": {
-            "model": "gpt-4.1",
-            "reason": "1M+ token context window"
-        },
-    }
+    print(_SEP)
     
     print("\n")
-    for use_case, rec in recommendations.items():
+    for use_case, rec in _RECOMMENDATIONS.items():
         print(f"   {use_case}:")
         print(f"     Model: {rec['model']}")
         print(f"     Reason: {rec['reason']}")
@@ -179,14 +178,17 @@ def main():
     """Run all discovery examples."""
     print("\n🚀 AI Content Generator - Model Discovery\n")
     
+    # Fetch the catalog once and share it between the comparisons
+    openai_models = OpenAIProvider.get_available_models()
+    
     discover_models()
-    compare_pricing()
-    find_models_by_criteria()
+    compare_pricing(openai_models)
+    find_models_by_criteria(openai_models)
     model_recommendations()
     
-    print("=" * 60)
+    print(_SEP)
     print("Model discovery completed!")
-    print("=" * 60)
+    print(_SEP)
 
 
 if __name__ == "__main__":
@@ -8,7 +8,6 @@ This example demonstrates:
 - Using different configuration modes
 """
 
-import asyncio
 from ai_content_generator.addons import (
     WhitespaceMinimizerAddon,
     AddonManager,
@@ -16,12 +15,27 @@ from ai_content_generator.addons import (
 )
 from ai_content_generator.utils import generate_request_id
 
+from _harness import emit, run
+
+
+_SEP = "=" * 60
+
+# Prompts with varying whitespace for the statistics example
+_STATS_PROMPTS = (
+    "Normal prompt without extra whitespace",
+    "Prompt    with    many    spaces",
+    "Prompt\n\n\nwith\n\n\nmany\n\n\nnewlines",
+    "Prompt\twith\ttabs\tand    spaces",
+    "Another    prompt    with    spaces",
+)
+
 
 async def basic_minimization_example():
     """Example showing basic whitespace minimization."""
-    print("=" * 60)
-    print("Basic Whitespace Minimization Example")
-    print("=" * 60)
+    out: list[str] = []
+    out.append(_SEP)
+    out.append("Basic Whitespace Minimization Example")
+    out.append(_SEP)
     
     # Create minimizer addon
     minimizer = WhitespaceMinimizerAddon(
@@ -55,30 +69,33 @@ async def basic_minimization_example():
         provider="openai"
     )
     
-    print("\n1. Original prompt (first 100 chars):")
-    print(f"   {prompt[:100]}...")
-    print(f"   Length: {len(prompt)} characters")
+    out.append("\n1. Original prompt (first 100 chars):")
+    out.append(f"   {prompt[:100]}...")
+    out.append(f"   Length: {len(prompt)} characters")
     
     # Minimize the prompt
     minimized = await manager.execute_pre_request(prompt, context)
     
     if minimized:
-        print("\n2. Minimized prompt (first 100 chars):")
-        print(f"   {minimized[:100]}...")
-        print(f"   Length: {len(minimized)} characters")
-        print(f"   Characters saved: {context.custom.get('whitespace_minimizer_chars_saved', 0)}")
-        print(f"   Estimated tokens saved: {context.custom.get('whitespace_minimizer_tokens_saved', 0)}")
+        out.append("\n2. Minimized prompt (first 100 chars):")
+        out.append(f"   {minimized[:100]}...")
+        out.append(f"   Length: {len(minimized)} characters")
+        stats = context.custom["whitespace_stats"]
+        out.append(f"   Characters saved: {stats.chars_saved}")
+        out.append(f"   Estimated tokens saved: {stats.tokens_saved}")
     else:
-        print("\n2. No minimization needed (prompt was already optimal)")
+        out.append("\n2. No minimization needed (prompt was already optimal)")
     
-    print("\n✅ Basic minimization example completed!")
+    out.append("\n✅ Basic minimization example completed!")
+    emit(out)
 
 
 async def code_block_preservation_example():
     """Example showing code block preservation."""
-    print("\n" + "=" * 60)
-    print("Code Block Preservation Example")
-    print("=" * 60)
+    out: list[str] = []
+    out.append("\n" + _SEP)
+    out.append("Code Block Preservation Example")
+    out.append(_SEP)
     
     minimizer = WhitespaceMinimizerAddon(
         minimize_spaces=True,
@@ -109,28 +126,30 @@ async def code_block_preservation_example():
         provider="openai"
     )
     
-    print("\n1. Original prompt:")
-    print(prompt)
+    out.append("\n1. Original prompt:")
+    out.append(prompt)
     
     minimized = await manager.execute_pre_request(prompt, context)
     
     if minimized:
-        print("\n2. Minimized prompt:")
-        print(minimized)
-        print("\n3. Code block preserved:")
+        out.append("\n2. Minimized prompt:")
+        out.append(minimized)
+        out.append("\n3. Code block preserved:")
         if "```python" in minimized:
-            print("   ✓ Code block markers preserved")
+            out.append("   ✓ Code block markers preserved")
         if "    return" in minimized or "    if" in minimized:
-            print("   ✓ Indentation inside code block preserved")
+            out.append("   ✓ Indentation inside code block preserved")
     
-    print("\n✅ Code block preservation example completed!")
+    out.append("\n✅ Code block preservation example completed!")
+    emit(out)
 
 
 async def aggressive_mode_example():
     """Example showing aggressive minimization mode."""
-    print("\n" + "=" * 60)
-    print("Aggressive Mode Example")
-    print("=" * 60)
+    out: list[str] = []
+    out.append("\n" + _SEP)
+    out.append("Aggressive Mode Example")
+    out.append(_SEP)
     
     # Standard mode
     standard = WhitespaceMinimizerAddon(
@@ -161,8 +180,8 @@ async def aggressive_mode_example():
     Line    3
     """
     
-    print("\n1. Original prompt:")
-    print(repr(prompt))
+    out.append("\n1. Original prompt:")
+    out.append(repr(prompt))
     
     # Test standard mode
     context1 = AddonContext(
@@ -173,9 +192,9 @@ async def aggressive_mode_example():
     )
     standard_result = await standard.pre_request(prompt, context1)
     
-    print("\n2. Standard mode result:")
-    print(repr(standard_result))
-    print(f"   Length: {len(standard_result) if standard_result else len(prompt)}")
+    out.append("\n2. Standard mode result:")
+    out.append(repr(standard_result))
+    out.append(f"   Length: {len(standard_result) if standard_result else len(prompt)}")
     
     # Test aggressive mode
     context2 = AddonContext(
@@ -186,67 +205,52 @@ async def aggressive_mode_example():
     )
     aggressive_result = await aggressive.pre_request(prompt, context2)
     
-    print("\n3. Aggressive mode result:")
-    print(repr(aggressive_result))
-    print(f"   Length: {len(aggressive_result) if aggressive_result else len(prompt)}")
-    print(f"   Characters saved: {len(prompt) - len(aggressive_result) if aggressive_result else 0}")
+    out.append("\n3. Aggressive mode result:")
+    out.append(repr(aggressive_result))
+    out.append(f"   Length: {len(aggressive_result) if aggressive_result else len(prompt)}")
+    out.append(f"   Characters saved: {len(prompt) - len(aggressive_result) if aggressive_result else 0}")
     
-    print("\n✅ Aggressive mode example completed!")
+    out.append("\n✅ Aggressive mode example completed!")
+    emit(out)
 
 
 async def statistics_example():
     """Example showing statistics tracking."""
-    print("\n" + "=" * 60)
-    print("Statistics Tracking Example")
-    print("=" * 60)
+    out: list[str] = []
+    out.append("\n" + _SEP)
+    out.append("Statistics Tracking Example")
+    out.append(_SEP)
     
+    # The minimizer is the only transformation here, so call it directly
+    # instead of going through an addon manager
     minimizer = WhitespaceMinimizerAddon()
-    manager = AddonManager()
-    manager.add_addon(minimizer)
     
-    # Process multiple prompts with varying whitespace
-    prompts = [
-        "Normal prompt without extra whitespace",
-        "Prompt    with    many    spaces",
-        "Prompt\n\n\nwith\n\n\nmany\n\n\nnewlines",
-        "Prompt\twith\ttabs\tand    spaces",
-        "Another    prompt    with    spaces"
-    ]
-    
-    print("\n1. Processing multiple prompts...")
-    
-    for i, prompt in enumerate(prompts, 1):
-        context = AddonContext(
-            request_id=generate_request_id(),
-            prompt=prompt,
-            model="gpt-5-nano",
-            provider="openai"
-        )
-        
-        minimized = await manager.execute_pre_request(prompt, context)
-        
-        if minimized:
-            chars_saved = context.custom.get('whitespace_minimizer_chars_saved', 0)
-            tokens_saved = context.custom.get('whitespace_minimizer_tokens_saved', 0)
-            print(f"   Prompt {i}: Saved {chars_saved} chars, ~{tokens_saved} tokens")
+    out.append("\n1. Processing multiple prompts...")
+    
+    results = zip(_STATS_PROMPTS, minimizer.minimize_many(_STATS_PROMPTS), strict=True)
+    for i, (prompt, (minimized, chars_saved, tokens_saved)) in enumerate(results, 1):
+        if minimized is not prompt:
+            out.append(f"   Prompt {i}: Saved {chars_saved} chars, ~{tokens_saved} tokens")
     
     # Show cumulative statistics
-    print("\n2. Overall statistics:")
+    out.append("\n2. Overall statistics:")
     stats = minimizer.get_stats()
-    print(f"   Total requests processed: {stats['total_requests']}")
-    print(f"   Total characters removed: {stats['total_chars_removed']}")
-    print(f"   Total tokens saved (estimated): {stats['total_tokens_saved']}")
-    print(f"   Average chars per request: {stats['average_chars_per_request']:.2f}")
-    print(f"   Average tokens per request: {stats['average_tokens_per_request']:.2f}")
-    
-    print("\n✅ Statistics example completed!")
+    out.append(f"   Total requests processed: {stats['total_requests']}")
+    out.append(f"   Total characters removed: {stats['total_chars_removed']}")
+    out.append(f"   Total tokens saved (estimated): {stats['total_tokens_saved']}")
+    out.append(f"   Average chars per request: {stats['average_chars_per_request']:.2f}")
+    out.append(f"   Average tokens per request: {stats['average_tokens_per_request']:.2f}")
+    
+    out.append("\n✅ Statistics example completed!")
+    emit(out)
 
 
 async def combined_addons_example():
     """Example combining whitespace minimizer with other addons."""
-    print("\n" + "=" * 60)
-    print("Combined Addons Example")
-    print("=" * 60)
+    out: list[str] = []
+    out.append("\n" + _SEP)
+    out.append("Combined Addons Example")
+    out.append(_SEP)
     
     from ai_content_generator.addons import CacheAddon, DryRunAddon
     
@@ -261,9 +265,9 @@ async def combined_addons_example():
     manager.add_addon(cache)      # Second - cache minimized prompts
     manager.add_addon(dry_run)    # Third - intercept if enabled
     
-    print("\n1. Registered addons:")
+    out.append("\n1. Registered addons:")
     for addon in manager.get_addons():
-        print(f"   - {addon.get_name()}: {addon.get_description()}")
+        out.append(f"   - {addon.get_name()}: {addon.get_description()}")
     
     prompt = "This    prompt    has    many    spaces"
     
@@ -274,17 +278,19 @@ async def combined_addons_example():
         provider="openai"
     )
     
-    print("\n2. Processing request through addon pipeline:")
-    print(f"   Original prompt: {prompt}")
+    out.append("\n2. Processing request through addon pipeline:")
+    out.append(f"   Original prompt: {prompt}")
     
     # Pre-request hooks (minimization happens here)
     result = await manager.execute_pre_request(prompt, context)
     
     if result:
-        print(f"   Minimized prompt: {result}")
-        print(f"   Characters saved: {context.custom.get('whitespace_minimizer_chars_saved', 0)}")
+        out.append(f"   Minimized prompt: {result}")
+        stats = context.custom.get("whitespace_stats")
+        out.append(f"   Characters saved: {stats.chars_saved if stats else 0}")
     
-    print("\n✅ Combined addons example completed!")
+    out.append("\n✅ Combined addons example completed!")
+    emit(out)
 
 
 async def main():
@@ -297,11 +303,11 @@ async def main():
     await statistics_example()
     await combined_addons_example()
     
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("All whitespace minimizer examples completed!")
-    print("=" * 60)
+    print(_SEP)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
 
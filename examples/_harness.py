@@ -0,0 +1,52 @@
+"""
+Shared helpers for the example scripts.
+
+Examples buffer their output in a list of lines; these helpers look up API
+keys once per process, write each finished buffer in a single call and run
+the example's main coroutine.
+"""
+
+import asyncio
+import functools
+import os
+import sys
+from typing import Any, Coroutine, Optional
+
+
+@functools.cache
+def get_key(name: str) -> Optional[str]:
+    """Read an API key from the environment, once per process."""
+    return os.getenv(name) or None
+
+
+def require_key(name: str, out: list[str], action: str = "Skipping this example.") -> Optional[str]:
+    """
+    Get an API key, or note in the example output that it is missing.
+
+    Args:
+        name: Environment variable holding the key
+        out: Output buffer of the calling example
+        action: What the example does without the key
+
+    Returns:
+        The key, or None if it is not set
+    """
+    key = get_key(name)
+    if not key:
+        out.append(f"⚠️  {name} not set. {action}")
+    return key
+
+
+def emit(lines: list[str]) -> None:
+    """Write a buffered section to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def run(main: Coroutine[Any, Any, None]) -> None:
+    """Run an example's main coroutine, on uvloop if it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main)
+    else:
+        uvloop.run(main)
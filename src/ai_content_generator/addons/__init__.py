@@ -5,7 +5,7 @@ from .cache import CacheAddon
 from .retry import RetryAddon
 from .response_validator import ResponseValidatorAddon, ValidationMode
 from .dry_run import DryRunAddon
-from .whitespace_minimizer import WhitespaceMinimizerAddon
+from .whitespace_minimizer import WhitespaceMinimizerAddon, WhitespaceStats
 from .addon_manager import AddonManager
 
 __all__ = [
@@ -17,5 +17,6 @@ __all__ = [
     "ValidationMode",
     "DryRunAddon",
     "WhitespaceMinimizerAddon",
+    "WhitespaceStats",
     "AddonManager",
 ]
@@ -1,10 +1,15 @@
 """Addon manager for orchestrating addon execution."""
 
+import asyncio
+import logging
 from typing import Any, Optional
 
 from .base_addon import BaseAddon, AddonContext
 
 
+logger = logging.getLogger(__name__)
+
+
 class AddonManager:
     """
     Manager for orchestrating addon execution.
@@ -46,9 +51,33 @@ class AddonManager:
         ```
     """
     
-    def __init__(self):
-        """Initialize addon manager."""
-        self._addons: list[BaseAddon] = []
+    def __init__(self, strict: bool = False):
+        """
+        Initialize addon manager.
+        
+        Args:
+            strict: Let exceptions from addon hooks propagate instead of
+                reporting them and continuing. Only for trusted addons: a
+                failing hook aborts the request.
+        """
+        self._strict = strict
+        # Immutable, replaced on registration so hooks iterate a stable snapshot
+        self._addons: tuple[BaseAddon, ...] = ()
+        # First registered addon per name, for O(1) lookup by name
+        self._by_name: dict[str, BaseAddon] = {}
+    
+    def __len__(self) -> int:
+        """Get the number of registered addons."""
+        return len(self._addons)
+    
+    def has_addons(self) -> bool:
+        """
+        Check whether any addon is registered.
+        
+        Returns:
+            True if at least one addon is registered
+        """
+        return bool(self._addons)
     
     def add_addon(self, addon: BaseAddon) -> None:
         """
@@ -59,7 +88,8 @@ class AddonManager:
         Args:
             addon: Addon instance to register
         """
-        self._addons.append(addon)
+        self._addons = self._addons + (addon,)
+        self._by_name.setdefault(addon.get_name(), addon)
     
     def remove_addon(self, name: str) -> bool:
         """
@@ -71,20 +101,28 @@ class AddonManager:
         Returns:
             True if addon was found and removed
         """
-        for i, addon in enumerate(self._addons):
-            if addon.get_name() == name:
-                self._addons.pop(i)
-                return True
-        return False
+        addon = self._by_name.pop(name, None)
+        if addon is None:
+            return False
+        
+        self._addons = tuple(other for other in self._addons if other is not addon)
+        
+        # Another addon registered under the same name takes over the lookup
+        for other in self._addons:
+            if other.get_name() == name:
+                self._by_name[name] = other
+                break
+        return True
     
-    def get_addons(self) -> list[BaseAddon]:
+    def get_addons(self) -> tuple[BaseAddon, ...]:
         """
-        Get list of registered addons.
+        Get registered addons.
         
         Returns:
-            List of addon instances
+            Tuple of addon instances in execution order. It is a snapshot:
+            later registrations do not change it.
         """
-        return self._addons.copy()
+        return self._addons
     
     def get_addon(self, name: str) -> Optional[BaseAddon]:
         """
@@ -96,14 +134,42 @@ class AddonManager:
         Returns:
             Addon instance or None if not found
         """
-        for addon in self._addons:
-            if addon.get_name() == name:
-                return addon
-        return None
+        return self._by_name.get(name)
     
     def clear_addons(self) -> None:
         """Remove all registered addons."""
-        self._addons.clear()
+        self._addons = ()
+        self._by_name.clear()
+    
+    @staticmethod
+    def _record_error(
+        addon: BaseAddon,
+        hook: str,
+        error: Exception,
+        context: AddonContext
+    ) -> None:
+        """
+        Log an addon failure and optionally keep it in the context.
+        
+        The message is only formatted if a handler emits the record; without
+        logging configured, Python's last-resort handler prints it on stderr.
+        
+        Args:
+            addon: Addon whose hook raised
+            hook: Name of the hook that failed
+            error: The exception raised by the hook
+            context: Addon context; keeps the error when capture_errors is set
+        """
+        name = addon.get_name()
+        logger.error("ERROR in addon '%s' %s: %s", name, hook, error)
+        
+        # Keep the exception itself for debugging; format_errors() renders it
+        if context.capture_errors:
+            context.custom.setdefault("addon_errors", []).append({
+                "addon": name,
+                "hook": hook,
+                "exc": error,
+            })
     
     async def execute_pre_request(
         self,
@@ -124,13 +190,32 @@ class AddonManager:
             - None: Continue with normal request
             - str: Skip request and use this as response content
         """
-        for addon in self._addons:
+        pipeline = self._addons
+        if not pipeline:
+            return None
+        
+        if self._strict:
+            for addon in pipeline:
+                if addon.is_enabled():
+                    if addon.is_sync:
+                        result = addon.pre_request_sync(prompt, context)
+                    else:
+                        result = await addon.pre_request(prompt, context)
+                    if result is not None:
+                        return result
+            return None
+        
+        for addon in pipeline:
             # Skip disabled addons
             if not addon.is_enabled():
                 continue
             
             try:
-                result = await addon.pre_request(prompt, context)
+                # CPU-only addons are called directly, without a coroutine
+                if addon.is_sync:
+                    result = addon.pre_request_sync(prompt, context)
+                else:
+                    result = await addon.pre_request(prompt, context)
                 
                 # If addon returns a response, short-circuit
                 if result is not None:
@@ -138,19 +223,7 @@ class AddonManager:
             
             except Exception as e:
                 # Log addon error but continue with other addons
-                import sys
-                print(
-                    f"ERROR in addon '{addon.get_name()}' pre_request: {str(e)}",
-                    file=sys.stderr
-                )
-                # Store error in context for debugging
-                if "addon_errors" not in context.custom:
-                    context.custom["addon_errors"] = []
-                context.custom["addon_errors"].append({
-                    "addon": addon.get_name(),
-                    "hook": "pre_request",
-                    "error": str(e),
-                })
+                self._record_error(addon, "pre_request", e, context)
         
         return None
     
@@ -163,6 +236,9 @@ class AddonManager:
         Execute all post-request hooks.
         
         Addons are executed in order. Each addon can modify the response.
+        Consecutive addons marked post_request_independent run concurrently
+        on the response as it is at that point; their return values are
+        ignored.
         
         Args:
             response: Response from the provider
@@ -171,34 +247,81 @@ class AddonManager:
         Returns:
             Modified or original response
         """
+        pipeline = self._addons
+        if not pipeline:
+            return response
+        
         current_response = response
+        batch: list[BaseAddon] = []
         
-        for addon in self._addons:
+        for addon in pipeline:
             # Skip disabled addons
             if not addon.is_enabled():
                 continue
             
+            if addon.post_request_independent:
+                batch.append(addon)
+                continue
+            
+            if batch:
+                await self._run_independent_post_request(batch, current_response, context)
+                batch = []
+            
+            if self._strict:
+                current_response = await addon.post_request(current_response, context)
+                continue
+            
             try:
                 current_response = await addon.post_request(current_response, context)
             
             except Exception as e:
                 # Log addon error but continue with other addons
-                import sys
-                print(
-                    f"ERROR in addon '{addon.get_name()}' post_request: {str(e)}",
-                    file=sys.stderr
-                )
-                # Store error in context for debugging
-                if "addon_errors" not in context.custom:
-                    context.custom["addon_errors"] = []
-                context.custom["addon_errors"].append({
-                    "addon": addon.get_name(),
-                    "hook": "post_request",
-                    "error": str(e),
-                })
+                self._record_error(addon, "post_request", e, context)
+        
+        if batch:
+            await self._run_independent_post_request(batch, current_response, context)
         
         return current_response
     
+    async def _run_independent_post_request(
+        self,
+        batch: list[BaseAddon],
+        response: dict[str, Any],
+        context: AddonContext
+    ) -> None:
+        """
+        Run the post-request hooks of independent addons concurrently.
+        
+        Args:
+            batch: Consecutive enabled addons marked post_request_independent
+            response: Response passed to every addon in the batch
+            context: Addon context
+        """
+        if len(batch) == 1:
+            # Nothing to overlap; skip the task creation of gather()
+            addon = batch[0]
+            if self._strict:
+                await addon.post_request(response, context)
+                return
+            try:
+                await addon.post_request(response, context)
+            except Exception as e:
+                self._record_error(addon, "post_request", e, context)
+            return
+        
+        results = await asyncio.gather(
+            *(addon.post_request(response, context) for addon in batch),
+            return_exceptions=not self._strict
+        )
+        if self._strict:
+            return
+        
+        for addon, result in zip(batch, results, strict=True):
+            if isinstance(result, Exception):
+                self._record_error(addon, "post_request", result, context)
+            elif isinstance(result, BaseException):
+                raise result
+    
     async def execute_on_error(
         self,
         error: Exception,
@@ -217,9 +340,19 @@ class AddonManager:
         Returns:
             True if request should be retried
         """
+        pipeline = self._addons
+        if not pipeline:
+            return False
+        
         should_retry = False
         
-        for addon in self._addons:
+        if self._strict:
+            for addon in pipeline:
+                if addon.is_enabled() and await addon.on_error(error, context):
+                    should_retry = True
+            return should_retry
+        
+        for addon in pipeline:
             # Skip disabled addons
             if not addon.is_enabled():
                 continue
@@ -230,19 +363,7 @@ class AddonManager:
             
             except Exception as e:
                 # Log addon error but continue with other addons
-                import sys
-                print(
-                    f"ERROR in addon '{addon.get_name()}' on_error: {str(e)}",
-                    file=sys.stderr
-                )
-                # Store error in context for debugging
-                if "addon_errors" not in context.custom:
-                    context.custom["addon_errors"] = []
-                context.custom["addon_errors"].append({
-                    "addon": addon.get_name(),
-                    "hook": "on_error",
-                    "error": str(e),
-                })
+                self._record_error(addon, "on_error", e, context)
         
         return should_retry
 
@@ -1,12 +1,13 @@
 """Base addon interface and context."""
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class AddonContext:
     """
     Context data passed through addon pipeline.
@@ -24,7 +25,11 @@ class AddonContext:
         end_time: When the request completed
         error: Any error that occurred
         response: Response from the provider
+        request_params: Request parameters besides the prompt (system
+            message, temperature, max_tokens and provider kwargs)
         custom: Custom data that addons can use
+        capture_errors: Whether the addon manager keeps failed hooks in
+            custom["addon_errors"] (see format_errors())
     """
     request_id: str
     prompt: str
@@ -35,7 +40,18 @@ class AddonContext:
     end_time: Optional[datetime] = None
     error: Optional[Exception] = None
     response: Optional[dict[str, Any]] = None
+    request_params: dict[str, Any] = field(default_factory=dict)
     custom: dict[str, Any] = field(default_factory=dict)
+    capture_errors: bool = False
+    
+    def __post_init__(self) -> None:
+        """Intern model and provider names, which repeat across requests."""
+        # sys.intern only accepts exact str, so str subclasses such as
+        # str-based enums are kept as given
+        if type(self.model) is str:
+            self.model = sys.intern(self.model)
+        if type(self.provider) is str:
+            self.provider = sys.intern(self.provider)
     
     @property
     def duration_seconds(self) -> Optional[float]:
@@ -43,6 +59,26 @@ class AddonContext:
         if self.start_time and self.end_time:
             return (self.end_time - self.start_time).total_seconds()
         return None
+    
+    def format_errors(self) -> list[dict[str, str]]:
+        """
+        Format the addon errors captured for this request.
+        
+        Errors are stored as exception objects and only turned into strings
+        here, when someone actually looks at them.
+        
+        Returns:
+            List of dictionaries with addon, hook, error and error_type
+        """
+        return [
+            {
+                "addon": record["addon"],
+                "hook": record["hook"],
+                "error": str(record["exc"]),
+                "error_type": type(record["exc"]).__name__,
+            }
+            for record in self.custom.get("addon_errors", [])
+        ]
 
 
 class BaseAddon(ABC):
@@ -84,8 +120,20 @@ class BaseAddon(ABC):
                 # Handle error, return True to retry
                 return False
         ```
+    
+    Addons whose pre_request does no I/O can set is_sync = True and implement
+    pre_request_sync(); the addon manager then calls it without awaiting.
+    
+    Addons whose post_request only records side effects (and returns the
+    response unchanged) can set post_request_independent = True; the addon
+    manager then runs consecutive independent addons concurrently.
     """
     
+    # post_request neither changes the response nor depends on other addons
+    post_request_independent: ClassVar[bool] = False
+    # pre_request is CPU-only and implemented by pre_request_sync
+    is_sync: ClassVar[bool] = False
+    
     def __init__(self):
         """Initialize the addon."""
         self._enabled = True
@@ -151,6 +199,23 @@ class BaseAddon(ABC):
         """
         return None
     
+    def pre_request_sync(
+        self,
+        prompt: str,
+        context: AddonContext
+    ) -> Optional[str]:
+        """
+        Synchronous pre_request for addons with is_sync = True.
+        
+        Args:
+            prompt: The prompt being sent
+            context: Addon context
+        
+        Returns:
+            Same as pre_request()
+        """
+        return None
+    
     async def post_request(
         self,
         response: dict[str, Any],
@@ -1,22 +1,73 @@
 """Cache addon for caching responses."""
 
+import functools
 import hashlib
+import heapq
 import json
-from datetime import datetime, timedelta
-from typing import Any, Optional
+import math
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional
 
 from .base_addon import BaseAddon, AddonContext
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "performance" extra
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # Optional speedup, see the "performance" extra
+    xxhash = None
+
+
+def _hexdigest(payload: bytes) -> str:
+    """Hash a cache key payload with the fastest available digest."""
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(payload)
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _key_prefix(model: str, params: tuple[tuple[str, Any], ...]) -> bytes:
+    """
+    Encode the model and sorted parameters that start a cache key payload.
+    
+    repr() escapes control characters, so the NUL separators cannot appear
+    inside the parameters.
+    """
+    joined = ";".join([f"{name}={value!r}" for name, value in params])
+    return f"{model}\x00{joined}\x00".encode()
+
+
+_cached_key_prefix = functools.lru_cache(maxsize=256)(_key_prefix)
+
+
+# Clock for entry expiry, bound once for the hit path
+_now = time.monotonic
+
+
+def _is_deterministic(context: AddonContext) -> bool:
+    """Whether the request asks for temperature 0 (the default when unset)."""
+    return context.request_params.get("temperature", 0) == 0
+
 
 class CacheAddon(BaseAddon):
     """
     Addon for caching API responses.
     
     Features:
-    - In-memory cache with configurable TTL
+    - In-memory cache with configurable TTL, expired through a min-heap
     - LRU eviction when max size is reached
-    - Cache key based on prompt, model, and parameters
+    - Cache key based on prompt, model, provider and request parameters
+      (system message, temperature, max_tokens, provider kwargs)
+    - Only deterministic (temperature 0) requests are looked up and stored;
+      sampled responses are meant to differ between calls
+    - Dry-run and addon-generated responses are never stored
     - Cache statistics (hits, misses, size)
+    - Optional JSON file persistence across process restarts, written by
+      flush()
     
     Example:
         ```python
@@ -31,13 +82,25 @@ class CacheAddon(BaseAddon):
         # Check stats
         stats = cache.get_stats()
         print(f"Cache hits: {stats['hits']}, misses: {stats['misses']}")
+        
+        # Keep entries across runs of the same script
+        cache = CacheAddon(ttl_seconds=86400, persist_path=".llm_cache/responses.json")
+        ...
+        cache.flush()  # Write new entries to the file
+        
+        # Only replace a cached answer with a longer one
+        cache = CacheAddon(replace_policy=lambda old, new: len(new) > len(old))
         ```
     """
     
+    post_request_independent = True
+    
     def __init__(
         self,
         max_size: int = 100,
         ttl_seconds: Optional[int] = 3600,
+        persist_path: Optional[str | Path] = None,
+        replace_policy: Optional[Callable[[str, str], bool]] = None,
     ):
         """
         Initialize cache addon.
@@ -45,14 +108,30 @@ class CacheAddon(BaseAddon):
         Args:
             max_size: Maximum number of cached items
             ttl_seconds: Time-to-live in seconds (None for no expiration)
+            persist_path: Optional JSON file to load entries from and write
+                them back to on flush(), so the cache survives process restarts
+            replace_policy: Optional function called with the cached and the
+                new content when a live entry would be overwritten; the entry
+                is only replaced if it returns True (None always replaces)
         """
         super().__init__()
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: dict[str, dict[str, Any]] = {}
-        self._access_order: list[str] = []  # For LRU
+        self._check_expiry = ttl_seconds is not None
+        self.persist_path = Path(persist_path) if persist_path is not None else None
+        self.replace_policy = replace_policy
+        # (response content, monotonic expiry) pairs in LRU order, least
+        # recently used first
+        self._cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._expiry: list[tuple[float, str]] = []  # Min-heap of (expires_at, key)
         self._hits = 0
         self._misses = 0
+        self._expired_evictions = 0
+        # Whether entries changed since the persist file was last written
+        self._dirty = False
+        
+        if self.persist_path is not None:
+            self._load()
     
     def get_name(self) -> str:
         """Get addon name."""
@@ -77,46 +156,103 @@ class CacheAddon(BaseAddon):
             **kwargs: Additional parameters
         
         Returns:
-            Cache key hash
+            Cache key hash (xxh3-64 when xxhash is installed, else SHA-256)
         """
-        # Create deterministic key from prompt, model, and sorted kwargs
-        key_data = {
-            "prompt": prompt,
-            "model": model,
-            "params": {k: v for k, v in sorted(kwargs.items())}
-        }
-        key_str = json.dumps(key_data, sort_keys=True)
-        return hashlib.sha256(key_str.encode()).hexdigest()
+        # Create deterministic key from model, sorted kwargs and prompt;
+        # model and parameters repeat across requests, so their encoded
+        # prefix is memoized
+        params = tuple(sorted(kwargs.items()))
+        try:
+            prefix = _cached_key_prefix(model, params)
+        except TypeError:
+            # Unhashable parameter values cannot be memoized
+            prefix = _key_prefix(model, params)
+        return _hexdigest(prefix + prompt.encode())
     
-    def _is_expired(self, cached_item: dict[str, Any]) -> bool:
-        """
-        Check if cached item is expired.
+    def _store(self, key: str, content: str, expires_at: float) -> None:
+        """Insert or refresh an entry, scheduling its expiry on the heap."""
+        if key not in self._cache and len(self._cache) >= self.max_size:
+            self._evict_lru()
         
-        Args:
-            cached_item: Cached item with timestamp
+        self._cache[key] = (content, expires_at)
+        self._cache.move_to_end(key)
         
-        Returns:
-            True if expired
-        """
-        if self.ttl_seconds is None:
-            return False
+        if self._check_expiry:
+            heapq.heappush(self._expiry, (expires_at, key))
+            # Refreshed and LRU-evicted keys leave stale heap entries behind;
+            # rebuild once they outnumber the live ones
+            if len(self._expiry) > 2 * self.max_size:
+                self._expiry = [
+                    (entry_expires_at, cache_key)
+                    for cache_key, (_, entry_expires_at) in self._cache.items()
+                ]
+                heapq.heapify(self._expiry)
+    
+    def _purge_expired(self, now: float) -> None:
+        """Drop every entry whose TTL has elapsed, soonest-expiring first."""
+        expiry = self._expiry
+        while expiry and expiry[0][0] <= now:
+            _, key = heapq.heappop(expiry)
+            entry = self._cache.get(key)
+            # Skip stale heap entries for keys that were evicted or refreshed
+            if entry is not None and now >= entry[1]:
+                del self._cache[key]
+                self._expired_evictions += 1
+    
+    def _load(self) -> None:
+        """Load persisted entries, keeping their LRU order and the size limit."""
+        if not self.persist_path.exists():
+            return
+        
+        try:
+            if orjson is not None:
+                data = orjson.loads(self.persist_path.read_bytes())
+            else:
+                with open(self.persist_path, encoding="utf-8") as f:
+                    data = json.load(f)
+        except (OSError, ValueError):
+            # A missing or corrupt cache file just means a cold cache
+            return
         
-        cached_time = cached_item["timestamp"]
-        expiry_time = cached_time + timedelta(seconds=self.ttl_seconds)
-        return datetime.now() > expiry_time
+        # The file holds wall-clock timestamps; entries expire on the
+        # monotonic clock
+        now = time.time()
+        to_monotonic = _now() - now
+        for cache_key, item in data.items():
+            expires_at = math.inf
+            if self._check_expiry:
+                expires_at = item["timestamp"] + self.ttl_seconds
+                if now >= expires_at:
+                    continue
+                expires_at += to_monotonic
+            self._store(cache_key, item["response"]["content"], expires_at)
+    
+    def _save(self) -> None:
+        """Write all entries to the persist file, least recently used first."""
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Persist wall-clock insertion times, which stay meaningful across
+        # processes; without a TTL the save time stands in for them
+        now = time.time()
+        to_wall_clock = now - _now()
+        data = {}
+        for cache_key, (content, expires_at) in self._cache.items():
+            timestamp = now
+            if self._check_expiry:
+                timestamp = expires_at - self.ttl_seconds + to_wall_clock
+            data[cache_key] = {"response": {"content": content}, "timestamp": timestamp}
+        
+        if orjson is not None:
+            self.persist_path.write_bytes(orjson.dumps(data, default=str))
+            return
+        
+        with open(self.persist_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, default=str)
     
     def _evict_lru(self) -> None:
         """Evict least recently used item."""
-        if self._access_order:
-            lru_key = self._access_order.pop(0)
-            if lru_key in self._cache:
-                del self._cache[lru_key]
-    
-    def _update_access(self, key: str) -> None:
-        """Update access order for LRU."""
-        if key in self._access_order:
-            self._access_order.remove(key)
-        self._access_order.append(key)
+        if self._cache:
+            self._cache.popitem(last=False)
     
     async def pre_request(
         self,
@@ -133,40 +269,44 @@ class CacheAddon(BaseAddon):
         Returns:
             Cached response content if found, None otherwise
         """
-        # Generate cache key
+        # System messages are only minimized by the pipeline, never answered
+        if context.metadata.get("message_type") == "system":
+            return None
+        
+        if not _is_deterministic(context):
+            return None
+        
+        # Generate cache key from everything that shapes the response
         cache_key = self._generate_cache_key(
             prompt,
             context.model,
             provider=context.provider,
+            **context.request_params,
         )
         
-        # Check if in cache
-        if cache_key in self._cache:
-            cached_item = self._cache[cache_key]
-            
-            # Check if expired
-            if self._is_expired(cached_item):
-                del self._cache[cache_key]
-                if cache_key in self._access_order:
-                    self._access_order.remove(cache_key)
-                self._misses += 1
-                return None
+        # Drop expired entries, then check if in cache
+        if self._check_expiry:
+            self._purge_expired(_now())
+        
+        # Store cache info in context
+        custom = context.custom
+        custom["cache_key"] = cache_key
+        
+        entry = self._cache.get(cache_key)
+        if entry is not None:
+            content, _ = entry
             
             # Cache hit
             self._hits += 1
-            self._update_access(cache_key)
-            
-            # Store cache info in context
-            context.custom["cache_hit"] = True
-            context.custom["cache_key"] = cache_key
+            self._cache.move_to_end(cache_key)
+            custom["cache_hit"] = True
             
             # Return cached content
-            return cached_item["response"]["content"]
+            return content
         
         # Cache miss
         self._misses += 1
-        context.custom["cache_hit"] = False
-        context.custom["cache_key"] = cache_key
+        custom["cache_hit"] = False
         
         return None
     
@@ -185,28 +325,56 @@ class CacheAddon(BaseAddon):
         Returns:
             Original response
         """
-        # Only cache if it wasn't a cache hit
-        if not context.custom.get("cache_hit", False):
-            cache_key = context.custom.get("cache_key")
+        # Only cache real provider responses: not cache hits, dry runs or
+        # responses produced by another addon
+        custom = context.custom
+        if _is_deterministic(context) and not (
+            custom.get("cache_hit", False)
+            or custom.get("dry_run")
+            or custom.get("addon_response")
+            or response.get("dry_run")
+        ):
+            cache_key = custom.get("cache_key")
             
-            if cache_key:
-                # Evict if at max size
-                if len(self._cache) >= self.max_size:
-                    self._evict_lru()
+            content = response.get("content")
+            
+            # Only the content is returned on a hit, so only it is kept
+            if cache_key and content is not None:
+                # Let the policy keep a better cached answer, e.g. when
+                # concurrent requests for the same prompt both missed
+                if self.replace_policy is not None:
+                    entry = self._cache.get(cache_key)
+                    if entry is not None and not self.replace_policy(entry[0], content):
+                        return response
                 
-                # Store in cache
-                self._cache[cache_key] = {
-                    "response": response,
-                    "timestamp": datetime.now(),
-                }
-                self._update_access(cache_key)
+                # Store in cache, evicting the LRU entry if at max size
+                expires_at = math.inf
+                if self._check_expiry:
+                    expires_at = _now() + self.ttl_seconds
+                self._store(cache_key, content, expires_at)
+                self._dirty = True
         
         return response
     
+    def flush(self) -> None:
+        """
+        Write the entries to the persist file if they changed since the last write.
+        
+        Storing a response only marks the cache dirty, so a request never
+        waits for the whole file to be rewritten. Call this when a batch of
+        work is done; SessionFactory.close() flushes the factory's cache.
+        Does nothing without a persist_path.
+        """
+        if self.persist_path is not None and self._dirty:
+            self._save()
+            self._dirty = False
+    
     def clear_cache(self) -> None:
         """Clear all cached items."""
         self._cache.clear()
-        self._access_order.clear()
+        self._expiry.clear()
+        self._dirty = True
+        self.flush()
     
     def get_stats(self) -> dict[str, Any]:
         """
@@ -225,6 +393,7 @@ class CacheAddon(BaseAddon):
             "hit_rate": hit_rate,
             "cache_size": len(self._cache),
             "max_size": self.max_size,
+            "expired_evictions": self._expired_evictions,
         }
     
     def get_cache_size(self) -> int:
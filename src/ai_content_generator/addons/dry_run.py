@@ -1,6 +1,7 @@
 """Dry run addon for testing without making actual API calls."""
 
-from typing import Any, Optional
+from collections import deque
+from typing import Any, Optional, Sequence
 
 from .base_addon import BaseAddon, AddonContext
 
@@ -36,6 +37,8 @@ class DryRunAddon(BaseAddon):
         ```
     """
     
+    post_request_independent = True
+    
     def __init__(
         self,
         mock_response: Optional[str] = None,
@@ -43,6 +46,7 @@ class DryRunAddon(BaseAddon):
         log_requests: bool = True,
         mock_input_tokens: int = 10,
         mock_output_tokens: int = 50,
+        log_capacity: Optional[int] = 10000,
     ):
         """
         Initialize dry run addon.
@@ -53,6 +57,8 @@ class DryRunAddon(BaseAddon):
             log_requests: Whether to log intercepted requests
             mock_input_tokens: Default input token count for estimation
             mock_output_tokens: Default output token count for estimation
+            log_capacity: Maximum number of logged requests to keep; the
+                oldest are dropped first (None for unbounded)
         """
         super().__init__()
         self.mock_response = mock_response
@@ -60,7 +66,8 @@ class DryRunAddon(BaseAddon):
         self.log_requests = log_requests
         self.mock_input_tokens = mock_input_tokens
         self.mock_output_tokens = mock_output_tokens
-        self._request_log: list[dict[str, Any]] = []
+        self._request_log: deque[dict[str, Any]] = deque(maxlen=log_capacity)
+        self._total_logged = 0
     
     def get_name(self) -> str:
         """Get addon name."""
@@ -80,8 +87,11 @@ class DryRunAddon(BaseAddon):
         Returns:
             Estimated token count
         """
-        # Rough estimation: 1 token ≈ 4 characters
-        return len(text) // 4
+        if not text:
+            return 0
+        # Rough estimation: 1 token ≈ 4 characters, but at least one token
+        # per space-separated word (str.count runs in C, no Python loop)
+        return max(len(text) >> 2, text.count(' ') + 1)
     
     def _generate_mock_response(self, prompt: str, context: AddonContext) -> str:
         """
@@ -120,14 +130,14 @@ class DryRunAddon(BaseAddon):
         """
         # Log the request if enabled
         if self.log_requests:
-            log_entry = {
+            self._request_log.append({
                 "request_id": context.request_id,
                 "prompt": prompt,
                 "model": context.model,
                 "provider": context.provider,
                 "metadata": context.metadata,
-            }
-            self._request_log.append(log_entry)
+            })
+            self._total_logged += 1
         
         # Estimate tokens if enabled
         if self.estimate_tokens:
@@ -141,9 +151,8 @@ class DryRunAddon(BaseAddon):
         # Mark as dry run
         context.custom["dry_run"] = True
         
-        # Generate and return mock response
-        mock_content = self._generate_mock_response(prompt, context)
-        return mock_content
+        # Return the fixed mock response, or generate one from the request
+        return self.mock_response or self._generate_mock_response(prompt, context)
     
     async def post_request(
         self,
@@ -162,18 +171,23 @@ class DryRunAddon(BaseAddon):
         """
         return response
     
-    def get_request_log(self) -> list[dict[str, Any]]:
+    def get_request_log(self) -> Sequence[dict[str, Any]]:
         """
         Get log of intercepted requests.
         
+        The log itself is returned rather than a copy. Treat it as
+        read-only, and take `list(...)` of it if you need a snapshot that
+        does not change as more requests are intercepted.
+        
         Returns:
-            List of logged requests
+            Logged requests, oldest first (at most log_capacity)
         """
-        return self._request_log.copy()
+        return self._request_log
     
     def clear_log(self) -> None:
         """Clear the request log."""
         self._request_log.clear()
+        self._total_logged = 0
     
     def get_stats(self) -> dict:
         """
@@ -183,7 +197,7 @@ class DryRunAddon(BaseAddon):
             Dictionary with stats
         """
         return {
-            "total_intercepted": len(self._request_log),
+            "total_intercepted": self._total_logged,
             "log_enabled": self.log_requests,
             "estimate_tokens": self.estimate_tokens,
         }
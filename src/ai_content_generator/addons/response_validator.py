@@ -1,14 +1,18 @@
 """Response validator addon for validating API responses."""
 
+import logging
 from enum import Enum
 from typing import Any, Callable, Optional
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from .base_addon import BaseAddon, AddonContext
 from ..core.exceptions import ValidationError as CustomValidationError
 
 
+logger = logging.getLogger(__name__)
+
+
 class ValidationMode(Enum):
     """Validation mode for response validation."""
     
@@ -75,7 +79,17 @@ class ResponseValidatorAddon(BaseAddon):
             raise ValueError("Either schema or validator_func must be provided")
         
         self.schema = schema
+        # Build the schema's validator once instead of going through the
+        # model constructor for every response
+        self._schema_adapter = TypeAdapter(schema) if schema is not None else None
         self.validator_func = validator_func
+        # Bind the checks once so post_request skips unconfigured ones
+        if schema is not None and validator_func is not None:
+            self._validate = self._validate_with_schema_and_func
+        elif schema is not None:
+            self._validate = self._validate_with_schema
+        else:
+            self._validate = self._validate_with_func
         self.mode = mode
         self.max_retries = max_retries
         self._validation_failures = 0
@@ -89,7 +103,7 @@ class ResponseValidatorAddon(BaseAddon):
         """Get addon description."""
         return f"Validates responses (mode: {self.mode.value})"
     
-    def _validate_with_schema(self, response: dict) -> tuple[bool, Optional[str]]:
+    def _validate_with_schema(self, response: dict) -> Optional[str]:
         """
         Validate response using Pydantic schema.
         
@@ -97,18 +111,18 @@ class ResponseValidatorAddon(BaseAddon):
             response: Response to validate
         
         Returns:
-            Tuple of (is_valid, error_message)
+            Error message, or None if the response is valid
         """
-        if self.schema is None:
-            return True, None
+        if self._schema_adapter is None:
+            return None
         
         try:
-            self.schema(**response)
-            return True, None
+            self._schema_adapter.validate_python(response)
         except ValidationError as e:
-            return False, str(e)
+            return str(e)
+        return None
     
-    def _validate_with_func(self, response: dict) -> tuple[bool, Optional[str]]:
+    def _validate_with_func(self, response: dict) -> Optional[str]:
         """
         Validate response using custom function.
         
@@ -116,18 +130,29 @@ class ResponseValidatorAddon(BaseAddon):
             response: Response to validate
         
         Returns:
-            Tuple of (is_valid, error_message)
+            Error message, or None if the response is valid
         """
         if self.validator_func is None:
-            return True, None
+            return None
         
         try:
-            is_valid = self.validator_func(response)
-            if not is_valid:
-                return False, "Custom validation function returned False"
-            return True, None
+            if not self.validator_func(response):
+                return "Custom validation function returned False"
         except Exception as e:
-            return False, f"Validation function raised exception: {str(e)}"
+            return f"Validation function raised exception: {str(e)}"
+        return None
+    
+    def _validate_with_schema_and_func(self, response: dict) -> Optional[str]:
+        """
+        Validate response using the schema, then the custom function.
+        
+        Args:
+            response: Response to validate
+        
+        Returns:
+            Error message of the first failing check, or None if valid
+        """
+        return self._validate_with_schema(response) or self._validate_with_func(response)
     
     async def post_request(
         self,
@@ -147,17 +172,10 @@ class ResponseValidatorAddon(BaseAddon):
         Raises:
             CustomValidationError: If validation fails in STRICT mode
         """
-        # Validate with schema
-        is_valid_schema, schema_error = self._validate_with_schema(response)
+        # Validate with the configured schema and/or custom function
+        error_message = self._validate(response)
         
-        # Validate with custom function
-        is_valid_func, func_error = self._validate_with_func(response)
-        
-        # Combine results
-        is_valid = is_valid_schema and is_valid_func
-        error_message = schema_error or func_error
-        
-        if is_valid:
+        if error_message is None:
             self._validation_successes += 1
             return response
         
@@ -180,11 +198,7 @@ class ResponseValidatorAddon(BaseAddon):
         
         elif self.mode == ValidationMode.WARN:
             # Just log warning and continue
-            import sys
-            print(
-                f"WARNING: Response validation failed: {error_message}",
-                file=sys.stderr
-            )
+            logger.warning("Response validation failed: %s", error_message)
             return response
         
         elif self.mode == ValidationMode.AUTO_RETRY:
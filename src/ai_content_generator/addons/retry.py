@@ -1,6 +1,7 @@
 """Retry addon for handling transient failures."""
 
 import asyncio
+import random
 from typing import Optional, Type
 
 from .base_addon import BaseAddon, AddonContext
@@ -36,6 +37,8 @@ class RetryAddon(BaseAddon):
         ```
     """
     
+    post_request_independent = True
+    
     def __init__(
         self,
         max_retries: int = 3,
@@ -59,11 +62,20 @@ class RetryAddon(BaseAddon):
         self.initial_delay = initial_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
+        # Capped backoff delay per attempt, before jitter
+        self._base_delays = tuple(
+            min(initial_delay * exponential_base ** attempt, max_delay)
+            for attempt in range(max_retries + 1)
+        )
         self.retry_on_errors = retry_on_errors or [
             RateLimitError,
             ConnectionError,
             ProviderError,
         ]
+        # isinstance() checks a tuple of types in a single call
+        self._retry_on_errors = tuple(self.retry_on_errors)
+        # Retrying on Exception (or a base of it) matches every error
+        self._retry_all = issubclass(Exception, self._retry_on_errors)
         self._total_retries = 0
         self._successful_retries = 0
         self._failed_retries = 0
@@ -86,7 +98,7 @@ class RetryAddon(BaseAddon):
         Returns:
             True if should retry
         """
-        return any(isinstance(error, error_type) for error_type in self.retry_on_errors)
+        return self._retry_all or isinstance(error, self._retry_on_errors)
     
     def _calculate_delay(self, attempt: int) -> float:
         """
@@ -98,14 +110,14 @@ class RetryAddon(BaseAddon):
         Returns:
             Delay in seconds
         """
-        # Exponential backoff: initial_delay * (base ^ attempt)
-        delay = self.initial_delay * (self.exponential_base ** attempt)
-        
-        # Cap at max_delay
-        delay = min(delay, self.max_delay)
+        # Exponential backoff: initial_delay * (base ^ attempt), capped at
+        # max_delay; precomputed for every attempt up to max_retries
+        if attempt < len(self._base_delays):
+            delay = self._base_delays[attempt]
+        else:
+            delay = min(self.initial_delay * (self.exponential_base ** attempt), self.max_delay)
         
         # Add jitter (±20%) to prevent thundering herd
-        import random
         jitter = delay * 0.2 * (random.random() * 2 - 1)
         delay += jitter
         
@@ -1,12 +1,91 @@
 """Whitespace minimizer addon for reducing token usage."""
 
+import functools
 import re
-from typing import Any, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Tuple
 
 
 from .base_addon import BaseAddon, AddonContext
 
 
+# Code block patterns to preserve, compiled once at import, each paired
+# with a character every match contains. Block bodies consume anything up
+# to the first closing delimiter with possessive quantifiers, matching
+# exactly what a lazy .*? would without retrying each character on failure
+_CODE_BLOCK_PATTERNS = (
+    # Markdown code blocks: ```language\n...\n```
+    ('`', re.compile(r'```\w*+\n(?:[^\n]++|\n(?!```))*+\n```')),
+    # Single backticks for inline code
+    ('`', re.compile(r'`[^`\n]+`')),
+    # Python-style docstrings: """...""" or '''...'''
+    ('"', re.compile(r'"""[^"]*+(?:"(?!"")[^"]*+)*+"""')),
+    ("'", re.compile(r"'''[^']*+(?:'(?!'')[^']*+)*+'''")),
+)
+
+# Stands in for code blocks while the text between them is minimized
+_CODE_PLACEHOLDER = '\x00'
+
+# Longer prompts are minimized without caching the result, to bound memory
+_MAX_CACHED_PROMPT_LENGTH = 64 * 1024
+
+# ASCII whitespace that rstrip() removes when it ends a line
+_LINE_END_WHITESPACE = ' \t\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+# Non-ASCII characters for which str.isspace() is true, which rstrip() also
+# removes from line ends
+_NON_ASCII_WHITESPACE = (
+    '\x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007'
+    '\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000'
+)
+
+
+@functools.cache
+def _whitespace_substitutions(
+    minimize_spaces: bool,
+    minimize_newlines: bool,
+    max_newlines: int
+) -> tuple[tuple[re.Pattern[str], str], ...]:
+    """
+    Build the space/newline substitutions for a minimizer configuration.
+    
+    Compiled once per configuration and shared by every instance using it.
+    Each pattern starts with a literal run, which lets the regex engine skip
+    ahead with a fast substring search and replace without Python callbacks.
+    
+    Args:
+        minimize_spaces: Whether runs of spaces are collapsed
+        minimize_newlines: Whether runs of newlines are capped
+        max_newlines: Maximum consecutive newlines to keep
+        
+    Returns:
+        (pattern, replacement) pairs for the enabled runs
+    """
+    substitutions = []
+    if minimize_spaces:
+        substitutions.append((re.compile('  +'), ' '))
+    if minimize_newlines:
+        newline_cap = '\n' * max(1, max_newlines)
+        substitutions.append((re.compile(newline_cap + '\n+'), newline_cap))
+    return tuple(substitutions)
+
+
+@dataclass(slots=True)
+class WhitespaceStats:
+    """
+    Savings from minimizing one prompt.
+    
+    Stored in `context.custom["whitespace_stats"]` when a prompt is minimized.
+    
+    Attributes:
+        chars_saved: Characters removed from the prompt
+        tokens_saved: Estimated tokens saved
+    """
+    chars_saved: int
+    tokens_saved: int
+
+
 class WhitespaceMinimizerAddon(BaseAddon):
     """
     Addon for minimizing whitespace in prompts to reduce token usage.
@@ -18,6 +97,10 @@ class WhitespaceMinimizerAddon(BaseAddon):
     - Optionally preserves code blocks
     - Tracks token savings statistics
     
+    Minimization is CPU-only and never yields control: the addon manager
+    calls pre_request_sync() directly, and awaiting pre_request() completes
+    without suspending.
+    
     Example:
         ```python
         minimizer = WhitespaceMinimizerAddon(
@@ -37,6 +120,9 @@ class WhitespaceMinimizerAddon(BaseAddon):
         ```
     """
     
+    post_request_independent = True
+    is_sync = True
+    
     def __init__(
         self,
         minimize_spaces: bool = True,
@@ -45,6 +131,7 @@ class WhitespaceMinimizerAddon(BaseAddon):
         preserve_code_blocks: bool = True,
         aggressive_mode: bool = False,
         max_newlines: int = 2,
+        result_cache_size: int = 256,
     ):
         """
         Initialize whitespace minimizer addon.
@@ -56,6 +143,8 @@ class WhitespaceMinimizerAddon(BaseAddon):
             preserve_code_blocks: Whether to skip minimization inside code blocks
             aggressive_mode: Maximum compression (single newlines only)
             max_newlines: Maximum consecutive newlines to preserve (ignored if aggressive_mode=True)
+            result_cache_size: Number of recently minimized prompts whose result
+                is kept, so repeated prompts skip the regex passes (0 to disable)
         """
         super().__init__()
         self.minimize_spaces = minimize_spaces
@@ -65,10 +154,22 @@ class WhitespaceMinimizerAddon(BaseAddon):
         self.aggressive_mode = aggressive_mode
         self.max_newlines = max_newlines if not aggressive_mode else 1
         
+        # Precompiled substitutions for this configuration, looked up once
+        self._substitutions = _whitespace_substitutions(
+            minimize_spaces, minimize_newlines, self.max_newlines
+        )
+        # Shortest newline run that minimization would cap
+        self._excess_newlines = '\n' * (max(1, self.max_newlines) + 1)
+        
+        # Minimized prompts in LRU order, keyed by the original prompt
+        self.result_cache_size = result_cache_size
+        self._result_cache: OrderedDict[str, str] = OrderedDict()
+        
         # Statistics tracking
         self._total_requests = 0
         self._total_chars_removed = 0
-        self._total_token_savings = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
         
     def get_name(self) -> str:
         """Get addon name."""
@@ -104,51 +205,97 @@ class WhitespaceMinimizerAddon(BaseAddon):
         """
         code_ranges = []
         
-        # Common code block patterns: triple backticks, indented blocks, etc.
-        patterns = [
-            # Markdown code blocks: ```language\n...\n```
-            (r'```[\w]*\n.*?\n```', re.DOTALL),
-            # Single backticks for inline code
-            (r'`[^`\n]+`', re.DOTALL),
-            # Python-style docstrings: """...""" or '''...'''
-            (r'""".*?"""', re.DOTALL),
-            (r"'''.*?'''", re.DOTALL),
-        ]
-        
-        for pattern, flags in patterns:
-            for match in re.finditer(pattern, text, flags):
-                code_ranges.append((match.start(), match.end()))
-        
-        # Sort by start position
-        code_ranges.sort(key=lambda x: x[0])
-        
-        # Merge overlapping ranges
+        for marker, pattern in _CODE_BLOCK_PATTERNS:
+            # A single-character search (memchr) is far cheaper than a regex
+            # scan that finds nothing
+            if marker not in text:
+                continue
+            code_ranges += [match.span() for match in pattern.finditer(text)]
+        
+        # Sort by start position; ranges sharing a start are merged below,
+        # so comparing whole tuples needs no key function
+        code_ranges.sort()
+        
+        # Merge overlapping ranges, tracking the merged end in a local and
+        # keeping each match's own tuple unless it has to be extended
         merged = []
-        for start, end in code_ranges:
-            if merged and start <= merged[-1][1]:
-                # Merge with previous range
-                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
-            else:
-                merged.append((start, end))
+        merged_end = -1
+        for code_range in code_ranges:
+            start, end = code_range
+            if start > merged_end:
+                merged.append(code_range)
+                merged_end = end
+            elif end > merged_end:
+                # Extend the previous range, which this one overlaps
+                merged[-1] = (merged[-1][0], end)
+                merged_end = end
         
         return merged
     
-    def _is_in_code_block(self, position: int, code_ranges: list[Tuple[int, int]]) -> bool:
+    def _needs_minimization(self, text: str) -> bool:
         """
-        Check if a position is inside a code block.
+        Check whether minimization could change the text at all.
+        
+        Uses plain substring checks, which are much cheaper than the regex
+        passes, so clean prompts skip code block detection and minimization.
         
         Args:
-            position: Character position
-            code_ranges: List of code block ranges
+            text: Text to check
             
         Returns:
-            True if position is in a code block
+            False only if minimizing would return the text unchanged
         """
-        for start, end in code_ranges:
-            if start <= position < end:
+        if self.minimize_tabs and '\t' in text:
+            return True
+        
+        if self.minimize_spaces:
+            if '  ' in text:
+                return True
+            if text[-1:].isspace() and text[-1] != '\n':
                 return True
+            line_end_whitespace = _LINE_END_WHITESPACE
+            if not text.isascii():
+                line_end_whitespace += _NON_ASCII_WHITESPACE
+            for char in line_end_whitespace:
+                # Most of these characters never occur, and a single-character
+                # search (memchr) rules them out far faster than looking for
+                # the character followed by a newline
+                if char in text and char + '\n' in text:
+                    return True
+        
+        if self.minimize_newlines:
+            if self._excess_newlines in text:
+                return True
+            if self.aggressive_mode and (text[:1] == '\n' or text[-1:] == '\n'):
+                return True
+        
         return False
     
+    def _minimize_fast(self, text: str) -> str:
+        """
+        Minimize whitespace in a span that contains no code blocks.
+        
+        Tabs are folded to spaces with a single str.replace call, then
+        precompiled substitutions collapse runs of spaces and cap runs of
+        newlines.
+        
+        Args:
+            text: Text to minimize
+            
+        Returns:
+            Minimized text
+        """
+        if self.minimize_tabs:
+            # str.replace runs a fast search for the tab and copies the
+            # rest; translate walks every character, very slowly once the
+            # text is not ASCII
+            text = text.replace('\t', ' ')
+        
+        for pattern, replacement in self._substitutions:
+            text = pattern.sub(replacement, text)
+        
+        return text
+    
     def _minimize_whitespace(
         self,
         text: str,
@@ -164,61 +311,42 @@ class WhitespaceMinimizerAddon(BaseAddon):
         Returns:
             Minimized text
         """
-        if code_ranges is None:
-            code_ranges = []
-        
-        # Convert to list of characters for processing
-        chars = list(text)
-        result_chars = []
-        i = 0
-        
-        while i < len(chars):
-            char = chars[i]
-            in_code = self._is_in_code_block(i, code_ranges)
+        if not code_ranges:
+            result = self._minimize_fast(text)
+        elif _CODE_PLACEHOLDER not in text:
+            # Stand in a placeholder for each code block so every span between
+            # blocks is minimized in one pass; the placeholder is not
+            # whitespace, so no run can merge across a block
+            parts = []
+            position = 0
+            for start, end in code_ranges:
+                parts.append(text[position:start])
+                parts.append(text[start:end])
+                position = end
+            parts.append(text[position:])
             
-            if in_code:
-                # Preserve characters inside code blocks
-                result_chars.append(char)
-                i += 1
-            else:
-                # Process whitespace
-                if char == ' ' and self.minimize_spaces:
-                    # Collapse multiple spaces
-                    result_chars.append(' ')
-                    while i + 1 < len(chars) and chars[i + 1] == ' ':
-                        i += 1
-                    i += 1
-                    
-                elif char == '\t' and self.minimize_tabs:
-                    # Convert tab to space
-                    result_chars.append(' ')
-                    i += 1
-                    
-                elif char == '\n' and self.minimize_newlines:
-                    # Handle newlines
-                    result_chars.append('\n')
-                    newline_count = 1
-                    while i + 1 < len(chars) and chars[i + 1] == '\n':
-                        newline_count += 1
-                        i += 1
-                    
-                    # Add additional newlines up to max_newlines
-                    additional = min(newline_count - 1, self.max_newlines - 1)
-                    result_chars.extend(['\n'] * additional)
-                    
-                    i += 1
-                else:
-                    # Regular character, preserve as-is
-                    result_chars.append(char)
-                    i += 1
-        
-        result = ''.join(result_chars)
-        
-        # Strip leading/trailing whitespace from lines
-        if self.minimize_spaces or self.minimize_newlines:
-            lines = result.split('\n')
-            stripped_lines = [line.rstrip() if self.minimize_spaces else line for line in lines]
-            result = '\n'.join(stripped_lines)
+            # Spans sit at the even indices; swap in their minimized forms
+            # with one slice assignment
+            parts[::2] = self._minimize_fast(
+                _CODE_PLACEHOLDER.join(parts[::2])
+            ).split(_CODE_PLACEHOLDER)
+            result = ''.join(parts)
+        else:
+            # Minimize the spans between code blocks and copy the blocks as-is
+            parts = []
+            position = 0
+            for start, end in code_ranges:
+                parts.append(self._minimize_fast(text[position:start]))
+                parts.append(text[start:end])
+                position = end
+            parts.append(self._minimize_fast(text[position:]))
+            result = ''.join(parts)
+        
+        # Strip trailing whitespace from lines. A [^\S\n]+$ regex does the
+        # same but measures several times slower, since a character class
+        # gives the regex engine no literal to search for
+        if self.minimize_spaces:
+            result = '\n'.join(map(str.rstrip, result.split('\n')))
         
         # Strip leading and trailing newlines if aggressive mode
         if self.aggressive_mode and self.minimize_newlines:
@@ -226,21 +354,90 @@ class WhitespaceMinimizerAddon(BaseAddon):
         
         return result
     
-    def _estimate_token_savings(self, original: str, minimized: str) -> int:
+    def minimize(self, prompt: str) -> tuple[str, int, int]:
+        """
+        Minimize whitespace in a prompt synchronously.
+        
+        Applies the same transformation as pre_request() and updates the
+        statistics, without an addon context or the async addon pipeline.
+        Use it when the minimizer is the only transformation needed.
+        
+        Args:
+            prompt: The prompt
+            
+        Returns:
+            Tuple of (minimized prompt, characters removed, estimated tokens saved).
+            The prompt object itself is returned if nothing changed.
+        
+        Example:
+            ```python
+            minimizer = WhitespaceMinimizerAddon()
+            minimized, chars_saved, tokens_saved = minimizer.minimize(prompt)
+            ```
+        """
+        if not self._needs_minimization(prompt):
+            return prompt, 0, 0
+        
+        cache = self._result_cache
+        cacheable = self.result_cache_size > 0 and len(prompt) <= _MAX_CACHED_PROMPT_LENGTH
+        minimized_prompt = cache.get(prompt) if cacheable else None
+        
+        if minimized_prompt is not None:
+            cache.move_to_end(prompt)
+            self._cache_hits += 1
+        else:
+            # Detect code blocks if preservation is enabled
+            code_ranges = []
+            if self.preserve_code_blocks:
+                code_ranges = self._detect_code_blocks(prompt)
+            
+            # Minimize whitespace
+            minimized_prompt = self._minimize_whitespace(prompt, code_ranges)
+            
+            if cacheable:
+                self._cache_misses += 1
+                cache[prompt] = minimized_prompt
+                if len(cache) > self.result_cache_size:
+                    cache.popitem(last=False)
+        
+        if minimized_prompt == prompt:
+            return prompt, 0, 0
+        
+        # Update statistics
+        self._total_requests += 1
+        chars_removed = len(prompt) - len(minimized_prompt)
+        # Minimizing never lengthens the text; 1 token ≈ 4 characters
+        tokens_saved = chars_removed >> 2
+        
+        self._total_chars_removed += chars_removed
+        
+        return minimized_prompt, chars_removed, tokens_saved
+    
+    def minimize_many(self, prompts: Iterable[str]) -> list[tuple[str, int, int]]:
         """
-        Estimate token savings from minimization.
+        Minimize a batch of prompts synchronously.
+        
+        Equivalent to calling minimize() on each prompt in turn, sharing the
+        result cache and statistics, without per-prompt addon overhead.
         
         Args:
-            original: Original text
-            minimized: Minimized text
+            prompts: Prompts to minimize
             
         Returns:
-            Estimated tokens saved (roughly, 1 token ≈ 4 characters)
+            One (minimized prompt, characters removed, estimated tokens saved)
+            tuple per prompt, in order
+        
+        Example:
+            ```python
+            minimizer = WhitespaceMinimizerAddon()
+            for minimized, chars_saved, _ in minimizer.minimize_many(prompts):
+                print(chars_saved)
+            ```
         """
-        chars_saved = len(original) - len(minimized)
-        # Rough estimation: 1 token ≈ 4 characters
-        tokens_saved = chars_saved // 4
-        return max(0, tokens_saved)
+        # Each prompt is minimized on its own: joining them for one regex
+        # pass would let code fences and line-end stripping cross prompts
+        minimize = self.minimize
+        return [minimize(prompt) for prompt in prompts]
     
     async def pre_request(
         self,
@@ -250,6 +447,25 @@ class WhitespaceMinimizerAddon(BaseAddon):
         """
         Minimize whitespace in prompt before request.
         
+        Delegates to pre_request_sync() and never awaits.
+        
+        Args:
+            prompt: The prompt
+            context: Addon context
+            
+        Returns:
+            Minimized prompt (None means continue with original)
+        """
+        return self.pre_request_sync(prompt, context)
+    
+    def pre_request_sync(
+        self,
+        prompt: str,
+        context: AddonContext
+    ) -> Optional[str]:
+        """
+        Minimize whitespace in prompt before request, without awaiting.
+        
         Args:
             prompt: The prompt
             context: Addon context
@@ -261,32 +477,17 @@ class WhitespaceMinimizerAddon(BaseAddon):
             return None
         
         # Store original prompt in context
-        original_prompt = prompt
-        context.custom["whitespace_minimizer_original"] = original_prompt
-        
-        # Detect code blocks if preservation is enabled
-        code_ranges = []
-        if self.preserve_code_blocks:
-            code_ranges = self._detect_code_blocks(original_prompt)
+        context.custom["whitespace_minimizer_original"] = prompt
         
-        # Minimize whitespace
-        minimized_prompt = self._minimize_whitespace(original_prompt, code_ranges)
+        minimized_prompt, chars_removed, tokens_saved = self.minimize(prompt)
         
-        # If nothing changed, return None to avoid unnecessary modifications
-        if minimized_prompt == original_prompt:
+        # minimize() hands back the prompt object itself when nothing changed,
+        # so an identity check is enough to signal "continue with original"
+        if minimized_prompt is prompt:
             return None
         
-        # Update statistics
-        self._total_requests += 1
-        chars_removed = len(original_prompt) - len(minimized_prompt)
-        tokens_saved = self._estimate_token_savings(original_prompt, minimized_prompt)
-        
-        self._total_chars_removed += chars_removed
-        self._total_token_savings += tokens_saved
-        
         # Store stats in context
-        context.custom["whitespace_minimizer_chars_saved"] = chars_removed
-        context.custom["whitespace_minimizer_tokens_saved"] = tokens_saved
+        context.custom["whitespace_stats"] = WhitespaceStats(chars_removed, tokens_saved)
         context.custom["whitespace_minimizer_minimized"] = True
         
         return minimized_prompt
@@ -325,7 +526,8 @@ class WhitespaceMinimizerAddon(BaseAddon):
         """Reset all statistics."""
         self._total_requests = 0
         self._total_chars_removed = 0
-        self._total_token_savings = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
     
     def get_stats(self) -> dict[str, Any]:
         """
@@ -335,17 +537,21 @@ class WhitespaceMinimizerAddon(BaseAddon):
             Dictionary with stats including:
             - total_requests: Number of requests processed
             - total_chars_removed: Total characters removed
-            - total_tokens_saved: Estimated total tokens saved
+            - total_tokens_saved: Estimated total tokens saved, derived from
+              the characters removed (1 token ≈ 4 characters)
             - average_chars_per_request: Average chars removed per request
             - average_tokens_per_request: Average tokens saved per request
+            - cache_hits: Prompts whose minimized form came from the result cache
+            - cache_misses: Cacheable prompts that had to be minimized
         """
         avg_chars = (
             self._total_chars_removed / self._total_requests
             if self._total_requests > 0
             else 0
         )
+        total_tokens = self._total_chars_removed >> 2
         avg_tokens = (
-            self._total_token_savings / self._total_requests
+            total_tokens / self._total_requests
             if self._total_requests > 0
             else 0
         )
@@ -353,8 +559,10 @@ class WhitespaceMinimizerAddon(BaseAddon):
         return {
             "total_requests": self._total_requests,
             "total_chars_removed": self._total_chars_removed,
-            "total_tokens_saved": self._total_token_savings,
+            "total_tokens_saved": total_tokens,
             "average_chars_per_request": avg_chars,
             "average_tokens_per_request": avg_tokens,
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
         }
 
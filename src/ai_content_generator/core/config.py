@@ -1,15 +1,47 @@
 """Configuration management with Pydantic validation."""
 
 import os
+import re
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
-from dotenv import load_dotenv
 from pydantic import BaseModel, Field, field_validator
 
 from ai_content_generator.core.exceptions import ConfigurationError
 
+# ${VAR_NAME} references interpolated from the environment
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+# Provider names and the environment variables holding their API keys
+_PROVIDER_API_KEY_VARS = (
+    ("openai", "OPENAI_API_KEY"),
+    ("anthropic", "ANTHROPIC_API_KEY"),
+)
+
+
+def _parse_budget(value: str) -> Optional[float]:
+    """Parse a budget variable, treating an empty value as no budget."""
+    return float(value) if value else None
+
+
+def _parse_flag(value: str) -> bool:
+    """Parse a boolean variable; only "true" (any case) enables it."""
+    return value.lower() == "true"
+
+
+# (section, field, environment variable, parser) for Config.from_env
+_ENV_SETTINGS = (
+    ("session", "default_budget_usd", "AI_CONTENT_GEN_DEFAULT_BUDGET", _parse_budget),
+    ("session", "default_provider", "AI_CONTENT_GEN_DEFAULT_PROVIDER", str),
+    ("session", "default_model", "AI_CONTENT_GEN_DEFAULT_MODEL", str),
+    ("logging", "level", "AI_CONTENT_GEN_LOG_LEVEL", str),
+    ("logging", "file_path", "AI_CONTENT_GEN_LOG_FILE", str),
+    ("cache", "enabled", "AI_CONTENT_GEN_ENABLE_CACHE", _parse_flag),
+    ("cache", "ttl", "AI_CONTENT_GEN_CACHE_TTL", int),
+    ("cache", "max_size", "AI_CONTENT_GEN_CACHE_MAX_SIZE", int),
+    ("cache", "path", "AI_CONTENT_GEN_CACHE_PATH", str),
+)
+
 
 class ModelConfig(BaseModel):
     """Configuration for a specific model."""
@@ -37,6 +69,7 @@ class SessionConfig(BaseModel):
     default_provider: str = "openai"
     default_model: Optional[str] = None
     dry_run: bool = False
+    capture_addon_errors: bool = False  # Keep failed addon hooks in request contexts
     alerts: list[float] = Field(
         default_factory=lambda: [0.5, 0.75, 0.9],
         description="Budget alert thresholds (0.0 to 1.0)",
@@ -80,10 +113,12 @@ class LoggingConfig(BaseModel):
 class CacheConfig(BaseModel):
     """Cache configuration."""
 
-    enabled: bool = True
+    # Opt-in: factory sessions share one response cache only when enabled
+    enabled: bool = False
     ttl: int = Field(default=3600, gt=0, description="Time to live in seconds")
     max_size: int = Field(default=100, gt=0, description="Maximum cache entries")
     strategy: str = "lru"  # LRU eviction strategy
+    path: Optional[str] = None  # JSON file to persist entries to (None keeps them in memory)
 
     @field_validator("strategy")
     @classmethod
@@ -139,6 +174,9 @@ class Config(BaseModel):
             config = Config.from_file("config/config.yaml")
             ```
         """
+        # Imported here so that importing the package does not load PyYAML
+        import yaml
+
         filepath = Path(filepath)
 
         if not filepath.exists():
@@ -154,13 +192,13 @@ class Config(BaseModel):
             # Interpolate environment variables
             content = cls._interpolate_env_vars(content)
 
-            # Parse YAML
-            data = yaml.safe_load(content)
+            # Parse YAML with libyaml's C loader when PyYAML was built with it
+            data = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
             if data is None:
                 data = {}
 
-            return cls(**data)
+            return cls.model_validate(data)
 
         except yaml.YAMLError as e:
             raise ConfigurationError(
@@ -191,55 +229,38 @@ class Config(BaseModel):
         """
         # Load .env file if provided
         if env_file:
+            from dotenv import load_dotenv
+
             load_dotenv(env_file)
 
         # Build configuration from environment variables
-        providers_config: dict[str, Any] = {}
-
-        # OpenAI provider
-        if openai_key := os.getenv("OPENAI_API_KEY"):
-            providers_config["openai"] = {
-                "api_key": openai_key,
-                "timeout": int(os.getenv("AI_CONTENT_GEN_TIMEOUT", "60")),
-                "max_retries": int(os.getenv("AI_CONTENT_GEN_MAX_RETRIES", "3")),
-            }
+        env = os.environ
 
-        # Anthropic provider
-        if anthropic_key := os.getenv("ANTHROPIC_API_KEY"):
-            providers_config["anthropic"] = {
-                "api_key": anthropic_key,
-                "timeout": int(os.getenv("AI_CONTENT_GEN_TIMEOUT", "60")),
-                "max_retries": int(os.getenv("AI_CONTENT_GEN_MAX_RETRIES", "3")),
-            }
-
-        # Session configuration
-        session_config = {
-            "default_budget_usd": (
-                float(budget) if (budget := os.getenv("AI_CONTENT_GEN_DEFAULT_BUDGET")) else None
-            ),
-            "default_provider": os.getenv("AI_CONTENT_GEN_DEFAULT_PROVIDER", "openai"),
-            "default_model": os.getenv("AI_CONTENT_GEN_DEFAULT_MODEL"),
-        }
-
-        # Logging configuration
-        logging_config = {
-            "level": os.getenv("AI_CONTENT_GEN_LOG_LEVEL", "INFO"),
-            "file_path": os.getenv("AI_CONTENT_GEN_LOG_FILE", "logs/ai_content_generator.log"),
+        # Providers with an API key set share the timeout and retry settings
+        api_keys = {
+            name: api_key
+            for name, key_var in _PROVIDER_API_KEY_VARS
+            if (api_key := env.get(key_var))
         }
+        providers_config: dict[str, Any] = {}
+        if api_keys:
+            timeout = int(env.get("AI_CONTENT_GEN_TIMEOUT", "60"))
+            max_retries = int(env.get("AI_CONTENT_GEN_MAX_RETRIES", "3"))
+            providers_config = {
+                name: {"api_key": api_key, "timeout": timeout, "max_retries": max_retries}
+                for name, api_key in api_keys.items()
+            }
 
-        # Cache configuration
-        cache_config = {
-            "enabled": os.getenv("AI_CONTENT_GEN_ENABLE_CACHE", "true").lower() == "true",
-            "ttl": int(os.getenv("AI_CONTENT_GEN_CACHE_TTL", "3600")),
-            "max_size": int(os.getenv("AI_CONTENT_GEN_CACHE_MAX_SIZE", "100")),
-        }
+        # Only variables that are set are passed on; every other field keeps
+        # its model default, which is the value from_env falls back to
+        data: dict[str, dict[str, Any]] = {"providers": providers_config}
+        for section, field, env_var, parse in _ENV_SETTINGS:
+            value = env.get(env_var)
+            if value is not None:
+                data.setdefault(section, {})[field] = parse(value)
 
-        return cls(
-            providers=providers_config,
-            session=SessionConfig(**session_config),
-            logging=LoggingConfig(**logging_config),
-            cache=CacheConfig(**cache_config),
-        )
+        # One validation pass over the whole tree
+        return cls.model_validate(data)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Config":
@@ -275,13 +296,20 @@ class Config(BaseModel):
         Returns:
             Content with environment variables interpolated
         """
-        import re
+        if "${" not in content:
+            return content
+
+        # Each distinct variable is looked up once, however often it is referenced
+        values: dict[str, str] = {}
 
         def replace_env_var(match: re.Match[str]) -> str:
-            var_name = match.group(1)
-            return os.getenv(var_name, match.group(0))
+            reference = match.group(0)
+            value = values.get(reference)
+            if value is None:
+                value = values[reference] = os.environ.get(match.group(1), reference)
+            return value
 
-        return re.sub(r"\$\{([^}]+)\}", replace_env_var, content)
+        return _ENV_VAR_RE.sub(replace_env_var, content)
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -6,6 +6,8 @@ from typing import Any, Optional
 class AIContentGeneratorError(Exception):
     """Base exception for all AI Content Generator errors."""
 
+    __slots__ = ("message", "context", "_str_cache")
+
     def __init__(self, message: str, context: Optional[dict[str, Any]] = None) -> None:
         """
         Initialize the exception.
@@ -16,10 +18,27 @@ class AIContentGeneratorError(Exception):
         """
         self.message = message
         self.context = context or {}
+        self._str_cache: Optional[str] = None
         super().__init__(self.message)
 
     def __str__(self) -> str:
-        """Return string representation of the error."""
+        """Return string representation of the error, rendered once and cached."""
+        if self._str_cache is None:
+            self._str_cache = self._format()
+        return self._str_cache
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Include slot attributes, which BaseException only takes from __dict__."""
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+            if hasattr(self, name)
+        }
+        return type(self), self.args, state
+
+    def _format(self) -> str:
+        """Render the message and context."""
         if self.context:
             context_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
             return f"{self.message} (Context: {context_str})"
@@ -29,6 +48,8 @@ class AIContentGeneratorError(Exception):
 class ConfigurationError(AIContentGeneratorError):
     """Raised when there's an issue with configuration."""
 
+    __slots__ = ()
+
     def __init__(
         self, message: str = "Configuration error occurred", context: Optional[dict[str, Any]] = None
     ) -> None:
@@ -39,6 +60,8 @@ class ConfigurationError(AIContentGeneratorError):
 class ValidationError(AIContentGeneratorError):
     """Raised when validation fails."""
 
+    __slots__ = ("errors",)
+
     def __init__(
         self,
         message: str = "Validation failed",
@@ -56,9 +79,9 @@ class ValidationError(AIContentGeneratorError):
         self.errors = errors or []
         super().__init__(message, context)
 
-    def __str__(self) -> str:
-        """Return string representation including validation errors."""
-        base_str = super().__str__()
+    def _format(self) -> str:
+        """Render the message, context and validation errors."""
+        base_str = super()._format()
         if self.errors:
             errors_str = "\n  - ".join(self.errors)
             return f"{base_str}\nValidation errors:\n  - {errors_str}"
@@ -68,6 +91,8 @@ class ValidationError(AIContentGeneratorError):
 class ProviderError(AIContentGeneratorError):
     """Raised when there's an issue with a provider."""
 
+    __slots__ = ("provider",)
+
     def __init__(
         self,
         message: str = "Provider error occurred",
@@ -83,16 +108,16 @@ class ProviderError(AIContentGeneratorError):
             context: Additional context
         """
         self.provider = provider
-        if context is None:
-            context = {}
         if provider:
-            context["provider"] = provider
+            context = {**context, "provider": provider} if context else {"provider": provider}
         super().__init__(message, context)
 
 
 class BudgetExceededError(AIContentGeneratorError):
     """Raised when budget limit is exceeded."""
 
+    __slots__ = ("budget", "cost")
+
     def __init__(
         self,
         budget: float,
@@ -113,15 +138,16 @@ class BudgetExceededError(AIContentGeneratorError):
         self.cost = cost
         if message is None:
             message = f"Budget exceeded: ${cost:.4f} exceeds limit of ${budget:.4f}"
-        if context is None:
-            context = {}
-        context.update({"budget": budget, "cost": cost, "exceeded_by": cost - budget})
+        details = {"budget": budget, "cost": cost, "exceeded_by": cost - budget}
+        context = {**context, **details} if context else details
         super().__init__(message, context)
 
 
 class APIKeyMissingError(ConfigurationError):
     """Raised when an API key is missing."""
 
+    __slots__ = ("provider",)
+
     def __init__(
         self, provider: str, message: Optional[str] = None, context: Optional[dict[str, Any]] = None
     ) -> None:
@@ -139,15 +165,15 @@ class APIKeyMissingError(ConfigurationError):
                 f"API key for provider '{provider}' is missing. "
                 f"Please set it in your configuration or environment variables."
             )
-        if context is None:
-            context = {}
-        context["provider"] = provider
+        context = {**context, "provider": provider} if context else {"provider": provider}
         super().__init__(message, context)
 
 
 class ConnectionError(ProviderError):
     """Raised when there's a connection issue with a provider."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Failed to connect to provider",
@@ -161,6 +187,8 @@ class ConnectionError(ProviderError):
 class RateLimitError(ProviderError):
     """Raised when rate limit is exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -178,10 +206,10 @@ class RateLimitError(ProviderError):
             context: Additional context
         """
         self.retry_after = retry_after
-        if context is None:
-            context = {}
         if retry_after is not None:
-            context["retry_after"] = retry_after
+            context = (
+                {**context, "retry_after": retry_after} if context else {"retry_after": retry_after}
+            )
             message = f"{message} (retry after {retry_after}s)"
         super().__init__(message, provider, context)
 
@@ -189,6 +217,8 @@ class RateLimitError(ProviderError):
 class ModelNotFoundError(ProviderError):
     """Raised when a specified model is not found or not available."""
 
+    __slots__ = ("model",)
+
     def __init__(
         self,
         model: str,
@@ -207,17 +237,20 @@ class ModelNotFoundError(ProviderError):
         """
         self.model = model
         if message is None:
-            provider_str = f" for provider '{provider}'" if provider else ""
-            message = f"Model '{model}' not found{provider_str}"
-        if context is None:
-            context = {}
-        context["model"] = model
+            message = (
+                f"Model '{model}' not found for provider '{provider}'"
+                if provider
+                else f"Model '{model}' not found"
+            )
+        context = {**context, "model": model} if context else {"model": model}
         super().__init__(message, provider, context)
 
 
 class TokenLimitError(ProviderError):
     """Raised when token limit is exceeded."""
 
+    __slots__ = ("tokens", "limit")
+
     def __init__(
         self,
         tokens: int,
@@ -240,15 +273,16 @@ class TokenLimitError(ProviderError):
         self.limit = limit
         if message is None:
             message = f"Token limit exceeded: {tokens} tokens exceeds limit of {limit}"
-        if context is None:
-            context = {}
-        context.update({"tokens": tokens, "limit": limit, "exceeded_by": tokens - limit})
+        details = {"tokens": tokens, "limit": limit, "exceeded_by": tokens - limit}
+        context = {**context, **details} if context else details
         super().__init__(message, provider, context)
 
 
 class AddonError(AIContentGeneratorError):
     """Raised when an addon encounters an error."""
 
+    __slots__ = ("addon_name",)
+
     def __init__(
         self,
         addon_name: str,
@@ -264,8 +298,6 @@ class AddonError(AIContentGeneratorError):
             context: Additional context
         """
         self.addon_name = addon_name
-        if context is None:
-            context = {}
-        context["addon"] = addon_name
+        context = {**context, "addon": addon_name} if context else {"addon": addon_name}
         super().__init__(message, context)
 
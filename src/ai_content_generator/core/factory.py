@@ -1,11 +1,19 @@
 """Factory for creating sessions and managing providers."""
 
+import sys
 from typing import Any, Optional
 
+from ai_content_generator.addons.cache import CacheAddon
 from ai_content_generator.core.config import Config
 from ai_content_generator.core.exceptions import APIKeyMissingError, ConfigurationError
 from ai_content_generator.core.provider import BaseProvider
 from ai_content_generator.core.session import LLMSession
+from ai_content_generator.providers import PROVIDER_REGISTRY, list_providers
+
+
+def _intern_name(name: str) -> str:
+    """Intern a provider name; str subclasses, which sys.intern rejects, are kept as given."""
+    return sys.intern(name) if type(name) is str else name
 
 
 class SessionFactory:
@@ -31,7 +39,9 @@ class SessionFactory:
             ```
         """
         self.config = config or Config.from_env()
-        self._provider_cache: dict[str, BaseProvider] = {}
+        # Keyed by provider name, or by (name, overrides) when overrides are given
+        self._provider_cache: dict[Any, BaseProvider] = {}
+        self._cache_addon: Optional[CacheAddon] = None
 
     def get_provider(self, name: str, **override_kwargs: Any) -> BaseProvider:
         """
@@ -53,10 +63,22 @@ class SessionFactory:
             provider = factory.get_provider("openai")
             ```
         """
-        # Check if provider is already cached
-        cache_key = f"{name}_{hash(frozenset(override_kwargs.items()))}"
-        if cache_key in self._provider_cache:
-            return self._provider_cache[cache_key]
+        # Names from config files or the environment are fresh strings;
+        # interning them lets the cache lookups below match keys by identity
+        name = _intern_name(name)
+
+        # Reuse a cached provider unless it was closed. Override values are keyed by
+        # repr() so that unhashable values (e.g. dicts) work too
+        if override_kwargs:
+            cache_key: Any = (
+                name,
+                tuple(sorted((key, repr(value)) for key, value in override_kwargs.items())),
+            )
+        else:
+            cache_key = name
+        provider = self._provider_cache.get(cache_key)
+        if provider is not None and not provider.is_closed:
+            return provider
 
         # Get provider configuration
         provider_config = self.config.get_provider_config(name)
@@ -101,18 +123,39 @@ class SessionFactory:
         Raises:
             ConfigurationError: If provider is not found
         """
-        # Import provider registry
-        from ai_content_generator.providers import PROVIDER_REGISTRY, list_providers
-
-        name_lower = name.lower()
-        if name_lower not in PROVIDER_REGISTRY:
-            available = list_providers()
+        provider_class = PROVIDER_REGISTRY.get(name.lower())
+        if provider_class is None:
             raise ConfigurationError(
                 f"Unknown provider: {name}",
-                context={"provider": name, "supported_providers": available},
+                context={"provider": name, "supported_providers": list_providers()},
             )
 
-        return PROVIDER_REGISTRY[name_lower]
+        return provider_class
+
+    def get_cache_addon(self) -> CacheAddon:
+        """
+        Get the response cache shared by every session of this factory.
+
+        The addon is built lazily from the `cache` section of the config, so
+        identical requests made through different sessions hit one cache.
+
+        Returns:
+            CacheAddon instance
+
+        Example:
+            ```python
+            stats = factory.get_cache_addon().get_stats()
+            print(f"Cache hit rate: {stats['hit_rate']:.0%}")
+            ```
+        """
+        if self._cache_addon is None:
+            cache_config = self.config.cache
+            self._cache_addon = CacheAddon(
+                max_size=cache_config.max_size,
+                ttl_seconds=cache_config.ttl,
+                persist_path=cache_config.path,
+            )
+        return self._cache_addon
 
     def create_session(
         self,
@@ -159,7 +202,7 @@ class SessionFactory:
             ```
         """
         # Use defaults from config if not specified
-        provider_name = provider or self.config.session.default_provider
+        provider_name = _intern_name(provider or self.config.session.default_provider)
         model_name = model or self.config.session.default_model
 
         # If model is still None, try to get default from provider config
@@ -192,14 +235,18 @@ class SessionFactory:
             budget_usd=budget_usd,
             dry_run=dry_run,
             metadata=metadata,
+            capture_addon_errors=self.config.session.capture_addon_errors,
         )
 
-        # Set up default alerts from config
-        for threshold in self.config.session.alerts:
-            session.set_alert(
-                threshold=threshold,
-                callback=self._default_alert_callback,
-            )
+        # Register the shared response cache when enabled in config
+        if self.config.cache.enabled:
+            session.add_addon(self.get_cache_addon())
+
+        # Set up default alerts from config, registered in one sorted batch
+        alerts = self.config.session.alerts
+        if alerts:
+            callback = self._default_alert_callback
+            session.set_alerts([(threshold, callback) for threshold in alerts])
 
         return session
 
@@ -212,9 +259,10 @@ class SessionFactory:
             current_cost: Current spending
             budget: Budget limit
         """
-        percentage = (current_cost / budget) * 100
-        print(
-            f"⚠️  Budget Alert: ${current_cost:.4f} / ${budget:.2f} ({percentage:.1f}%) used"
+        # Looked up per call so that redirected or captured stdout is honoured
+        sys.stdout.write(
+            f"⚠️  Budget Alert: ${current_cost:.4f} / ${budget:.2f} "
+            f"({current_cost * 100 / budget:.1f}%) used\n"
         )
 
     def list_available_providers(self) -> list[str]:
@@ -241,6 +289,39 @@ class SessionFactory:
         """
         self._provider_cache.clear()
 
+    async def close(self) -> None:
+        """
+        Close every cached provider and clear the cache.
+
+        Also writes the shared response cache to its persist file, if any.
+
+        Sessions created by this factory share the cached provider (and its
+        pooled HTTP client), so close the factory once all of its sessions
+        are finished rather than closing providers per session.
+
+        Example:
+            ```python
+            async with SessionFactory(config) as factory:
+                async with factory.create_session() as session:
+                    response = await session.chat("Hello!")
+            ```
+        """
+        if self._cache_addon is not None:
+            self._cache_addon.flush()
+
+        providers = list(self._provider_cache.values())
+        self._provider_cache.clear()
+        for provider in providers:
+            await provider.close()
+
+    async def __aenter__(self) -> "SessionFactory":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit - closes cached providers."""
+        await self.close()
+
     def __repr__(self) -> str:
         """String representation of the factory."""
         providers = self.list_available_providers()
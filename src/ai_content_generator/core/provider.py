@@ -1,8 +1,12 @@
 """Base provider interface for LLM providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Mapping
 from typing import Any, Optional
 
+from ai_content_generator.core.exceptions import ProviderError
+
 
 class BaseProvider(ABC):
     """
@@ -33,6 +37,7 @@ class BaseProvider(ABC):
         self.max_retries = max_retries
         self.extra_config = kwargs
         self._is_connected = False
+        self._is_closed = False
 
     @property
     @abstractmethod
@@ -47,12 +52,15 @@ class BaseProvider(ABC):
 
     @property
     @abstractmethod
-    def supported_models(self) -> list[str]:
+    def supported_models(self) -> tuple[str, ...]:
         """
-        Get list of supported model names.
+        Get the supported model names.
+
+        Implementations should return a tuple built once (e.g. at module
+        level) rather than a new list per call.
 
         Returns:
-            List of model identifiers supported by this provider
+            Tuple of model identifiers supported by this provider
         """
         pass
 
@@ -66,6 +74,16 @@ class BaseProvider(ABC):
         """
         return self._is_connected
 
+    @property
+    def is_closed(self) -> bool:
+        """
+        Check if the provider has been closed.
+
+        Returns:
+            True once close() has run; the instance cannot be used afterwards
+        """
+        return self._is_closed
+
     @abstractmethod
     async def validate_connection(self) -> bool:
         """
@@ -88,17 +106,21 @@ class BaseProvider(ABC):
         pass
 
     @abstractmethod
-    async def list_models(self) -> list[dict[str, Any]]:
+    async def list_models(self) -> tuple[Mapping[str, Any], ...]:
         """
-        Get list of available models with their metadata.
+        Get the available models with their metadata.
+
+        Implementations should build the catalog once and return the same
+        tuple of read-only mappings (e.g. `types.MappingProxyType`) on every
+        call. Callers that need to modify an entry should copy it with dict().
 
         Returns:
-            List of dictionaries containing model information:
+            Tuple of mappings containing model information:
             - name: Model identifier
             - context_window: Maximum context window size
             - input_price_per_1m: Price per 1M input tokens in USD
             - output_price_per_1m: Price per 1M output tokens in USD
-            - capabilities: List of model capabilities
+            - capabilities: Tuple of model capabilities
 
         Example:
             ```python
@@ -123,7 +145,7 @@ class BaseProvider(ABC):
             - context_window: Maximum context window size
             - input_price_per_1m: Price per 1M input tokens in USD
             - output_price_per_1m: Price per 1M output tokens in USD
-            - capabilities: List of model capabilities
+            - capabilities: Tuple of model capabilities
             - description: Model description
 
         Raises:
@@ -162,6 +184,8 @@ class BaseProvider(ABC):
             - model: Model used
             - input_tokens: Number of input tokens
             - output_tokens: Number of output tokens
+            - cached_input_tokens: Input tokens served from the provider's
+              prompt cache, when the provider reports them
             - finish_reason: Reason for completion
             - raw_response: Original provider response
 
@@ -183,6 +207,49 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream a chat completion as it is generated.
+
+        Providers without native streaming support fall back to chat() and
+        yield the whole response as a single chunk.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            model: Model identifier to use
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Chunk dictionaries containing:
+            - content: Text generated since the previous chunk
+            - finish_reason: Reason for completion, on the last content chunk
+            - input_tokens / output_tokens / cached_input_tokens: Token usage,
+              on the chunk that reports it
+
+        Example:
+            ```python
+            async for chunk in provider.chat_stream(messages, model="gpt-4o-mini"):
+                print(chunk["content"], end="", flush=True)
+            ```
+        """
+        response = await self.chat(messages, model, temperature, max_tokens, **kwargs)
+        yield {
+            "content": response["content"],
+            "finish_reason": response.get("finish_reason"),
+            "input_tokens": response.get("input_tokens", 0),
+            "output_tokens": response.get("output_tokens", 0),
+            "cached_input_tokens": response.get("cached_input_tokens", 0),
+        }
+
     @abstractmethod
     async def count_tokens(self, text: str, model: str) -> int:
         """
@@ -236,14 +303,24 @@ class BaseProvider(ABC):
         pass
 
     @abstractmethod
-    def calculate_cost(self, input_tokens: int, output_tokens: int, model: str) -> float:
+    def calculate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+        cached_input_tokens: int = 0,
+    ) -> float:
         """
         Calculate the actual cost of a completed request.
 
         Args:
-            input_tokens: Number of input tokens used
+            input_tokens: Number of input tokens used (including cached ones)
             output_tokens: Number of output tokens generated
             model: Model identifier
+            cached_input_tokens: Portion of input_tokens served from the
+                provider's prompt cache, billed at the provider's cached rate.
+                Every implementation must accept it; callers may leave it out
+                when no tokens were cached
 
         Returns:
             Total cost in USD
@@ -260,15 +337,72 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def prewarm(self, n: int = 4) -> None:
+        """
+        Open pooled connections before the first real request.
+
+        Fires `n` concurrent lightweight requests so that the TCP and TLS
+        handshakes are paid up front and later calls reuse keep-alive
+        connections. Failures are ignored; the next real request reports them.
+
+        Args:
+            n: Number of connections to open
+
+        Example:
+            ```python
+            provider = OpenAIProvider(api_key="sk-...")
+            await provider.prewarm()
+            ```
+        """
+        await asyncio.gather(*(self._prewarm_request() for _ in range(n)), return_exceptions=True)
+
+    # Optional hook with a no-op default, so providers without a cheap
+    # endpoint need not implement it
+    async def _prewarm_request(self) -> None:  # noqa: B027
+        """
+        Send one lightweight request that opens a pooled connection.
+
+        Subclasses override this with a cheap call to their API. The default
+        sends nothing, which makes prewarm() a no-op.
+        """
+        return None
+
+    async def close(self) -> None:
+        """
+        Release the underlying HTTP client.
+
+        Providers keep a single pooled client for their whole lifetime, so
+        every call reuses open connections. Call this (or use the provider as
+        an async context manager) once you are done with the instance.
+
+        Implementations release their client and then call `super().close()`,
+        which marks the instance closed and forgets the connection check.
+        SessionFactory and get_shared_provider() replace closed instances.
+        """
+        self._is_closed = True
+        self.invalidate_connection()
+
+    def invalidate_connection(self) -> None:
+        """
+        Forget a previous successful connection check.
+
+        The next `async with provider:` validates the connection again.
+        """
+        self._is_connected = False
+
     async def __aenter__(self) -> "BaseProvider":
-        """Async context manager entry."""
-        await self.validate_connection()
+        """Async context manager entry - validates the connection unless already validated."""
+        if self._is_closed:
+            raise ProviderError(
+                "Provider has been closed; create a new instance", provider=self.provider_name
+            )
+        if not self._is_connected:
+            await self.validate_connection()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
-        # Cleanup if needed
-        pass
+        await self.close()
 
     def __repr__(self) -> str:
         """String representation of the provider."""
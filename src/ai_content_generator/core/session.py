@@ -5,7 +5,7 @@ import json
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional
 from uuid import uuid4
 
 from ai_content_generator.addons import AddonManager, AddonContext
@@ -16,6 +16,11 @@ from ai_content_generator.monitoring.alerts import AlertManager
 from ai_content_generator.monitoring.cost_tracker import CostTracker
 from ai_content_generator.monitoring.token_monitor import TokenMonitor
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "performance" extra
+    orjson = None
+
 
 class LLMSession:
     """
@@ -32,6 +37,7 @@ class LLMSession:
         budget_usd: Optional[float] = None,
         dry_run: bool = False,
         metadata: Optional[dict[str, Any]] = None,
+        capture_addon_errors: bool = False,
     ) -> None:
         """
         Initialize an LLM session.
@@ -42,6 +48,8 @@ class LLMSession:
             budget_usd: Budget limit in USD (None for unlimited)
             dry_run: If True, simulate requests without calling the API
             metadata: Optional metadata to attach to the session
+            capture_addon_errors: Keep failed addon hooks in each request's
+                context (see AddonContext.format_errors()) for debugging
 
         Example:
             ```python
@@ -58,6 +66,7 @@ class LLMSession:
         self.model = model
         self.dry_run = dry_run
         self.metadata = metadata or {}
+        self.capture_addon_errors = capture_addon_errors
 
         # Monitoring components
         self.token_monitor = TokenMonitor()
@@ -294,7 +303,7 @@ class LLMSession:
             - If is_final_response=False and result not None, text was modified
             - If result is None, text unchanged
         """
-        has_addons = len(self.addon_manager.get_addons()) > 0
+        has_addons = self.addon_manager.has_addons()
         if not has_addons:
             return None, False
         
@@ -344,7 +353,7 @@ class LLMSession:
         context: AddonContext,
     ) -> dict[str, Any]:
         """Execute post-request addons."""
-        has_addons = len(self.addon_manager.get_addons()) > 0
+        has_addons = self.addon_manager.has_addons()
         if not has_addons:
             return response_dict
         
@@ -409,6 +418,7 @@ class LLMSession:
             - model: Model used
             - input_tokens: Number of input tokens
             - output_tokens: Number of output tokens
+            - cached_input_tokens: Input tokens billed at the provider's cached rate
             - cost_usd: Cost of this request
             - request_id: Unique request identifier
 
@@ -434,7 +444,7 @@ class LLMSession:
         request_start_time = datetime.now()
         
         # Check if we have addons - early exit optimization
-        has_addons = len(self.addon_manager.get_addons()) > 0
+        has_addons = self.addon_manager.has_addons()
         
         # Create addon context
         addon_context = AddonContext(
@@ -444,6 +454,13 @@ class LLMSession:
             provider=self.provider.provider_name,
             metadata={**self.metadata, **kwargs},
             start_time=request_start_time,
+            capture_errors=self.capture_addon_errors,
+            request_params={
+                "system_message": system_message,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                **kwargs,
+            },
         )
 
         # Execute pre-request addons for user prompt
@@ -459,7 +476,12 @@ class LLMSession:
                     input_tokens = await self.provider.count_tokens(original_prompt, self.model)
                     # Use accurate token counting instead of estimate
                     output_tokens = await self.provider.count_tokens(addon_result, self.model)
-                    cost = self.provider.calculate_cost(input_tokens, output_tokens, self.model)
+                    # Cache hits make no API call, so they cost nothing
+                    cost = (
+                        0.0
+                        if addon_context.custom.get("cache_hit")
+                        else self.provider.calculate_cost(input_tokens, output_tokens, self.model)
+                    )
 
                     self._record_metrics(input_tokens, output_tokens, cost, request_id)
 
@@ -472,6 +494,8 @@ class LLMSession:
                     )
                     
                     addon_context.end_time = datetime.now()
+                    # Lets post_request addons tell this apart from a provider response
+                    addon_context.custom["addon_response"] = True
                     response_dict = await self._execute_addon_post_request(response_dict, addon_context)
                     return response_dict
                 else:
@@ -493,6 +517,7 @@ class LLMSession:
                 provider=self.provider.provider_name,
                 metadata={**addon_context.metadata, "message_type": "system"},
                 start_time=request_start_time,
+                capture_errors=self.capture_addon_errors,
             )
             sys_result, sys_is_final = await self._execute_addon_pre_request(system_message, sys_context)
             if sys_result is not None and not sys_is_final:
@@ -567,7 +592,10 @@ class LLMSession:
         # Extract metrics
         input_tokens = response["input_tokens"]
         output_tokens = response["output_tokens"]
-        cost = self.provider.calculate_cost(input_tokens, output_tokens, self.model)
+        cached_input_tokens = response.get("cached_input_tokens", 0)
+        cost = self.provider.calculate_cost(
+            input_tokens, output_tokens, self.model, cached_input_tokens=cached_input_tokens
+        )
 
         # Record metrics
         self._record_metrics(input_tokens, output_tokens, cost, request_id)
@@ -579,6 +607,7 @@ class LLMSession:
             output_tokens=output_tokens,
             cost=cost,
             request_id=request_id,
+            cached_input_tokens=cached_input_tokens,
             finish_reason=response.get("finish_reason"),
         )
 
@@ -666,6 +695,20 @@ class LLMSession:
         """
         self.alert_manager.add_alert(threshold, callback)
 
+    def set_alerts(self, alerts: Iterable[tuple[float, Callable[[float, float], None]]]) -> None:
+        """
+        Set several budget alerts at once.
+
+        Args:
+            alerts: (threshold, callback) pairs, as accepted by set_alert
+
+        Example:
+            ```python
+            session.set_alerts([(0.5, on_budget_alert), (0.9, on_budget_alert)])
+            ```
+        """
+        self.alert_manager.add_alerts(alerts)
+
     def add_addon(self, addon: BaseAddon) -> None:
         """
         Add an addon to the session.
@@ -812,6 +855,12 @@ class LLMSession:
 
         data = self.export_to_dict()
 
+        if orjson is not None:
+            filepath.write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+            return
+
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
 
 @dataclass
@@ -68,6 +68,31 @@ class AlertManager:
         self._alerts.sort(key=lambda a: a.threshold)
         return alert
 
+    def add_alerts(
+        self, alerts: Iterable[tuple[float, Callable[[float, float], None]]]
+    ) -> list[Alert]:
+        """
+        Register several alerts, sorting the alert list once.
+
+        Args:
+            alerts: (threshold, callback) pairs, as accepted by add_alert
+
+        Returns:
+            The created Alert objects, in the order given
+
+        Raises:
+            ValueError: If any threshold is not between 0.0 and 1.0
+
+        Example:
+            ```python
+            manager.add_alerts([(0.5, on_alert), (0.9, on_alert)])
+            ```
+        """
+        created = [Alert(threshold=threshold, callback=callback) for threshold, callback in alerts]
+        self._alerts.extend(created)
+        self._alerts.sort(key=lambda a: a.threshold)
+        return created
+
     def check_alerts(self, current_cost: float, budget: float) -> list[Alert]:
         """
         Check if any alerts should be triggered.
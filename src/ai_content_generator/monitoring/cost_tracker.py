@@ -7,6 +7,16 @@ from typing import Optional
 from ai_content_generator.core.exceptions import BudgetExceededError
 
 
+# Costs are accounted in integer pico-dollars: per-token prices stay exact
+# and totals and budget checks are plain integer arithmetic
+_PICOS_PER_USD = 10**12
+
+
+def _to_picos(usd: float) -> int:
+    """Convert a USD amount to integer pico-dollars."""
+    return round(usd * _PICOS_PER_USD)
+
+
 @dataclass
 class CostRecord:
     """Record of cost for a single request."""
@@ -40,9 +50,10 @@ class CostTracker:
             ```
         """
         self._budget_usd = budget_usd
-        self._total_cost = 0.0
+        self._budget_picos = _to_picos(budget_usd) if budget_usd is not None else None
+        self._total_picos = 0
         self._cost_records: list[CostRecord] = []
-        self._cost_by_model: dict[str, float] = {}
+        self._picos_by_model: dict[str, int] = {}
 
     @property
     def budget_usd(self) -> Optional[float]:
@@ -55,6 +66,7 @@ class CostTracker:
         if value is not None and value < 0:
             raise ValueError("Budget must be non-negative")
         self._budget_usd = value
+        self._budget_picos = _to_picos(value) if value is not None else None
 
     def record_cost(
         self,
@@ -99,13 +111,12 @@ class CostTracker:
             output_tokens=output_tokens,
         )
 
+        picos = _to_picos(cost)
         self._cost_records.append(record)
-        self._total_cost += cost
+        self._total_picos += picos
 
         # Track by model
-        if model not in self._cost_by_model:
-            self._cost_by_model[model] = 0.0
-        self._cost_by_model[model] += cost
+        self._picos_by_model[model] = self._picos_by_model.get(model, 0) + picos
 
         return record
 
@@ -116,7 +127,7 @@ class CostTracker:
         Returns:
             Total cost in USD
         """
-        return self._total_cost
+        return self._total_picos / _PICOS_PER_USD
 
     def get_remaining_budget(self) -> Optional[float]:
         """
@@ -132,9 +143,9 @@ class CostTracker:
                 print(f"Remaining: ${remaining:.4f}")
             ```
         """
-        if self._budget_usd is None:
+        if self._budget_picos is None:
             return None
-        return max(0.0, self._budget_usd - self._total_cost)
+        return max(0, self._budget_picos - self._total_picos) / _PICOS_PER_USD
 
     def get_budget_usage_percentage(self) -> Optional[float]:
         """
@@ -143,9 +154,9 @@ class CostTracker:
         Returns:
             Percentage of budget used (0.0 to 1.0), or None if no budget is set
         """
-        if self._budget_usd is None or self._budget_usd == 0:
+        if not self._budget_picos:
             return None
-        return min(1.0, self._total_cost / self._budget_usd)
+        return min(1.0, self._total_picos / self._budget_picos)
 
     def check_budget_available(self, estimated_cost: float) -> bool:
         """
@@ -168,17 +179,17 @@ class CostTracker:
                 pass
             ```
         """
-        if self._budget_usd is None:
+        if self._budget_picos is None:
             return True
 
-        projected_cost = self._total_cost + estimated_cost
+        projected_picos = self._total_picos + _to_picos(estimated_cost)
 
-        if projected_cost > self._budget_usd:
+        if projected_picos > self._budget_picos:
             raise BudgetExceededError(
                 budget=self._budget_usd,
-                cost=projected_cost,
+                cost=projected_picos / _PICOS_PER_USD,
                 context={
-                    "current_cost": self._total_cost,
+                    "current_cost": self.get_total_cost(),
                     "estimated_cost": estimated_cost,
                 },
             )
@@ -208,15 +219,18 @@ class CostTracker:
             ```
         """
         request_count = len(self._cost_records)
-        avg_per_request = self._total_cost / request_count if request_count > 0 else 0
+        total_cost = self.get_total_cost()
+        avg_per_request = total_cost / request_count if request_count > 0 else 0
 
         return {
-            "total_cost": self._total_cost,
+            "total_cost": total_cost,
             "budget": self._budget_usd,
             "remaining_budget": self.get_remaining_budget(),
             "budget_usage_percentage": self.get_budget_usage_percentage(),
             "request_count": request_count,
-            "by_model": dict(self._cost_by_model),
+            "by_model": {
+                model: picos / _PICOS_PER_USD for model, picos in self._picos_by_model.items()
+            },
             "average_per_request": avg_per_request,
             "records": [
                 {
@@ -271,14 +285,14 @@ class CostTracker:
         The budget limit is preserved.
         """
         self._cost_records.clear()
-        self._total_cost = 0.0
-        self._cost_by_model.clear()
+        self._total_picos = 0
+        self._picos_by_model.clear()
 
     def __repr__(self) -> str:
         """String representation of the tracker."""
         budget_str = f"${self._budget_usd:.2f}" if self._budget_usd else "unlimited"
         return (
-            f"CostTracker(total_cost=${self._total_cost:.4f}, "
+            f"CostTracker(total_cost=${self.get_total_cost():.4f}, "
             f"budget={budget_str}, requests={len(self._cost_records)})"
         )
 
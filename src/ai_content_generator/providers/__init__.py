@@ -4,6 +4,7 @@ from typing import Any, Optional
 
 from .openai_provider import OpenAIProvider
 from .anthropic_provider import AnthropicProvider
+from ._shared import close_shared_providers, get_shared_provider
 from ..core.provider import BaseProvider
 from ..core.exceptions import ProviderError
 
@@ -35,18 +36,15 @@ def get_provider(name: str, **kwargs: Any) -> BaseProvider:
         response = await provider.chat(messages, model="gpt-4o-mini")
         ```
     """
-    name_lower = name.lower()
-
-    if name_lower not in PROVIDER_REGISTRY:
-        available = ", ".join(PROVIDER_REGISTRY.keys())
+    provider_class = PROVIDER_REGISTRY.get(name.lower())
+    if provider_class is None:
+        available = ", ".join(PROVIDER_REGISTRY)
         raise ProviderError(
             message=f"Provider '{name}' not found",
             provider=name,
             context={"available_providers": available},
         )
 
-    provider_class = PROVIDER_REGISTRY[name_lower]
-
     # Check if api_key is provided
     if "api_key" not in kwargs:
         raise ProviderError(
@@ -169,5 +167,7 @@ __all__ = [
     "register_provider",
     "get_all_available_models",
     "get_all_model_names",
+    "get_shared_provider",
+    "close_shared_providers",
     "PROVIDER_REGISTRY",
 ]
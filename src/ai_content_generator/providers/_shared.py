@@ -0,0 +1,66 @@
+"""Process-wide shared provider instances."""
+
+import os
+from typing import Optional
+
+from ..core.exceptions import APIKeyMissingError
+from ..core.provider import BaseProvider
+
+
+# Shared providers keyed by (provider name, API key)
+_SHARED_PROVIDERS: dict[tuple[str, str], BaseProvider] = {}
+
+
+def get_shared_provider(name: str, api_key: Optional[str] = None) -> BaseProvider:
+    """
+    Get a lazily created provider instance shared across the process.
+
+    Every caller asking for the same provider and API key gets the same
+    instance, so its HTTP connection pool and tokenizer state are reused
+    instead of rebuilt per script or per helper.
+
+    Args:
+        name: Name of the provider (e.g., "openai", "anthropic")
+        api_key: API key to use (defaults to the `<NAME>_API_KEY` environment variable)
+
+    Returns:
+        Shared provider instance
+
+    Raises:
+        APIKeyMissingError: If no API key is given or set in the environment
+        ProviderError: If the provider is not found
+
+    Example:
+        ```python
+        provider = get_shared_provider("openai")
+        response = await provider.chat(messages, model="gpt-5-nano")
+
+        # Once, at shutdown
+        await close_shared_providers()
+        ```
+    """
+    from . import get_provider
+
+    name_lower = name.lower()
+    api_key = api_key or os.getenv(f"{name_lower.upper()}_API_KEY")
+    if not api_key:
+        raise APIKeyMissingError(provider=name_lower)
+
+    key = (name_lower, api_key)
+    provider = _SHARED_PROVIDERS.get(key)
+    # A provider closed directly (e.g. by leaving `async with`) is replaced
+    if provider is None or provider.is_closed:
+        provider = _SHARED_PROVIDERS[key] = get_provider(name_lower, api_key=api_key)
+    return provider
+
+
+async def close_shared_providers() -> None:
+    """
+    Close every shared provider and forget it.
+
+    Later calls to get_shared_provider() create fresh instances.
+    """
+    providers = list(_SHARED_PROVIDERS.values())
+    _SHARED_PROVIDERS.clear()
+    for provider in providers:
+        await provider.close()
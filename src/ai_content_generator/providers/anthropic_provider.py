@@ -1,5 +1,8 @@
 """Anthropic provider implementation."""
 
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, Optional
 
 from anthropic import AsyncAnthropic, APIError, RateLimitError as AnthropicRateLimitError, APIConnectionError
@@ -49,6 +52,46 @@ MODEL_PRICING = {
     },
 }
 
+# Prompt cache reads are billed at a tenth of the regular input price
+CACHE_READ_PRICE_RATIO = 0.1
+
+
+# Model names in pricing order, shared by every supported_models lookup
+_SUPPORTED_MODELS = tuple(MODEL_PRICING)
+
+
+@functools.cache
+def _model_catalog() -> dict[str, dict[str, Any]]:
+    """
+    Build the model metadata once per process from MODEL_PRICING.
+
+    Returns:
+        Mapping of model name to its metadata dictionary. Callers must copy
+        entries or hand out read-only views, since the cache is shared.
+    """
+    return {
+        model_name: {
+            "name": model_name,
+            "context_window": pricing["context_window"],
+            "input_price_per_1m": pricing["input"],
+            "output_price_per_1m": pricing["output"],
+            "capabilities": ("chat", "vision"),
+            "description": pricing["description"],
+        }
+        for model_name, pricing in MODEL_PRICING.items()
+    }
+
+
+@functools.cache
+def _model_views() -> tuple[Mapping[str, Any], ...]:
+    """
+    Wrap each catalog entry in a read-only view once per process.
+
+    Returns:
+        Tuple of MappingProxyType views over the shared catalog entries
+    """
+    return tuple(MappingProxyType(model_info) for model_info in _model_catalog().values())
+
 
 class AnthropicProvider(BaseProvider):
     """
@@ -99,9 +142,9 @@ class AnthropicProvider(BaseProvider):
         return "anthropic"
 
     @property
-    def supported_models(self) -> list[str]:
-        """Get list of supported model names."""
-        return list(MODEL_PRICING.keys())
+    def supported_models(self) -> tuple[str, ...]:
+        """Get the supported model names."""
+        return _SUPPORTED_MODELS
 
     @staticmethod
     def get_available_models() -> list[dict[str, Any]]:
@@ -119,17 +162,7 @@ class AnthropicProvider(BaseProvider):
                 print(f"{model['name']}: {model['description']}")
             ```
         """
-        models = []
-        for model_name, pricing in MODEL_PRICING.items():
-            models.append({
-                "name": model_name,
-                "context_window": pricing["context_window"],
-                "input_price_per_1m": pricing["input"],
-                "output_price_per_1m": pricing["output"],
-                "capabilities": ["chat", "vision"],
-                "description": pricing["description"],
-            })
-        return models
+        return [dict(model_info) for model_info in _model_catalog().values()]
 
     @staticmethod
     def get_model_names() -> list[str]:
@@ -168,24 +201,14 @@ class AnthropicProvider(BaseProvider):
             self._is_connected = False
             return False
 
-    async def list_models(self) -> list[dict[str, Any]]:
+    async def list_models(self) -> tuple[Mapping[str, Any], ...]:
         """
-        Get list of available models with their metadata.
+        Get the available models with their metadata.
 
         Returns:
-            List of dictionaries containing model information
+            Tuple of read-only mappings containing model information
         """
-        models = []
-        for model_name, pricing in MODEL_PRICING.items():
-            models.append({
-                "name": model_name,
-                "context_window": pricing["context_window"],
-                "input_price_per_1m": pricing["input"],
-                "output_price_per_1m": pricing["output"],
-                "capabilities": ["chat", "vision"],
-                "description": pricing["description"],
-            })
-        return models
+        return _model_views()
 
     async def get_model_info(self, model_name: str) -> dict[str, Any]:
         """
@@ -207,15 +230,7 @@ class AnthropicProvider(BaseProvider):
                 context={"available_models": self.supported_models},
             )
 
-        pricing = MODEL_PRICING[model_name]
-        return {
-            "name": model_name,
-            "context_window": pricing["context_window"],
-            "input_price_per_1m": pricing["input"],
-            "output_price_per_1m": pricing["output"],
-            "capabilities": ["chat", "vision"],
-            "description": pricing["description"],
-        }
+        return dict(_model_catalog()[model_name])
 
     async def chat(
         self,
@@ -287,15 +302,21 @@ class AnthropicProvider(BaseProvider):
                     block.text for block in response.content if hasattr(block, "text")
                 )
 
-            # Get token usage
-            input_tokens = response.usage.input_tokens if response.usage else 0
-            output_tokens = response.usage.output_tokens if response.usage else 0
+            # Get token usage. Anthropic reports cache reads separately from
+            # input_tokens; fold them in so input_tokens includes cached ones
+            usage = response.usage
+            cached_input_tokens = 0
+            if usage:
+                cached_input_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
+            input_tokens = usage.input_tokens + cached_input_tokens if usage else 0
+            output_tokens = usage.output_tokens if usage else 0
 
             return {
                 "content": content,
                 "model": response.model,
                 "input_tokens": input_tokens,
                 "output_tokens": output_tokens,
+                "cached_input_tokens": cached_input_tokens,
                 "finish_reason": response.stop_reason,
                 "raw_response": response.model_dump(),
             }
@@ -410,14 +431,22 @@ class AnthropicProvider(BaseProvider):
             "input_tokens": input_tokens,
         }
 
-    def calculate_cost(self, input_tokens: int, output_tokens: int, model: str) -> float:
+    def calculate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+        cached_input_tokens: int = 0,
+    ) -> float:
         """
         Calculate the actual cost of a completed request.
 
         Args:
-            input_tokens: Number of input tokens used
+            input_tokens: Number of input tokens used (including cached ones)
             output_tokens: Number of output tokens generated
             model: Model identifier
+            cached_input_tokens: Portion of input_tokens read from the prompt
+                cache, billed at CACHE_READ_PRICE_RATIO of the input price
 
         Returns:
             Total cost in USD
@@ -427,12 +456,20 @@ class AnthropicProvider(BaseProvider):
             return 0.0
 
         pricing = MODEL_PRICING[model]
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
+        billed_input_tokens = (
+            input_tokens - cached_input_tokens + cached_input_tokens * CACHE_READ_PRICE_RATIO
+        )
+        input_cost = (billed_input_tokens / 1_000_000) * pricing["input"]
         output_cost = (output_tokens / 1_000_000) * pricing["output"]
 
         return input_cost + output_cost
 
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit - cleanup resources."""
+    async def _prewarm_request(self) -> None:
+        """Open a connection with the free models listing endpoint."""
+        await self.client.models.list()
+
+    async def close(self) -> None:
+        """Close the SDK client and its connection pool."""
         await self.client.close()
+        await super().close()
 
@@ -1,13 +1,18 @@
 """OpenAI provider implementation."""
 
 import asyncio
+import functools
+from collections.abc import AsyncIterator, Mapping
+from types import MappingProxyType
 from typing import Any, Optional
 
+import httpx
 import tiktoken
-from openai import AsyncOpenAI, APIError, RateLimitError as OpenAIRateLimitError, APIConnectionError
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, APIError, RateLimitError as OpenAIRateLimitError, APIConnectionError
 
 from ..core.provider import BaseProvider
 from ..core.exceptions import (
+    ConfigurationError,
     ProviderError,
     RateLimitError,
     ConnectionError,
@@ -16,6 +21,9 @@ from ..core.exceptions import (
 )
 
 
+# Connection pool limits for the opt-in HTTP/2 client
+HTTP2_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
 # Model pricing data (per 1M tokens in USD)
 MODEL_PRICING = {
     # GPT-5 models
@@ -109,6 +117,69 @@ MODEL_PRICING = {
     },
 }
 
+# Cached prompt prefixes are billed at half the regular input price
+CACHED_INPUT_PRICE_RATIO = 0.5
+
+
+# Model names in pricing order, shared by every supported_models lookup
+_SUPPORTED_MODELS = tuple(MODEL_PRICING)
+
+
+@functools.cache
+def _model_catalog() -> dict[str, dict[str, Any]]:
+    """
+    Build the model metadata once per process from MODEL_PRICING.
+
+    Returns:
+        Mapping of model name to its metadata dictionary. Callers must copy
+        entries or hand out read-only views, since the cache is shared.
+    """
+    catalog = {}
+    for model_name, pricing in MODEL_PRICING.items():
+        model_info = {
+            "name": model_name,
+            "description": pricing["description"],
+            "capabilities": ("chat", "completion"),
+        }
+        if "context_window" in pricing:
+            model_info["context_window"] = pricing["context_window"]
+        if "input" in pricing:
+            model_info["input_price_per_1m"] = pricing["input"]
+        if "output" in pricing:
+            model_info["output_price_per_1m"] = pricing["output"]
+        if "notes" in pricing:
+            model_info["notes"] = pricing["notes"]
+        catalog[model_name] = model_info
+    return catalog
+
+
+@functools.cache
+def _get_encoding(model: str) -> tiktoken.Encoding:
+    """
+    Get the tiktoken encoder for a model, shared by every provider instance.
+
+    Args:
+        model: Model identifier
+
+    Returns:
+        The model's encoding, or cl100k_base for models tiktoken doesn't know
+    """
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.cache
+def _model_views() -> tuple[Mapping[str, Any], ...]:
+    """
+    Wrap each catalog entry in a read-only view once per process.
+
+    Returns:
+        Tuple of MappingProxyType views over the shared catalog entries
+    """
+    return tuple(MappingProxyType(model_info) for model_info in _model_catalog().values())
+
 
 class OpenAIProvider(BaseProvider):
     """
@@ -135,6 +206,7 @@ class OpenAIProvider(BaseProvider):
         api_key: str,
         timeout: int = 180,
         max_retries: int = 3,
+        http2: bool = False,
         **kwargs: Any,
     ) -> None:
         """
@@ -144,16 +216,28 @@ class OpenAIProvider(BaseProvider):
             api_key: OpenAI API key
             timeout: Request timeout in seconds (default 180s for long generations)
             max_retries: Maximum number of retry attempts
+            http2: Multiplex concurrent requests over HTTP/2 connections
+                (requires the `h2` package, see the "performance" extra)
             **kwargs: Additional OpenAI client configuration
+
+        Raises:
+            ConfigurationError: If http2 is requested but `h2` is not installed
         """
         super().__init__(api_key, timeout, max_retries, **kwargs)
+        if http2 and "http_client" not in kwargs:
+            try:
+                kwargs["http_client"] = DefaultAsyncHttpxClient(http2=True, limits=HTTP2_LIMITS)
+            except ImportError as e:
+                raise ConfigurationError(
+                    "HTTP/2 support requires the 'h2' package",
+                    context={"install": "pip install ai-content-generator[performance]"},
+                ) from e
         self.client = AsyncOpenAI(
             api_key=api_key,
             timeout=timeout,
             max_retries=max_retries,
             **kwargs,
         )
-        self._tokenizer_cache: dict[str, Any] = {}
 
     @property
     def provider_name(self) -> str:
@@ -161,9 +245,9 @@ class OpenAIProvider(BaseProvider):
         return "openai"
 
     @property
-    def supported_models(self) -> list[str]:
-        """Get list of supported model names."""
-        return list(MODEL_PRICING.keys())
+    def supported_models(self) -> tuple[str, ...]:
+        """Get the supported model names."""
+        return _SUPPORTED_MODELS
 
     @staticmethod
     def get_available_models() -> list[dict[str, Any]]:
@@ -181,23 +265,7 @@ class OpenAIProvider(BaseProvider):
                 print(f"{model['name']}: {model['description']}")
             ```
         """
-        models = []
-        for model_name, pricing in MODEL_PRICING.items():
-            model_info = {
-                "name": model_name,
-                "description": pricing["description"],
-                "capabilities": ["chat", "completion"],
-            }
-            if "context_window" in pricing:
-                model_info["context_window"] = pricing["context_window"]
-            if "input" in pricing:
-                model_info["input_price_per_1m"] = pricing["input"]
-            if "output" in pricing:
-                model_info["output_price_per_1m"] = pricing["output"]
-            if "notes" in pricing:
-                model_info["notes"] = pricing["notes"]
-            models.append(model_info)
-        return models
+        return [dict(model_info) for model_info in _model_catalog().values()]
 
     @staticmethod
     def get_model_names() -> list[str]:
@@ -231,30 +299,14 @@ class OpenAIProvider(BaseProvider):
             self._is_connected = False
             return False
 
-    async def list_models(self) -> list[dict[str, Any]]:
+    async def list_models(self) -> tuple[Mapping[str, Any], ...]:
         """
-        Get list of available models with their metadata.
+        Get the available models with their metadata.
 
         Returns:
-            List of dictionaries containing model information
+            Tuple of read-only mappings containing model information
         """
-        models = []
-        for model_name, pricing in MODEL_PRICING.items():
-            model_info = {
-                "name": model_name,
-                "description": pricing["description"],
-                "capabilities": ["chat", "completion"],
-            }
-            if "context_window" in pricing:
-                model_info["context_window"] = pricing["context_window"]
-            if "input" in pricing:
-                model_info["input_price_per_1m"] = pricing["input"]
-            if "output" in pricing:
-                model_info["output_price_per_1m"] = pricing["output"]
-            if "notes" in pricing:
-                model_info["notes"] = pricing["notes"]
-            models.append(model_info)
-        return models
+        return _model_views()
 
     async def get_model_info(self, model_name: str) -> dict[str, Any]:
         """
@@ -276,21 +328,7 @@ class OpenAIProvider(BaseProvider):
                 context={"available_models": self.supported_models},
             )
 
-        pricing = MODEL_PRICING[model_name]
-        model_info = {
-            "name": model_name,
-            "description": pricing["description"],
-            "capabilities": ["chat", "completion"],
-        }
-        if "context_window" in pricing:
-            model_info["context_window"] = pricing["context_window"]
-        if "input" in pricing:
-            model_info["input_price_per_1m"] = pricing["input"]
-        if "output" in pricing:
-            model_info["output_price_per_1m"] = pricing["output"]
-        if "notes" in pricing:
-            model_info["notes"] = pricing["notes"]
-        return model_info
+        return dict(_model_catalog()[model_name])
 
     async def chat(
         self,
@@ -344,39 +382,119 @@ class OpenAIProvider(BaseProvider):
             input_tokens = usage.prompt_tokens if usage else 0
             output_tokens = usage.completion_tokens if usage else 0
 
+            # Automatic prompt caching reports the reused prefix separately
+            details = getattr(usage, "prompt_tokens_details", None)
+            cached_input_tokens = (details.cached_tokens or 0) if details else 0
+
             return {
                 "content": content,
                 "model": response.model,
                 "input_tokens": input_tokens,
                 "output_tokens": output_tokens,
+                "cached_input_tokens": cached_input_tokens,
                 "finish_reason": finish_reason,
                 "raw_response": response.model_dump(),
             }
 
-        except OpenAIRateLimitError as e:
-            raise RateLimitError(
-                message="OpenAI rate limit exceeded",
+        except Exception as e:
+            raise self._translate_error(e) from e
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream a chat completion from OpenAI as it is generated.
+
+        Token usage arrives on a final chunk (requested via
+        `stream_options={"include_usage": True}`) that carries no content.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            model: Model identifier to use
+            temperature: Sampling temperature (0.0 to 2.0)
+            max_tokens: Maximum tokens to generate
+            **kwargs: Additional OpenAI parameters
+
+        Yields:
+            Chunk dictionaries with `content` and `finish_reason`; the usage
+            chunk also has `input_tokens`, `output_tokens` and
+            `cached_input_tokens`
+
+        Raises:
+            ProviderError: If the request fails
+            RateLimitError: If rate limit is exceeded
+            ModelNotFoundError: If model is not found
+        """
+        if model not in MODEL_PRICING:
+            raise ModelNotFoundError(
+                model=model,
                 provider=self.provider_name,
-                context={"error": str(e)},
+                context={"available_models": self.supported_models},
             )
-        except APIConnectionError as e:
-            raise ConnectionError(
-                message="Failed to connect to OpenAI",
+
+        try:
+            stream = await self.client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                stream_options={"include_usage": True},
+                **kwargs,
+            )
+
+            async for chunk in stream:
+                if chunk.choices:
+                    choice = chunk.choices[0]
+                    yield {
+                        "content": choice.delta.content or "",
+                        "finish_reason": choice.finish_reason,
+                    }
+
+                usage = chunk.usage
+                if usage:
+                    details = getattr(usage, "prompt_tokens_details", None)
+                    yield {
+                        "content": "",
+                        "finish_reason": None,
+                        "input_tokens": usage.prompt_tokens,
+                        "output_tokens": usage.completion_tokens,
+                        "cached_input_tokens": (details.cached_tokens or 0) if details else 0,
+                    }
+
+        except Exception as e:
+            raise self._translate_error(e) from e
+
+    def _translate_error(self, error: Exception) -> Exception:
+        """Map an OpenAI SDK exception to the matching library exception."""
+        if isinstance(error, OpenAIRateLimitError):
+            return RateLimitError(
+                message="OpenAI rate limit exceeded",
                 provider=self.provider_name,
-                context={"error": str(e)},
+                context={"error": str(error)},
             )
-        except APIError as e:
-            raise ProviderError(
-                message=f"OpenAI API error: {str(e)}",
+        if isinstance(error, APIConnectionError):
+            return ConnectionError(
+                message="Failed to connect to OpenAI",
                 provider=self.provider_name,
-                context={"error": str(e), "status_code": getattr(e, "status_code", None)},
+                context={"error": str(error)},
             )
-        except Exception as e:
-            raise ProviderError(
-                message=f"Unexpected error: {str(e)}",
+        if isinstance(error, APIError):
+            return ProviderError(
+                message=f"OpenAI API error: {str(error)}",
                 provider=self.provider_name,
-                context={"error": str(e), "error_type": type(e).__name__},
+                context={"error": str(error), "status_code": getattr(error, "status_code", None)},
             )
+        return ProviderError(
+            message=f"Unexpected error: {str(error)}",
+            provider=self.provider_name,
+            context={"error": str(error), "error_type": type(error).__name__},
+        )
 
     async def count_tokens(self, text: str, model: str) -> int:
         """
@@ -390,20 +508,8 @@ class OpenAIProvider(BaseProvider):
             Number of tokens
         """
         try:
-            # Get or create tokenizer for this model
-            if model not in self._tokenizer_cache:
-                try:
-                    encoding = tiktoken.encoding_for_model(model)
-                except KeyError:
-                    # Fallback to cl100k_base encoding for unknown models
-                    encoding = tiktoken.get_encoding("cl100k_base")
-                self._tokenizer_cache[model] = encoding
-            else:
-                encoding = self._tokenizer_cache[model]
-
-            # Count tokens
-            tokens = encoding.encode(text)
-            return len(tokens)
+            # Count tokens with the shared, cached encoder for this model
+            return len(_get_encoding(model).encode(text))
 
         except Exception:
             # Fallback: rough estimation (1 token ≈ 4 characters)
@@ -448,14 +554,22 @@ class OpenAIProvider(BaseProvider):
             "input_tokens": input_tokens,
         }
 
-    def calculate_cost(self, input_tokens: int, output_tokens: int, model: str) -> float:
+    def calculate_cost(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        model: str,
+        cached_input_tokens: int = 0,
+    ) -> float:
         """
         Calculate the actual cost of a completed request.
 
         Args:
-            input_tokens: Number of input tokens used
+            input_tokens: Number of input tokens used (including cached ones)
             output_tokens: Number of output tokens generated
             model: Model identifier
+            cached_input_tokens: Portion of input_tokens served from the
+                prompt cache, billed at CACHED_INPUT_PRICE_RATIO of the input price
 
         Returns:
             Total cost in USD
@@ -465,12 +579,20 @@ class OpenAIProvider(BaseProvider):
             return 0.0
 
         pricing = MODEL_PRICING[model]
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
+        billed_input_tokens = (
+            input_tokens - cached_input_tokens + cached_input_tokens * CACHED_INPUT_PRICE_RATIO
+        )
+        input_cost = (billed_input_tokens / 1_000_000) * pricing["input"]
         output_cost = (output_tokens / 1_000_000) * pricing["output"]
 
         return input_cost + output_cost
 
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit - cleanup resources."""
+    async def _prewarm_request(self) -> None:
+        """Open a connection with the free models listing endpoint."""
+        await self.client.models.list()
+
+    async def close(self) -> None:
+        """Close the SDK client and its connection pool."""
         await self.client.close()
+        await super().close()
 
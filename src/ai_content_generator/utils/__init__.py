@@ -4,6 +4,7 @@ from .helpers import (
     load_file,
     save_file,
     generate_request_id,
+    generate_request_ids,
     format_datetime,
     safe_json_loads,
     truncate_text,
@@ -20,6 +21,7 @@ __all__ = [
     "load_file",
     "save_file",
     "generate_request_id",
+    "generate_request_ids",
     "format_datetime",
     "safe_json_loads",
     "truncate_text",
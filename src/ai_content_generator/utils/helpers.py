@@ -1,6 +1,9 @@
 """Helper utility functions."""
 
+import itertools
 import json
+import os
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -53,10 +56,31 @@ async def save_file(filepath: str, content: str) -> None:
         await f.write(content)
 
 
-def generate_request_id() -> str:
+# Fast request IDs: a per-process prefix (start time and PID) plus a counter
+_FAST_ID_PREFIX = f"req-{int(time.time()):x}-{os.getpid():x}-"
+_FAST_ID_COUNTER = itertools.count(1)
+
+
+def _reset_fast_ids() -> None:
+    """Start a new prefix and counter, so forked children never repeat the parent's IDs."""
+    global _FAST_ID_PREFIX, _FAST_ID_COUNTER
+    _FAST_ID_PREFIX = f"req-{int(time.time()):x}-{os.getpid():x}-"
+    _FAST_ID_COUNTER = itertools.count(1)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_fast_ids)
+
+
+def generate_request_id(fast: bool = False) -> str:
     """
     Generate a unique request ID.
     
+    Args:
+        fast: If True, return a cheap process-unique ID built from a counter
+            instead of a random UUID. Use it for internal bookkeeping on hot
+            paths; keep the default for IDs that leave the process.
+    
     Returns:
         Unique request ID string
     
@@ -64,11 +88,44 @@ def generate_request_id() -> str:
         ```python
         request_id = generate_request_id()
         # "req-550e8400-e29b-41d4-a716-446655440000"
+        
+        request_id = generate_request_id(fast=True)
+        # "req-6718a2f0-3e8-1"
         ```
     """
+    if fast:
+        return _FAST_ID_PREFIX + format(next(_FAST_ID_COUNTER), "x")
     return f"req-{uuid.uuid4()}"
 
 
+def generate_request_ids(count: int) -> list[str]:
+    """
+    Generate several unique request IDs at once.
+    
+    Reads the random bytes for all IDs with a single os.urandom() call
+    instead of one per ID, for callers that create IDs for a batch up front.
+    
+    Args:
+        count: Number of IDs to generate
+    
+    Returns:
+        List of unique request ID strings, in the same format as
+        generate_request_id()
+    
+    Example:
+        ```python
+        request_ids = generate_request_ids(len(prompts))
+        for request_id, prompt in zip(request_ids, prompts, strict=True):
+            ...
+        ```
+    """
+    entropy = os.urandom(16 * count)
+    return [
+        f"req-{uuid.UUID(bytes=entropy[offset:offset + 16], version=4)}"
+        for offset in range(0, 16 * count, 16)
+    ]
+
+
 def format_datetime(dt: Optional[datetime] = None, format: str = "%Y-%m-%d %H:%M:%S") -> str:
     """
     Format datetime to string.
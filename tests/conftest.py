@@ -1,9 +1,11 @@
 """Pytest configuration and shared fixtures."""
 
 import asyncio
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator, Callable, Generator
 
 import pytest
+from ai_content_generator.addons import AddonContext
+from ai_content_generator.utils import generate_request_id
 
 
 @pytest.fixture(scope="session")
@@ -14,6 +16,19 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture
+def make_context() -> Callable[..., AddonContext]:
+    """Factory for fresh addon contexts with a unique request ID."""
+    def _make_context(prompt: str = "test") -> AddonContext:
+        return AddonContext(
+            request_id=generate_request_id(),
+            prompt=prompt,
+            model="gpt-5-nano",
+            provider="openai"
+        )
+    return _make_context
+
+
 @pytest.fixture
 def sample_prompt() -> str:
     """Sample prompt for testing."""
@@ -0,0 +1,241 @@
+"""Tests for addon manager."""
+
+from enum import Enum
+
+import pytest
+from ai_content_generator.addons import (
+    AddonManager,
+    AddonContext,
+    BaseAddon,
+    DryRunAddon,
+    WhitespaceMinimizerAddon,
+)
+from ai_content_generator.core.session import LLMSession
+from ai_content_generator.providers import OpenAIProvider
+
+
+class FailingAddon(BaseAddon):
+    """Addon whose pre_request hook always raises."""
+
+    def get_name(self) -> str:
+        return "Failing Addon"
+
+    def get_description(self) -> str:
+        return "Raises on every request"
+
+    async def pre_request(self, prompt, context):
+        raise ValueError("broken")
+
+
+class RecordingAddon(BaseAddon):
+    """Independent addon that records the responses it sees."""
+
+    post_request_independent = True
+
+    def __init__(self, name: str, fail: bool = False):
+        super().__init__()
+        self.name = name
+        self.fail = fail
+        self.seen = []
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_description(self) -> str:
+        return "Records responses"
+
+    async def post_request(self, response, context):
+        self.seen.append(response)
+        if self.fail:
+            raise RuntimeError("recording failed")
+        return {"content": "ignored"}
+
+
+class UppercaseAddon(BaseAddon):
+    """Dependent addon that transforms the response."""
+
+    def get_name(self) -> str:
+        return "Uppercase"
+
+    def get_description(self) -> str:
+        return "Uppercases content"
+
+    async def post_request(self, response, context):
+        return {"content": response["content"].upper()}
+
+
+class TestAddonContext:
+    """Tests for AddonContext."""
+
+    def test_model_and_provider_are_interned(self, make_context):
+        """Test that contexts share one string object per model and provider."""
+        model = "".join(["gpt-5", "-nano"])
+        context = AddonContext(request_id="a", prompt="", model=model, provider="openai")
+        assert context.model is make_context().model
+        assert context.provider is make_context().provider
+
+    @pytest.mark.asyncio
+    async def test_str_enum_model_name(self):
+        """Test that str subclasses are accepted as model names."""
+
+        class Model(str, Enum):
+            NANO = "gpt-5-nano"
+
+        context = AddonContext(request_id="a", prompt="", model=Model.NANO, provider="openai")
+        assert context.model is Model.NANO
+
+        provider = OpenAIProvider(api_key="test-key")
+        provider._is_connected = True
+        session = LLMSession(provider, Model.NANO, dry_run=True)
+        response = await session.chat("Hello")
+        assert response["content"]
+
+
+class TestAddonManager:
+    """Tests for AddonManager."""
+
+    @pytest.mark.asyncio
+    async def test_empty_manager(self, make_context):
+        """Test that hooks pass through when no addon is registered."""
+        manager = AddonManager()
+        response = {"content": "Hi"}
+
+        assert len(manager) == 0
+        assert manager.has_addons() is False
+        assert await manager.execute_pre_request("Hello", make_context()) is None
+        assert await manager.execute_post_request(response, make_context()) is response
+        assert await manager.execute_on_error(RuntimeError("boom"), make_context()) is False
+
+    @pytest.mark.asyncio
+    async def test_disabled_addon_is_skipped(self, make_context):
+        """Test that disabling a registered addon takes effect immediately."""
+        manager = AddonManager()
+        addon = DryRunAddon(mock_response="mock")
+        manager.add_addon(addon)
+        assert manager.has_addons() is True
+        assert await manager.execute_pre_request("Hello", make_context()) == "mock"
+
+        addon.disable()
+        assert await manager.execute_pre_request("Hello", make_context()) is None
+
+    def test_get_addon_by_name(self):
+        """Test name lookup returns the first addon registered under a name."""
+        manager = AddonManager()
+        first, second = DryRunAddon(), DryRunAddon()
+        manager.add_addon(first)
+        manager.add_addon(second)
+        assert manager.get_addon("Dry Run Addon") is first
+        assert manager.get_addon("Missing") is None
+
+        assert manager.remove_addon("Dry Run Addon") is True
+        assert manager.get_addons() == (second,)
+        assert manager.get_addon("Dry Run Addon") is second
+
+    def test_remove_and_clear(self):
+        """Test that removing and clearing addons updates the pipeline."""
+        manager = AddonManager()
+        manager.add_addon(DryRunAddon())
+        assert manager.remove_addon("Dry Run Addon") is True
+        assert len(manager) == 0
+
+        manager.add_addon(DryRunAddon())
+        manager.clear_addons()
+        assert manager.has_addons() is False
+
+    @pytest.mark.asyncio
+    async def test_addon_error_is_recorded(self, caplog, make_context):
+        """Test that a failing hook is reported and the pipeline continues."""
+        manager = AddonManager()
+        manager.add_addon(FailingAddon())
+        manager.add_addon(DryRunAddon(mock_response="mock"))
+        context = make_context()
+        context.capture_errors = True
+
+        assert await manager.execute_pre_request("Hello", context) == "mock"
+        assert context.format_errors() == [{
+            "addon": "Failing Addon",
+            "hook": "pre_request",
+            "error": "broken",
+            "error_type": "ValueError",
+        }]
+        assert "Failing Addon" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_addon_errors_not_captured_by_default(self, caplog, make_context):
+        """Test that errors are only reported unless capture is requested."""
+        manager = AddonManager()
+        manager.add_addon(FailingAddon())
+        context = make_context()
+
+        assert await manager.execute_pre_request("Hello", context) is None
+        assert "addon_errors" not in context.custom
+        assert context.format_errors() == []
+        assert "Failing Addon" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_strict_mode_propagates_errors(self, caplog, make_context):
+        """Test that strict mode lets addon exceptions abort the request."""
+        manager = AddonManager(strict=True)
+        manager.add_addon(FailingAddon())
+        manager.add_addon(DryRunAddon(mock_response="mock"))
+
+        with pytest.raises(ValueError, match="broken"):
+            await manager.execute_pre_request("Hello", make_context())
+        assert caplog.records == []
+
+        manager.get_addon("Failing Addon").disable()
+        assert await manager.execute_pre_request("Hello", make_context()) == "mock"
+
+    @pytest.mark.asyncio
+    async def test_independent_post_request_addons(self, caplog, make_context):
+        """Test that independent addons see the current response and cannot replace it."""
+        manager = AddonManager()
+        first, second = RecordingAddon("first"), RecordingAddon("second", fail=True)
+        last = RecordingAddon("last")
+        for addon in (first, second, UppercaseAddon(), last):
+            manager.add_addon(addon)
+        context = make_context()
+        context.capture_errors = True
+
+        response = {"content": "hi"}
+        result = await manager.execute_post_request(response, context)
+
+        assert result == {"content": "HI"}
+        assert first.seen == [response] and second.seen == [response]
+        assert last.seen == [{"content": "HI"}]
+        assert [error["addon"] for error in context.format_errors()] == ["second"]
+        assert "recording failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_sync_addon_is_called_directly(self, monkeypatch, make_context):
+        """Test that addons marked is_sync run pre_request_sync without awaiting."""
+        async def fail(prompt, context):
+            raise AssertionError("pre_request should not be awaited")
+
+        minimizer = WhitespaceMinimizerAddon()
+        monkeypatch.setattr(minimizer, "pre_request", fail)
+        manager = AddonManager()
+        manager.add_addon(minimizer)
+
+        assert await manager.execute_pre_request("Too    many", make_context()) == "Too many"
+
+    @pytest.mark.asyncio
+    async def test_session_captures_addon_errors(self):
+        """Test that a session can turn on error capture for its requests."""
+        contexts = []
+
+        class ContextAddon(RecordingAddon):
+            async def post_request(self, response, context):
+                contexts.append(context)
+                return response
+
+        provider = OpenAIProvider(api_key="test-key")
+        provider._is_connected = True
+        for capture in (False, True):
+            session = LLMSession(provider, "gpt-5-nano", dry_run=True, capture_addon_errors=capture)
+            session.add_addon(FailingAddon())
+            session.add_addon(ContextAddon("context"))
+            await session.chat("Hello")
+
+        assert contexts[0].format_errors() == []
+        assert [error["addon"] for error in contexts[1].format_errors()] == ["Failing Addon"]
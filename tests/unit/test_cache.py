@@ -0,0 +1,219 @@
+"""Tests for cache addon."""
+
+import json
+import time
+
+import pytest
+from ai_content_generator.addons import CacheAddon
+from ai_content_generator.core.session import LLMSession
+from ai_content_generator.providers import OpenAIProvider
+
+
+class TestCacheAddon:
+    """Tests for CacheAddon."""
+
+    @pytest.fixture
+    def addon(self):
+        """Create a default addon instance."""
+        return CacheAddon(max_size=2)
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self, addon, make_context):
+        """Test that a stored response is returned for the same prompt."""
+        context = make_context()
+        assert await addon.pre_request("Hello", context) is None
+        assert context.custom["cache_hit"] is False
+        await addon.post_request({"content": "Hi there"}, context)
+
+        context = make_context()
+        assert await addon.pre_request("Hello", context) == "Hi there"
+        assert context.custom["cache_hit"] is True
+
+        stats = addon.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["cache_size"] == 1
+
+    def test_cache_key(self, addon):
+        """Test that keys are deterministic and depend on every input."""
+        key = addon._generate_cache_key("Hello", "gpt-5-nano", provider="openai", temperature=0.5)
+        assert key == addon._generate_cache_key("Hello", "gpt-5-nano", temperature=0.5, provider="openai")
+        assert key != addon._generate_cache_key("Hello", "gpt-5-nano", provider="openai", temperature=0.7)
+        assert key != addon._generate_cache_key("Hello", "gpt-5-mini", provider="openai", temperature=0.5)
+        assert key != addon._generate_cache_key("Hello!", "gpt-5-nano", provider="openai", temperature=0.5)
+        # Unhashable parameter values are keyed without the memoized prefix
+        assert addon._generate_cache_key("Hello", "gpt-5-nano", stop=["\n"]) == (
+            addon._generate_cache_key("Hello", "gpt-5-nano", stop=["\n"])
+        )
+    
+    @pytest.mark.asyncio
+    async def test_request_params_are_keyed(self, addon, make_context):
+        """Test that a response is only reused for the same request parameters."""
+        context = make_context()
+        context.request_params = {"system_message": None, "temperature": 0, "max_tokens": None}
+        await addon.pre_request("Hello", context)
+        await addon.post_request({"content": "Hi there"}, context)
+        
+        context = make_context()
+        context.request_params = {"system_message": "Answer in French", "temperature": 0, "max_tokens": None}
+        assert await addon.pre_request("Hello", context) is None
+        
+        context = make_context()
+        context.request_params = {"system_message": None, "temperature": 0, "max_tokens": None}
+        assert await addon.pre_request("Hello", context) == "Hi there"
+    
+    @pytest.mark.asyncio
+    async def test_sampled_requests_bypass_cache(self, addon, make_context):
+        """Test that requests with a non-zero temperature are neither looked up nor stored."""
+        for _ in range(2):
+            context = make_context()
+            context.request_params = {"system_message": None, "temperature": 0.7, "max_tokens": None}
+            assert await addon.pre_request("Hello", context) is None
+            await addon.post_request({"content": "Hi there"}, context)
+        
+        assert addon.get_cache_size() == 0
+        assert addon.get_stats()["total_requests"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_cache_hits_cost_nothing(self, addon, make_context):
+        """Test that a session does not charge cache hits to its budget."""
+        context = make_context("Hello")
+        context.request_params = {"system_message": None, "temperature": 0, "max_tokens": None}
+        await addon.pre_request("Hello", context)
+        await addon.post_request({"content": "Hi there"}, context)
+        
+        provider = OpenAIProvider(api_key="test-key")
+        provider._is_connected = True
+        session = LLMSession(provider, "gpt-5-nano")
+        session.add_addon(addon)
+        response = await session.chat("Hello", temperature=0)
+        
+        assert response["content"] == "Hi there"
+        assert response["cost_usd"] == 0.0
+        assert session.cost_usd == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_generated_responses_are_not_stored(self, addon, make_context):
+        """Test that dry-run and addon-produced responses never enter the cache."""
+        context = make_context()
+        await addon.pre_request("Hello", context)
+        await addon.post_request({"content": "[DRY RUN] Response would be generated here", "dry_run": True}, context)
+        
+        context = make_context()
+        await addon.pre_request("Hello", context)
+        context.custom["addon_response"] = True
+        await addon.post_request({"content": "mock"}, context)
+        
+        assert addon.get_cache_size() == 0
+    
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, addon, make_context):
+        """Test that the least recently used entry is evicted first."""
+        for prompt in ("a", "b"):
+            context = make_context()
+            await addon.pre_request(prompt, context)
+            await addon.post_request({"content": prompt.upper()}, context)
+
+        # Touch "a" so that "b" becomes least recently used
+        assert await addon.pre_request("a", make_context()) == "A"
+
+        context = make_context()
+        await addon.pre_request("c", context)
+        await addon.post_request({"content": "C"}, context)
+
+        assert addon.get_cache_size() == 2
+        assert await addon.pre_request("a", make_context()) == "A"
+        assert await addon.pre_request("b", make_context()) is None
+
+    @pytest.mark.asyncio
+    async def test_replace_policy(self, make_context):
+        """Test that a replace policy can keep the cached content."""
+        addon = CacheAddon(replace_policy=lambda old, new: len(new) > len(old))
+        first, second = make_context(), make_context()
+        # Both requests miss before either response arrives
+        await addon.pre_request("Hello", first)
+        await addon.pre_request("Hello", second)
+        
+        await addon.post_request({"content": "A longer answer"}, first)
+        await addon.post_request({"content": "Short"}, second)
+        assert await addon.pre_request("Hello", make_context()) == "A longer answer"
+    
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self, monkeypatch, make_context):
+        """Test that entries expire once their TTL has elapsed."""
+        now = [1000.0]
+        monkeypatch.setattr("ai_content_generator.addons.cache._now", lambda: now[0])
+        addon = CacheAddon(ttl_seconds=10)
+
+        context = make_context()
+        await addon.pre_request("Hello", context)
+        await addon.post_request({"content": "Hi there"}, context)
+
+        now[0] += 5
+        assert await addon.pre_request("Hello", make_context()) == "Hi there"
+
+        now[0] += 5
+        assert await addon.pre_request("Hello", make_context()) is None
+        assert addon.get_cache_size() == 0
+        assert addon.get_stats()["expired_evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expiry_at_capacity(self, monkeypatch, make_context):
+        """Test that an expired entry frees its slot without evicting live ones."""
+        now = [1000.0]
+        monkeypatch.setattr("ai_content_generator.addons.cache._now", lambda: now[0])
+        addon = CacheAddon(max_size=2, ttl_seconds=10)
+        
+        for prompt in ("a", "b"):
+            context = make_context()
+            await addon.pre_request(prompt, context)
+            await addon.post_request({"content": prompt.upper()}, context)
+            now[0] += 6
+        
+        # "a" has expired, "b" is still live
+        context = make_context()
+        assert await addon.pre_request("c", context) is None
+        await addon.post_request({"content": "C"}, context)
+        
+        assert list(addon._cache) == [addon._generate_cache_key(p, "gpt-5-nano", provider="openai") for p in ("b", "c")]
+        assert addon.get_stats()["expired_evictions"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_persistence(self, tmp_path, make_context):
+        """Test that entries survive a new addon instance."""
+        path = tmp_path / "cache" / "responses.json"
+        addon = CacheAddon(persist_path=path)
+        context = make_context()
+        await addon.pre_request("Hello", context)
+        await addon.post_request({"content": "Hi there"}, context)
+        # Entries are only written on flush
+        assert not path.exists()
+        addon.flush()
+        assert path.exists()
+
+        reloaded = CacheAddon(persist_path=path)
+        assert reloaded.get_cache_size() == 1
+        assert await reloaded.pre_request("Hello", make_context()) == "Hi there"
+
+    def test_persisted_entries_expire(self, tmp_path):
+        """Test that persisted wall-clock timestamps are checked against the TTL."""
+        path = tmp_path / "responses.json"
+        now = time.time()
+        path.write_text(json.dumps({
+            "old": {"response": {"content": "old"}, "timestamp": now - 20},
+            "new": {"response": {"content": "new"}, "timestamp": now - 5},
+        }), encoding="utf-8")
+        
+        addon = CacheAddon(ttl_seconds=10, persist_path=path)
+        assert addon.get_cache_size() == 1
+        content, expires_at = addon._cache["new"]
+        assert content == "new"
+        assert 4 < expires_at - time.monotonic() <= 5
+    
+    def test_corrupt_persist_file(self, tmp_path):
+        """Test that an unreadable cache file starts an empty cache."""
+        path = tmp_path / "responses.json"
+        path.write_text("not json", encoding="utf-8")
+
+        addon = CacheAddon(persist_path=path)
+        assert addon.get_cache_size() == 0
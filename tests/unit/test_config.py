@@ -0,0 +1,111 @@
+"""Tests for configuration loading."""
+
+import pytest
+from ai_content_generator.core.config import CacheConfig, Config
+from ai_content_generator.core.exceptions import ConfigurationError
+
+
+class TestConfigFromFile:
+    """Tests for Config.from_file."""
+
+    def test_load_with_env_vars(self, tmp_path, monkeypatch):
+        """Test that ${VAR} references are replaced before parsing."""
+        monkeypatch.setenv("TEST_OPENAI_KEY", "sk-test")
+        monkeypatch.delenv("TEST_MISSING_VAR", raising=False)
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            "providers:\n"
+            "  openai:\n"
+            "    api_key: ${TEST_OPENAI_KEY}\n"
+            "    default_model: ${TEST_MISSING_VAR}\n"
+            "session:\n"
+            "  default_budget_usd: 5.0\n"
+            "  alerts: [0.9, 0.5]\n",
+            encoding="utf-8",
+        )
+
+        config = Config.from_file(path)
+        assert config.providers["openai"].api_key == "sk-test"
+        # Unset variables are left as written
+        assert config.providers["openai"].default_model == "${TEST_MISSING_VAR}"
+        assert config.session.default_budget_usd == 5.0
+        assert config.session.alerts == [0.5, 0.9]
+
+    def test_repeated_env_var(self, monkeypatch):
+        """Test that every reference to the same variable is replaced."""
+        monkeypatch.setenv("TEST_SHARED_KEY", "sk-shared")
+        content = "a: ${TEST_SHARED_KEY}\nb: ${TEST_SHARED_KEY}\nc: plain\n"
+        assert Config._interpolate_env_vars(content) == "a: sk-shared\nb: sk-shared\nc: plain\n"
+        assert Config._interpolate_env_vars("no references") == "no references"
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file gives the default configuration."""
+        path = tmp_path / "config.yaml"
+        path.write_text("", encoding="utf-8")
+        assert Config.from_file(path) == Config()
+
+    def test_invalid_yaml(self, tmp_path):
+        """Test that unparsable YAML raises ConfigurationError."""
+        path = tmp_path / "config.yaml"
+        path.write_text("session: [unclosed", encoding="utf-8")
+        with pytest.raises(ConfigurationError, match="Failed to parse YAML"):
+            Config.from_file(path)
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file raises ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="not found"):
+            Config.from_file(tmp_path / "missing.yaml")
+
+
+class TestConfigFromEnv:
+    """Tests for Config.from_env."""
+
+    def test_providers_share_settings(self, monkeypatch):
+        """Test that every provider with a key gets the shared timeout and retries."""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-openai")
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-anthropic")
+        monkeypatch.setenv("AI_CONTENT_GEN_TIMEOUT", "30")
+        monkeypatch.setenv("AI_CONTENT_GEN_MAX_RETRIES", "5")
+
+        config = Config.from_env()
+        assert config.providers["openai"].api_key == "sk-openai"
+        assert config.providers["anthropic"].api_key == "sk-anthropic"
+        for provider in config.providers.values():
+            assert provider.timeout == 30
+            assert provider.max_retries == 5
+
+    def test_no_providers(self, monkeypatch):
+        """Test that providers without keys are left out."""
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.setenv("AI_CONTENT_GEN_CACHE_TTL", "60")
+
+        config = Config.from_env()
+        assert config.providers == {}
+        assert config.cache.ttl == 60
+
+    def test_defaults_and_parsing(self, monkeypatch):
+        """Test that unset variables keep model defaults and set ones are parsed."""
+        for name in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "AI_CONTENT_GEN_CACHE_TTL"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("AI_CONTENT_GEN_ENABLE_CACHE", "yes")
+        monkeypatch.setenv("AI_CONTENT_GEN_DEFAULT_BUDGET", "2.5")
+        monkeypatch.setenv("AI_CONTENT_GEN_LOG_LEVEL", "debug")
+
+        config = Config.from_env()
+        # Only "true" enables a flag
+        assert config.cache.enabled is False
+        assert config.cache.ttl == CacheConfig().ttl
+        assert config.session.default_budget_usd == 2.5
+        assert config.logging.level == "DEBUG"
+
+    def test_env_file(self, tmp_path, monkeypatch):
+        """Test that variables from an .env file are loaded first."""
+        # Registers the variable with monkeypatch so the value loaded from the
+        # file is removed again after the test
+        monkeypatch.setenv("AI_CONTENT_GEN_CACHE_MAX_SIZE", "unused")
+        monkeypatch.delenv("AI_CONTENT_GEN_CACHE_MAX_SIZE")
+        env_file = tmp_path / ".env"
+        env_file.write_text("AI_CONTENT_GEN_CACHE_MAX_SIZE=7\n", encoding="utf-8")
+
+        assert Config.from_env(env_file).cache.max_size == 7
@@ -0,0 +1,63 @@
+"""Tests for dry run addon."""
+
+import pytest
+from ai_content_generator.addons import DryRunAddon
+
+
+class TestDryRunAddon:
+    """Tests for DryRunAddon."""
+
+    @pytest.mark.asyncio
+    async def test_mock_response(self, make_context):
+        """Test that requests are intercepted with the mock response."""
+        addon = DryRunAddon(mock_response="mock")
+        context = make_context()
+
+        assert await addon.pre_request("Hello world!", context) == "mock"
+        assert context.custom["dry_run"] is True
+        assert context.custom["estimated_input_tokens"] == 3
+
+    @pytest.mark.asyncio
+    async def test_generated_mock_response(self, make_context):
+        """Test the mock response generated when none is configured."""
+        addon = DryRunAddon()
+        result = await addon.pre_request("Hello", make_context())
+        assert result == "[DRY RUN] Mock response for prompt: 'Hello...' using model 'gpt-5-nano' on provider 'openai'"
+
+    @pytest.mark.asyncio
+    async def test_request_log_is_bounded(self, make_context):
+        """Test that the request log keeps only the newest entries."""
+        addon = DryRunAddon(log_capacity=2)
+        for prompt in ("a", "b", "c"):
+            await addon.pre_request(prompt, make_context(prompt))
+
+        assert [entry["prompt"] for entry in addon.get_request_log()] == ["b", "c"]
+        assert addon.get_stats()["total_intercepted"] == 3
+
+        addon.clear_log()
+        assert len(addon.get_request_log()) == 0
+        assert addon.get_stats()["total_intercepted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_request_log_entry(self, make_context):
+        """Test that a logged request records the prompt and context fields."""
+        addon = DryRunAddon()
+        context = make_context()
+        context.metadata["user"] = "u1"
+        await addon.pre_request("Hello", context)
+
+        assert addon.get_request_log() is addon.get_request_log()
+        assert list(addon.get_request_log()) == [{
+            "request_id": context.request_id,
+            "prompt": "Hello",
+            "model": "gpt-5-nano",
+            "provider": "openai",
+            "metadata": {"user": "u1"},
+        }]
+
+    def test_token_estimate(self):
+        """Test the character-based estimate with a floor of one token per word."""
+        addon = DryRunAddon()
+        assert addon._estimate_token_count("") == 0
+        assert addon._estimate_token_count("Hello world!") == 3
+        assert addon._estimate_token_count("a b c d e") == 5
@@ -0,0 +1,88 @@
+"""Tests for custom exceptions."""
+
+import pickle
+
+from ai_content_generator.core.exceptions import (
+    AddonError,
+    BudgetExceededError,
+    ModelNotFoundError,
+    RateLimitError,
+    TokenLimitError,
+    ValidationError,
+)
+
+
+class TestExceptionContext:
+    """Tests for exception context construction."""
+
+    def test_context_is_merged(self):
+        """Test that error fields are added to the caller's context."""
+        error = TokenLimitError(tokens=150, limit=100, provider="openai", context={"model": "gpt-5-nano"})
+        assert error.context == {
+            "model": "gpt-5-nano",
+            "tokens": 150,
+            "limit": 100,
+            "exceeded_by": 50,
+            "provider": "openai",
+        }
+
+        error = RateLimitError(provider="openai", retry_after=2.0)
+        assert error.context == {"retry_after": 2.0, "provider": "openai"}
+        assert str(error) == "Rate limit exceeded (retry after 2.0s) (Context: retry_after=2.0, provider=openai)"
+
+    def test_error_fields_take_precedence(self):
+        """Test that error fields override keys of the same name in the context."""
+        error = ModelNotFoundError("gpt-6", context={"model": "other", "region": "eu"})
+        assert error.context == {"model": "gpt-6", "region": "eu"}
+
+    def test_caller_context_is_not_mutated(self):
+        """Test that a context dict can be reused across raises."""
+        context = {"request_id": "abc"}
+        BudgetExceededError(budget=1.0, cost=1.5, context=context)
+        AddonError("Cache", context=context)
+        assert context == {"request_id": "abc"}
+        assert AddonError("Cache").context == {"addon": "Cache"}
+
+
+class TestExceptionStr:
+    """Tests for exception string rendering."""
+
+    def test_str_is_cached(self):
+        """Test that the rendered string is built once and reused."""
+        error = AddonError("Cache", message="Lookup failed")
+        assert error._str_cache is None
+        assert str(error) == "Lookup failed (Context: addon=Cache)"
+        assert error._str_cache is str(error)
+
+    def test_default_messages(self):
+        """Test that default messages are built only when no message is given."""
+        assert BudgetExceededError(budget=1.0, cost=1.5).message == "Budget exceeded: $1.5000 exceeds limit of $1.0000"
+        assert TokenLimitError(tokens=150, limit=100, message="Too long").message == "Too long"
+        assert ModelNotFoundError("gpt-6").message == "Model 'gpt-6' not found"
+        assert ModelNotFoundError("gpt-6", provider="openai").message == "Model 'gpt-6' not found for provider 'openai'"
+
+    def test_validation_errors_are_listed(self):
+        """Test that validation errors are appended to the message."""
+        error = ValidationError(errors=["too short", "missing keyword"])
+        assert str(error) == "Validation failed\nValidation errors:\n  - too short\n  - missing keyword"
+        assert str(ValidationError()) == "Validation failed"
+
+
+class TestExceptionSlots:
+    """Tests for slotted exception instances."""
+
+    def test_no_instance_dict_is_allocated(self):
+        """Test that error fields are stored in slots."""
+        error = RateLimitError(provider="openai", retry_after=1.0)
+        assert error.provider == "openai"
+        assert error.retry_after == 1.0
+        assert error.__dict__ == {}
+
+    def test_pickle_round_trip(self):
+        """Test that slot attributes survive pickling."""
+        error = pickle.loads(pickle.dumps(RateLimitError("Slow down", provider="openai", retry_after=1.0)))
+        assert isinstance(error, RateLimitError)
+        assert error.provider == "openai"
+        assert error.retry_after == 1.0
+        assert error.context == {"retry_after": 1.0, "provider": "openai"}
+        assert str(error) == "Slow down (retry after 1.0s) (Context: retry_after=1.0, provider=openai)"
@@ -0,0 +1,121 @@
+"""Tests for the session factory."""
+
+import pytest
+from ai_content_generator.core.config import Config
+from ai_content_generator.core.exceptions import ConfigurationError
+from ai_content_generator.core.factory import SessionFactory
+from ai_content_generator.providers import OpenAIProvider
+
+
+def make_factory() -> SessionFactory:
+    """Create a factory with an OpenAI provider configured."""
+    return SessionFactory(Config.from_dict({"providers": {"openai": {"api_key": "test-key"}}}))
+
+
+class TestSessionFactory:
+    """Tests for SessionFactory."""
+
+    def test_provider_is_cached(self):
+        """Test that the same provider is returned for the same overrides."""
+        factory = make_factory()
+        provider = factory.get_provider("openai")
+        assert isinstance(provider, OpenAIProvider)
+        assert factory.get_provider("openai") is provider
+
+        tuned = factory.get_provider("openai", timeout=5, max_retries=1)
+        assert tuned is not provider
+        assert tuned.timeout == 5
+        assert factory.get_provider("openai", max_retries=1, timeout=5) is tuned
+
+    @pytest.mark.asyncio
+    async def test_closed_provider_is_replaced(self):
+        """Test that a provider closed outside the factory is not handed out again."""
+        factory = make_factory()
+        provider = factory.get_provider("openai")
+        await provider.close()
+
+        replacement = factory.get_provider("openai")
+        assert replacement is not provider
+        assert replacement.is_closed is False
+        assert factory.get_provider("openai") is replacement
+
+    def test_unhashable_override(self):
+        """Test that unhashable override values can be used as cache keys."""
+        factory = make_factory()
+        provider = factory.get_provider("openai", extra={"region": "eu"})
+        assert factory.get_provider("openai", extra={"region": "eu"}) is provider
+        assert factory.get_provider("openai", extra={"region": "us"}) is not provider
+
+    def test_unconfigured_provider(self):
+        """Test that a provider missing from the config is rejected."""
+        with pytest.raises(ConfigurationError, match="not configured"):
+            make_factory().get_provider("anthropic")
+
+    def test_unknown_provider_class(self):
+        """Test that a configured provider without an implementation is rejected."""
+        factory = SessionFactory(Config.from_dict({"providers": {"mystery": {"api_key": "key"}}}))
+        with pytest.raises(ConfigurationError, match="Unknown provider"):
+            factory.get_provider("mystery")
+        assert factory._get_provider_class("OpenAI") is OpenAIProvider
+
+    def test_default_alert_callback(self, capsys):
+        """Test that the default alert prints the spend and percentage."""
+        SessionFactory._default_alert_callback(0.5, 2.0)
+        assert capsys.readouterr().out == "⚠️  Budget Alert: $0.5000 / $2.00 (25.0%) used\n"
+
+    def test_provider_names_are_interned(self):
+        """Test that configured, literal and str subclass names share one provider."""
+
+        class Name(str):
+            pass
+
+        name = "".join(["open", "ai"])
+        config = Config.from_dict({"providers": {name: {"api_key": "key"}}, "session": {"default_provider": name}})
+        providers = config.providers
+        factory = SessionFactory(config)
+        provider = factory.create_session(model="gpt-5-nano").provider
+        assert factory.get_provider("openai") is provider
+        assert factory.get_provider(Name("openai")) is provider
+
+        # The caller's config is left as it was
+        assert config.providers is providers
+        assert next(iter(config.providers)) is name
+        assert config.session.default_provider is name
+
+    def test_session_gets_configured_alerts(self):
+        """Test that every session gets the alerts from the config."""
+        factory = SessionFactory(Config.from_dict({
+            "providers": {"openai": {"api_key": "test-key", "default_model": "gpt-5-nano"}},
+            "session": {"alerts": [0.9, 0.5]},
+        }))
+        for _ in range(2):
+            alerts = factory.create_session().alert_manager.get_all_alerts()
+            assert [alert.threshold for alert in alerts] == [0.5, 0.9]
+            assert all(alert.callback is SessionFactory._default_alert_callback for alert in alerts)
+
+        # Later config changes apply to new sessions
+        factory.config.session.alerts = [0.8]
+        alerts = factory.create_session().alert_manager.get_all_alerts()
+        assert [alert.threshold for alert in alerts] == [0.8]
+
+    def test_cache_is_opt_in(self):
+        """Test that sessions only share a response cache when the config enables it."""
+        providers = {"openai": {"api_key": "test-key", "default_model": "gpt-5-nano"}}
+        session = SessionFactory(Config.from_dict({"providers": providers})).create_session()
+        assert session.addon_manager.has_addons() is False
+
+        factory = SessionFactory(Config.from_dict({"providers": providers, "cache": {"enabled": True}}))
+        assert factory.create_session().addon_manager.get_addons() == (factory.get_cache_addon(),)
+
+    @pytest.mark.asyncio
+    async def test_dry_run_responses_are_not_cached(self):
+        """Test that a dry-run session does not fill the shared cache."""
+        factory = SessionFactory(Config.from_dict({
+            "providers": {"openai": {"api_key": "test-key", "default_model": "gpt-5-nano"}},
+            "cache": {"enabled": True},
+        }))
+        factory.get_provider("openai")._is_connected = True
+
+        response = await factory.create_session(dry_run=True).chat("Hello")
+        assert response["dry_run"] is True
+        assert factory.get_cache_addon().get_cache_size() == 0
@@ -0,0 +1,49 @@
+"""Tests for helper utilities."""
+
+import os
+import uuid
+
+import pytest
+from ai_content_generator.utils import generate_request_id, generate_request_ids
+
+
+class TestGenerateRequestId:
+    """Tests for generate_request_id."""
+    
+    def test_default_uses_uuid(self):
+        """Test default IDs are prefixed UUIDs."""
+        request_id = generate_request_id()
+        assert request_id.startswith("req-")
+        assert len(request_id) == len("req-") + 36
+    
+    def test_fast_ids_are_unique(self):
+        """Test fast IDs never repeat within a process."""
+        ids = {generate_request_id(fast=True) for _ in range(1000)}
+        assert len(ids) == 1000
+        assert all(request_id.startswith("req-") for request_id in ids)
+    
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_fast_ids_differ_after_fork(self):
+        """Test a forked child does not repeat the parent's next fast ID."""
+        generate_request_id(fast=True)
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, generate_request_id(fast=True).encode())
+            os._exit(0)
+        
+        os.close(write_fd)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_fd) as f:
+            child_id = f.read()
+        assert child_id
+        assert child_id != generate_request_id(fast=True)
+    
+    def test_batch_ids_are_uuid4(self):
+        """Test batch IDs are unique version 4 UUIDs in the default format."""
+        ids = generate_request_ids(100)
+        assert len(set(ids)) == 100
+        for request_id in ids:
+            assert request_id.startswith("req-")
+            assert uuid.UUID(request_id[len("req-"):]).version == 4
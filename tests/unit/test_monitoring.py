@@ -115,6 +115,17 @@ class TestCostTracker:
         with pytest.raises(BudgetExceededError):
             tracker.record_cost(1.5, "req-1", "gpt-5-nano", 100, 50)
     
+    def test_total_cost_is_exact(self):
+        """Test that many small costs add up without float drift."""
+        tracker = CostTracker(budget_usd=0.3)
+        
+        for _ in range(3):
+            tracker.record_cost(cost=0.1, model="gpt-5-nano")
+        
+        assert tracker.get_total_cost() == 0.3
+        assert tracker.get_remaining_budget() == 0.0
+        assert tracker.get_cost_breakdown()["by_model"] == {"gpt-5-nano": 0.3}
+    
     def test_unlimited_budget(self):
         """Test unlimited budget (None)."""
         tracker = CostTracker(budget_usd=None)
@@ -139,6 +150,18 @@ class TestAlertManager:
         assert alert.threshold == 0.5
         assert alert.triggered is False
     
+    def test_add_alerts(self):
+        """Test adding several alerts at once keeps them sorted."""
+        manager = AlertManager()
+        manager.add_alert(0.8, print)
+        
+        created = manager.add_alerts([(0.9, print), (0.5, print)])
+        
+        assert [alert.threshold for alert in created] == [0.9, 0.5]
+        assert [alert.threshold for alert in manager.get_all_alerts()] == [0.5, 0.8, 0.9]
+        with pytest.raises(ValueError):
+            manager.add_alerts([(1.5, print)])
+    
     def test_check_alerts(self):
         """Test checking and triggering alerts."""
         manager = AlertManager()
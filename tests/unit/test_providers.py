@@ -1,14 +1,19 @@
 """Unit tests for provider implementations."""
 
+from types import SimpleNamespace
+
 import pytest
 from ai_content_generator.providers import (
     OpenAIProvider,
     AnthropicProvider,
     get_provider,
+    get_shared_provider,
+    close_shared_providers,
     list_providers,
     register_provider,
 )
 from ai_content_generator.core.provider import BaseProvider
+from ai_content_generator.core.session import LLMSession
 from ai_content_generator.core.exceptions import ProviderError, ModelNotFoundError
 
 
@@ -82,13 +87,32 @@ class TestProviderRegistry:
             async def estimate_cost(self, prompt: str, model: str, max_tokens=None):
                 return {}
 
-            def calculate_cost(self, input_tokens: int, output_tokens: int, model: str) -> float:
+            def calculate_cost(
+                self, input_tokens: int, output_tokens: int, model: str, cached_input_tokens: int = 0
+            ) -> float:
                 return 0.0
 
         register_provider("custom", CustomProvider)
         provider = get_provider("custom", api_key="test-key")
         assert isinstance(provider, CustomProvider)
 
+    @pytest.mark.asyncio
+    async def test_get_shared_provider(self):
+        """Test that shared providers are reused until closed."""
+        provider = get_shared_provider("openai", api_key="test-key")
+        assert isinstance(provider, OpenAIProvider)
+        assert get_shared_provider("OpenAI", api_key="test-key") is provider
+        assert get_shared_provider("openai", api_key="other-key") is not provider
+
+        await close_shared_providers()
+        provider = get_shared_provider("openai", api_key="test-key")
+        assert provider.is_closed is False
+
+        # Closing the instance directly also retires it
+        await provider.close()
+        assert get_shared_provider("openai", api_key="test-key") is not provider
+        await close_shared_providers()
+
 
 class TestOpenAIProvider:
     """Tests for OpenAI provider."""
@@ -137,6 +161,20 @@ class TestOpenAIProvider:
             assert "output_price_per_1m" in model
             assert "capabilities" in model
 
+    @pytest.mark.asyncio
+    async def test_model_catalog_is_shared(self):
+        """Test that the model catalog is built once and cannot be modified."""
+        provider = OpenAIProvider(api_key="test-key")
+        models = await provider.list_models()
+        assert await provider.list_models() is models
+        assert provider.supported_models is OpenAIProvider(api_key="other-key").supported_models
+
+        with pytest.raises(TypeError):
+            models[0]["name"] = "renamed"
+        info = dict(models[0])
+        info["name"] = "renamed"
+        assert models[0]["name"] == provider.supported_models[0]
+
     @pytest.mark.asyncio
     async def test_get_model_info(self):
         """Test getting model information."""
@@ -193,6 +231,121 @@ class TestOpenAIProvider:
         expected = (1000 / 1_000_000 * 0.15) + (500 / 1_000_000 * 0.6)
         assert abs(cost - expected) < 0.000001
 
+    def test_calculate_cost_with_cached_tokens(self):
+        """Test that cached input tokens are billed at half price."""
+        provider = OpenAIProvider(api_key="test-key")
+        cost = provider.calculate_cost(
+            input_tokens=1000,
+            output_tokens=500,
+            model="gpt-5-nano",
+            cached_input_tokens=400
+        )
+        # gpt-5-nano: $0.05/1M input, $0.4/1M output; 400 cached at 50%
+        expected = ((600 + 400 * 0.5) / 1_000_000 * 0.05) + (500 / 1_000_000 * 0.4)
+        assert abs(cost - expected) < 1e-12
+
+    @pytest.mark.asyncio
+    async def test_chat_stream(self, monkeypatch):
+        """Test streaming deltas followed by a usage chunk."""
+        provider = OpenAIProvider(api_key="test-key")
+
+        def delta(content, finish_reason=None):
+            choice = SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)
+            return SimpleNamespace(choices=[choice], usage=None)
+
+        usage = SimpleNamespace(prompt_tokens=12, completion_tokens=3, prompt_tokens_details=None)
+        chunks = [delta("Hel"), delta("lo"), delta(None, "stop"), SimpleNamespace(choices=[], usage=usage)]
+
+        async def fake_stream():
+            for chunk in chunks:
+                yield chunk
+
+        async def fake_create(**kwargs):
+            assert kwargs["stream"] is True
+            assert kwargs["stream_options"] == {"include_usage": True}
+            return fake_stream()
+
+        monkeypatch.setattr(provider.client.chat.completions, "create", fake_create)
+
+        received = [
+            chunk async for chunk in provider.chat_stream(
+                [{"role": "user", "content": "Hi"}], model="gpt-4o-mini"
+            )
+        ]
+        assert "".join(chunk["content"] for chunk in received) == "Hello"
+        assert received[2]["finish_reason"] == "stop"
+        assert received[-1]["input_tokens"] == 12
+        assert received[-1]["output_tokens"] == 3
+        assert received[-1]["cached_input_tokens"] == 0
+        await provider.close()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_closes_client(self, monkeypatch):
+        """Test that leaving the provider closes its client and forgets the connection check."""
+        provider = OpenAIProvider(api_key="test-key")
+
+        async def fake_validate():
+            provider._is_connected = True
+            return True
+
+        monkeypatch.setattr(provider, "validate_connection", fake_validate)
+        async with provider:
+            assert provider.is_connected is True
+
+        assert provider.client.is_closed() is True
+        assert provider.is_closed is True
+        assert provider.is_connected is False
+
+    @pytest.mark.asyncio
+    async def test_context_manager_validates_once(self, monkeypatch):
+        """Test that entering skips a repeated check and refuses a closed provider."""
+        provider = OpenAIProvider(api_key="test-key")
+        calls = []
+
+        async def fake_validate():
+            calls.append(True)
+            provider._is_connected = True
+            return True
+
+        monkeypatch.setattr(provider, "validate_connection", fake_validate)
+        await provider.validate_connection()
+
+        provider.invalidate_connection()
+        assert provider.is_connected is False
+        await provider.validate_connection()
+        assert len(calls) == 2
+
+        async with provider:
+            pass
+        assert len(calls) == 2
+
+        # Leaving closed the client, so a second entry must not reuse it
+        with pytest.raises(ProviderError, match="closed"):
+            async with provider:
+                pass
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_session_passes_cached_tokens(self):
+        """Test that sessions bill cached input tokens reported by the provider."""
+        class CachingProvider(OpenAIProvider):
+            async def chat(self, messages, model, **kwargs):
+                return {
+                    "content": "Hi",
+                    "input_tokens": 1000,
+                    "output_tokens": 0,
+                    "cached_input_tokens": 400,
+                }
+
+            async def estimate_cost(self, prompt, model, max_tokens=None):
+                return {"total_cost": 0.0}
+
+        provider = CachingProvider(api_key="test-key")
+        provider._is_connected = True
+        response = await LLMSession(provider, "gpt-5-nano").chat("Hello")
+        assert response["cost_usd"] == provider.calculate_cost(1000, 0, "gpt-5-nano", cached_input_tokens=400)
+        assert response["cost_usd"] < provider.calculate_cost(1000, 0, "gpt-5-nano")
+
     def test_calculate_cost_unknown_model(self):
         """Test cost calculation for unknown model returns 0."""
         provider = OpenAIProvider(api_key="test-key")
@@ -271,6 +424,19 @@ class TestAnthropicProvider:
         expected = (1000 / 1_000_000 * 1.0) + (500 / 1_000_000 * 5.0)
         assert abs(cost - expected) < 0.000001
 
+    def test_calculate_cost_with_cached_tokens(self):
+        """Test that prompt cache reads are billed at a tenth of the input price."""
+        provider = AnthropicProvider(api_key="test-key")
+        cost = provider.calculate_cost(
+            input_tokens=1000,
+            output_tokens=500,
+            model="claude-opus-4-20250514",
+            cached_input_tokens=400
+        )
+        # claude-opus-4: $15/1M input, $75/1M output; 400 cached at 10%
+        expected = ((600 + 400 * 0.1) / 1_000_000 * 15.0) + (500 / 1_000_000 * 75.0)
+        assert abs(cost - expected) < 1e-12
+
     def test_calculate_cost_unknown_model(self):
         """Test cost calculation for unknown model returns 0."""
         provider = AnthropicProvider(api_key="test-key")
@@ -0,0 +1,70 @@
+"""Tests for response validator addon."""
+
+import pytest
+from pydantic import BaseModel
+from ai_content_generator.addons import ResponseValidatorAddon, ValidationMode
+from ai_content_generator.core.exceptions import ValidationError
+
+
+class ResponseSchema(BaseModel):
+    """Schema requiring content and token counts."""
+
+    content: str
+    input_tokens: int
+    output_tokens: int
+
+
+class TestResponseValidatorAddon:
+    """Tests for ResponseValidatorAddon."""
+
+    def test_requires_schema_or_func(self):
+        """Test that a validator needs something to validate with."""
+        with pytest.raises(ValueError):
+            ResponseValidatorAddon()
+
+    @pytest.mark.asyncio
+    async def test_schema_validation(self, make_context):
+        """Test that responses are validated against the schema."""
+        addon = ResponseValidatorAddon(schema=ResponseSchema)
+        response = {"content": "Hi", "input_tokens": 3, "output_tokens": 1, "model": "gpt-5-nano"}
+        assert await addon.post_request(response, make_context()) is response
+
+        context = make_context()
+        with pytest.raises(ValidationError):
+            await addon.post_request({"content": "Hi"}, context)
+        assert context.custom["validation_failed"] is True
+        assert addon.get_stats()["validation_failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warn_mode(self, caplog, make_context):
+        """Test that warn mode reports failures and keeps the response."""
+        addon = ResponseValidatorAddon(
+            validator_func=lambda response: bool(response.get("content")),
+            mode=ValidationMode.WARN
+        )
+        response = {"content": ""}
+        assert await addon.post_request(response, make_context()) is response
+        assert "validation failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_schema_and_func(self, make_context):
+        """Test that the function only runs once the schema check passed."""
+        calls = []
+
+        def validator(response):
+            calls.append(response)
+            return response["output_tokens"] > 0
+
+        addon = ResponseValidatorAddon(
+            schema=ResponseSchema,
+            validator_func=validator,
+            mode=ValidationMode.WARN
+        )
+        context = make_context()
+        await addon.post_request({"content": "Hi"}, context)
+        assert calls == []
+        assert "output_tokens" in context.custom["validation_error"]
+
+        context = make_context()
+        await addon.post_request({"content": "Hi", "input_tokens": 1, "output_tokens": 0}, context)
+        assert context.custom["validation_error"] == "Custom validation function returned False"
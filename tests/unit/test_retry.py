@@ -0,0 +1,39 @@
+"""Tests for retry addon."""
+
+import pytest
+from ai_content_generator.addons import RetryAddon
+from ai_content_generator.core.exceptions import RateLimitError
+
+
+class TestRetryAddon:
+    """Tests for RetryAddon."""
+
+    def test_backoff_delays(self, monkeypatch):
+        """Test exponential backoff capped at max_delay, without jitter."""
+        monkeypatch.setattr("ai_content_generator.addons.retry.random.random", lambda: 0.5)
+        addon = RetryAddon(max_retries=3, initial_delay=1.0, max_delay=5.0)
+
+        assert [addon._calculate_delay(attempt) for attempt in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    @pytest.mark.asyncio
+    async def test_retries_until_max(self, monkeypatch, make_context):
+        """Test that retryable errors are retried up to max_retries."""
+        async def no_sleep(delay):
+            pass
+
+        monkeypatch.setattr("ai_content_generator.addons.retry.asyncio.sleep", no_sleep)
+        addon = RetryAddon(max_retries=2)
+        context = make_context()
+        error = RateLimitError(provider="openai")
+
+        assert await addon.on_error(error, context) is True
+        assert await addon.on_error(error, context) is True
+        assert await addon.on_error(error, context) is False
+        assert context.custom["retry_count"] == 2
+        assert await addon.on_error(ValueError("bad input"), make_context()) is False
+
+    def test_retry_on_all_errors(self):
+        """Test that listing Exception retries every error type."""
+        addon = RetryAddon(retry_on_errors=[Exception])
+        assert addon._should_retry(ValueError("bad input")) is True
+        assert RetryAddon()._should_retry(ValueError("bad input")) is False
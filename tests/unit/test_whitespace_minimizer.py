@@ -40,7 +40,9 @@ class TestWhitespaceMinimizerAddon:
         
         assert result is not None
         assert "  " not in result  # No double spaces
-        assert context.custom["whitespace_minimizer_chars_saved"] > 0
+        stats = context.custom["whitespace_stats"]
+        assert stats.chars_saved > 0
+        assert stats.tokens_saved == stats.chars_saved // 4
     
     @pytest.mark.asyncio
     async def test_minimize_tabs(self, addon, context):
@@ -52,6 +54,13 @@ class TestWhitespaceMinimizerAddon:
         assert "\t" not in result
         assert " " in result
     
+    @pytest.mark.asyncio
+    async def test_minimize_mixed_tabs_and_spaces(self, addon, context):
+        """Test that a run of tabs and spaces collapses to one space."""
+        result = await addon.pre_request("Mixed \t \t run", context)
+        
+        assert result == "Mixed run"
+    
     @pytest.mark.asyncio
     async def test_minimize_newlines(self, addon, context):
         """Test reducing multiple newlines."""
@@ -97,6 +106,14 @@ class TestWhitespaceMinimizerAddon:
         # Should return None if nothing changed
         assert result is None or result == prompt
     
+    @pytest.mark.asyncio
+    async def test_unchanged_prompt_returns_none(self, addon, context):
+        """Test that a prompt needing only the full pass is passed through untouched."""
+        prompt = "Inline `code  with  spaces` only"
+        assert addon.minimize(prompt)[0] is prompt
+        assert await addon.pre_request(prompt, context) is None
+        assert "whitespace_minimizer_minimized" not in context.custom
+    
     @pytest.mark.asyncio
     async def test_aggressive_mode(self):
         """Test aggressive mode."""
@@ -129,6 +146,20 @@ class TestWhitespaceMinimizerAddon:
         # Should not minimize spaces
         assert result is None or "    " in result
     
+    def test_spans_between_code_blocks(self, addon):
+        """Test that spans between several code blocks are minimized independently."""
+        prompt = "a  `x  y`  b\n\n\n`z`  c  "
+        expected = "a `x  y` b\n\n`z` c"
+        assert addon.minimize(prompt)[0] == expected
+        # Text containing the internal placeholder takes the per-span path
+        assert addon.minimize("\x00" + prompt)[0] == "\x00" + expected
+    
+    def test_detect_code_blocks(self, addon):
+        """Test detection of each code block kind and of text without any."""
+        prompt = "a `b` '''c''' \"\"\"d\"\"\" ```py\ne\n```"
+        assert addon._detect_code_blocks(prompt) == [(2, 5), (6, 13), (14, 21), (22, 33)]
+        assert addon._detect_code_blocks("It's \"plain\"    text") == []
+    
     @pytest.mark.asyncio
     async def test_code_block_preservation_inline(self, addon, context):
         """Test preserving inline code blocks."""
@@ -180,7 +211,7 @@ class TestWhitespaceMinimizerAddon:
         stats = addon.get_stats()
         assert stats["total_requests"] == 2
         assert stats["total_chars_removed"] > 0
-        assert stats["total_tokens_saved"] >= 0
+        assert stats["total_tokens_saved"] == stats["total_chars_removed"] // 4
         assert stats["average_chars_per_request"] > 0
     
     @pytest.mark.asyncio
@@ -207,6 +238,75 @@ class TestWhitespaceMinimizerAddon:
         assert "whitespace_minimizer_original" in context.custom
         assert context.custom["whitespace_minimizer_original"] == original
     
+    def test_minimize_sync(self, addon):
+        """Test synchronous minimization without an addon context."""
+        minimized, chars_saved, tokens_saved = addon.minimize("Too    many    spaces")
+        
+        assert minimized == "Too many spaces"
+        assert chars_saved == 6
+        assert tokens_saved == 1
+        assert addon.get_stats()["total_requests"] == 1
+        
+        assert addon.minimize("Clean prompt") == ("Clean prompt", 0, 0)
+        assert addon.get_stats()["total_requests"] == 1
+    
+    def test_minimize_many(self, addon):
+        """Test that a batch gives the same results as minimizing each prompt."""
+        prompts = ["Too    many", "Clean", "```py\na  =  1\n```  end", "Too    many"]
+        expected = [WhitespaceMinimizerAddon().minimize(prompt) for prompt in prompts]
+        
+        assert addon.minimize_many(prompts) == expected
+        assert addon.minimize_many(iter(prompts[:1])) == expected[:1]
+        assert addon.get_stats()["total_requests"] == 4
+    
+    def test_clean_prompt_skips_minimization(self, addon, monkeypatch):
+        """Test that prompts without targetable whitespace skip the regex passes."""
+        def fail(*args, **kwargs):
+            raise AssertionError("minimization should be skipped")
+        
+        monkeypatch.setattr(addon, "_detect_code_blocks", fail)
+        assert addon.minimize("Clean prompt\nwith two lines\n") == ("Clean prompt\nwith two lines\n", 0, 0)
+        
+        assert addon._needs_minimization("Trailing space \nhere") is True
+        assert addon._needs_minimization("Carriage\r\nreturn") is True
+        assert addon._needs_minimization("Form\x0cfeed\n") is False
+        assert addon._needs_minimization("Form feed\x0c\n") is True
+        assert addon._needs_minimization("Non-ASCII café\nprompt") is False
+        assert addon._needs_minimization("Ideographic space\u3000\nhere") is True
+        assert addon._needs_minimization("Two\n\nnewlines") is False
+        assert addon._needs_minimization("Three\n\n\nnewlines") is True
+    
+    def test_result_cache(self, monkeypatch):
+        """Test that repeated prompts reuse the cached result in LRU order."""
+        addon = WhitespaceMinimizerAddon(result_cache_size=2)
+        first, unchanged = "First    prompt", "Only `a  b` here"
+        addon.minimize(first)
+        addon.minimize(unchanged)
+    
+        def fail(*args, **kwargs):
+            raise AssertionError("cached prompts should not be minimized again")
+    
+        monkeypatch.setattr(addon, "_minimize_whitespace", fail)
+        assert addon.minimize(first) == ("First prompt", 3, 0)
+        # A cached result equal to the prompt still hands back the prompt itself
+        assert addon.minimize(unchanged)[0] is unchanged
+    
+        monkeypatch.undo()
+        addon.minimize("Third    prompt")
+        assert list(addon._result_cache) == [unchanged, "Third    prompt"]
+    
+        stats = addon.get_stats()
+        assert stats["cache_hits"] == 2
+        assert stats["cache_misses"] == 3
+        assert stats["total_requests"] == 3
+    
+    def test_pre_request_never_suspends(self, addon, context):
+        """Test that the pre_request coroutine finishes on its first step."""
+        coroutine = addon.pre_request("Too    many", context)
+        with pytest.raises(StopIteration) as exc_info:
+            coroutine.send(None)
+        assert exc_info.value.value == "Too many"
+    
     def test_enable_disable(self, addon):
         """Test enable/disable functionality."""
         assert addon.is_enabled() is True